@@ -1,15 +1,25 @@
 """Global Configurations for py.test runner"""
 
+import sys
+
 import pytest
 
+if '--import-profile' in sys.argv:
+    # record the imports of the plugins and the fixtures below
+    from robottelo.utils.import_profile import profiler
+
+    profiler.install()
+
 pytest_plugins = [
     # Plugins
     'pytest_plugins.auto_vault',
     'pytest_plugins.disable_rp_params',
     'pytest_plugins.external_logging',
     'pytest_plugins.fixture_markers',
+    'pytest_plugins.import_profile',
     'pytest_plugins.infra_dependent_markers',
     'pytest_plugins.issue_handlers',
+    'pytest_plugins.lock_telemetry',
     'pytest_plugins.logging_hooks',
     'pytest_plugins.manual_skipped',
     'pytest_plugins.marker_deselection',
@@ -26,6 +36,8 @@ pytest_plugins = [
     'pytest_plugins.select_random_tests',
     'pytest_plugins.capsule_n-minus',
     'pytest_plugins.upstream_pr',
+    'pytest_plugins.persistent_shells',
+    'pytest_plugins.host_facts',
     # Fixtures
     'pytest_fixtures.core.broker',
     'pytest_fixtures.core.sat_cap_factory',
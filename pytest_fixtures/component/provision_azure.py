@@ -1,7 +1,6 @@
 # Azure CR Fixtures
 from fauxfactory import gen_string
 import pytest
-from wrapanapi import AzureSystem
 
 from robottelo.config import settings
 from robottelo.constants import (
@@ -13,6 +12,9 @@ from robottelo.constants import (
     DEFAULT_ARCHITECTURE,
     DEFAULT_OS_SEARCH_QUERY,
 )
+from robottelo.utils.lazy import lazy_import
+
+msazure = lazy_import('wrapanapi.systems.msazure')
 
 
 @pytest.fixture(scope='session')
@@ -72,7 +74,7 @@ def azurerm_settings():
 @pytest.fixture(scope='session')
 def azurermclient(azurerm_settings):
     """Connect to AzureRM using wrapanapi AzureSystem"""
-    azurermclient = AzureSystem(
+    azurermclient = msazure.AzureSystem(
         username=azurerm_settings['app_ident'],
         password=azurerm_settings['secret'],
         tenant_id=azurerm_settings['tenant'],
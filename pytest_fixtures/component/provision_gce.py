@@ -4,7 +4,6 @@ from tempfile import mkstemp
 
 from fauxfactory import gen_string
 import pytest
-from wrapanapi.systems.google import GoogleCloudSystem
 
 from robottelo.config import settings
 from robottelo.constants import (
@@ -16,6 +15,9 @@ from robottelo.constants import (
     GCE_TARGET_RHEL_IMAGE_NAME,
 )
 from robottelo.exceptions import GCECertNotFoundError
+from robottelo.utils.lazy import lazy_import
+
+google = lazy_import('wrapanapi.systems.google')
 
 
 @pytest.fixture(scope='session')
@@ -81,7 +83,7 @@ def gce_cert(sat_gce):
 
 @pytest.fixture(scope='session')
 def googleclient(gce_cert):
-    gceclient = GoogleCloudSystem(
+    gceclient = google.GoogleCloudSystem(
         project=gce_cert['project_id'],
         zone=settings.gce.zone,
         file_path=gce_cert['local_path'],
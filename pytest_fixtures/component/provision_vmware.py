@@ -1,11 +1,12 @@
 from broker import Broker
 from fauxfactory import gen_string
 import pytest
-from wrapanapi import VMWareSystem
-from wrapanapi.systems.virtualcenter import VMWareVirtualMachine
 
 from robottelo.config import settings
 from robottelo.hosts import ContentHost
+from robottelo.utils.lazy import lazy_import
+
+virtualcenter = lazy_import('wrapanapi.systems.virtualcenter')
 
 
 @pytest.fixture(scope='module')
@@ -19,7 +20,7 @@ def vmware(request):
 
 @pytest.fixture
 def vmwareclient(vmware):
-    vmwareclient = VMWareSystem(
+    vmwareclient = virtualcenter.VMWareSystem(
         hostname=vmware.hostname,
         username=settings.vmware.username,
         password=settings.vmware.password,
@@ -135,7 +136,7 @@ def provisioning_vmware_host(pxe_loader, vmwareclient, module_ssh_key_file):
     ) as provisioning_host:
         yield provisioning_host
         # Delete the host
-        vmware_host = VMWareVirtualMachine(vmwareclient, name=provisioning_host.name)
+        vmware_host = virtualcenter.VMWareVirtualMachine(vmwareclient, name=provisioning_host.name)
         vmware_host.delete()
         # Verify host is deleted from VMware
         assert vmwareclient.does_vm_exist(provisioning_host.name) is False
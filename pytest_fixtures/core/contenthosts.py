@@ -14,6 +14,7 @@ from robottelo import constants
 from robottelo.config import settings
 from robottelo.enums import NetworkType
 from robottelo.hosts import ContentHost, Satellite
+from robottelo.utils.host_group import HostGroupExecutor
 
 
 def host_conf(request):
@@ -49,6 +50,12 @@ def host_conf(request):
     return conf
 
 
+def _register_with_client_repo(host, org, activation_key, satellite):
+    """Register a content host, enabling the satellite client repository of its RHEL"""
+    repo = settings.repos['SATCLIENT_REPO'][f'RHEL{host.os_version.major}']
+    return host.register(org, None, activation_key.name, satellite, repo_data=f'repo={repo}')
+
+
 def host_post_config(hosts, config_name):
     """A function that runs a specified post config on a list of content hosts.
 
@@ -157,11 +164,9 @@ def mod_content_hosts(request):
 def registered_hosts(request, target_sat, module_org, module_ak_with_cv):
     """Fixture that registers content hosts to Satellite, based on rh_cloud setup"""
     with contenthost_factory(request=request, _count=2) as hosts:
-        for vm in hosts:
-            repo = settings.repos['SATCLIENT_REPO'][f'RHEL{vm.os_version.major}']
-            vm.register(
-                module_org, None, module_ak_with_cv.name, target_sat, repo_data=f'repo={repo}'
-            )
+        HostGroupExecutor(hosts).map(
+            _register_with_client_repo, module_org, module_ak_with_cv, target_sat
+        )
         yield hosts
 
 
@@ -210,11 +215,9 @@ def rex_contenthost(request, module_org, target_sat, module_ak_with_cv):
 def rex_contenthosts(request, module_org, target_sat, module_ak_with_cv):
     request.param['no_containers'] = True
     with contenthost_factory(request=request, _count=2) as hosts:
-        for host in hosts:
-            repo = settings.repos['SATCLIENT_REPO'][f'RHEL{host.os_version.major}']
-            host.register(
-                module_org, None, module_ak_with_cv.name, target_sat, repo_data=f'repo={repo}'
-            )
+        HostGroupExecutor(hosts).map(
+            _register_with_client_repo, module_org, module_ak_with_cv, target_sat
+        )
         yield hosts
 
 
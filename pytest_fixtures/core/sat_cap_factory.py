@@ -15,6 +15,7 @@ from robottelo.hosts import (
     lru_sat_ready_rhel,
 )
 from robottelo.logging import logger
+from robottelo.utils.host_pool import WarmHostPool
 from robottelo.utils.installer import InstallerCommand
 
 
@@ -27,6 +28,20 @@ def resolve_deploy_args(args_dict):
     return args_dict
 
 
+@contextmanager
+def _warm_pool(name, host_class, checkout, size):
+    """Run a warm pool of ``size`` hosts provisioned by ``checkout``, if ``size`` is set"""
+    if not size:
+        yield None
+        return
+    pool = WarmHostPool(name, host_class, checkout, size)
+    pool.start()
+    try:
+        yield pool
+    finally:
+        pool.stop()
+
+
 @contextmanager
 def _target_satellite_host(request, satellite_factory):
     if 'sanity' not in request.config.option.markexpr:
@@ -77,7 +92,7 @@ def satellite_factory():
         settings.set('server.deploy_arguments', resolved)
         logger.debug(f'Resolved deploy arguments for sat: {settings.server.deploy_arguments}')
 
-    def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
+    def checkout(retry_limit=3, delay=300, workflow=None, **broker_args):
         if settings.server.deploy_arguments:
             broker_args.update(settings.server.deploy_arguments)
             logger.debug(f'Updated broker args for sat: {broker_args}')
@@ -93,7 +108,14 @@ def satellite_factory():
         )
         return sat.out
 
-    return factory
+    def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
+        # only hosts deployed with the default arguments are pre-provisioned
+        if pool and workflow is None and not broker_args and (sat := pool.get()):
+            return sat
+        return checkout(retry_limit=retry_limit, delay=delay, workflow=workflow, **broker_args)
+
+    with _warm_pool('satellite', Satellite, checkout, settings.server.warm_pool_size) as pool:
+        yield factory
 
 
 @pytest.fixture
@@ -114,7 +136,7 @@ def capsule_factory():
         settings.set('capsule.deploy_arguments', resolved)
         logger.debug(f'Resolved deploy arguments for cap: {settings.capsule.deploy_arguments}')
 
-    def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
+    def checkout(retry_limit=3, delay=300, workflow=None, **broker_args):
         if settings.capsule.deploy_arguments:
             broker_args.update(settings.capsule.deploy_arguments)
         vmb = Broker(
@@ -128,7 +150,14 @@ def capsule_factory():
         )
         return cap.out
 
-    return factory
+    def factory(retry_limit=3, delay=300, workflow=None, **broker_args):
+        # only hosts deployed with the default arguments are pre-provisioned
+        if pool and workflow is None and not broker_args and (cap := pool.get()):
+            return cap
+        return checkout(retry_limit=retry_limit, delay=delay, workflow=workflow, **broker_args)
+
+    with _warm_pool('capsule', Capsule, checkout, settings.capsule.warm_pool_size) as pool:
+        yield factory
 
 
 @pytest.fixture
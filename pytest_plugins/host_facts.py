@@ -0,0 +1,9 @@
+"""Start every test session with an empty host fact cache."""
+
+from robottelo.utils.host_facts import host_facts
+
+
+def pytest_configure(config):
+    """Remove the host facts of the previous sessions, the workers share the ones of the controller"""
+    if not hasattr(config, 'workerinput'):
+        host_facts.clear()
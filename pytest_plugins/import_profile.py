@@ -0,0 +1,39 @@
+"""Report the import time of the modules imported by the session.
+
+The profiler is installed by ``conftest.py``, before it imports the plugins and the fixtures.
+"""
+
+from robottelo.logging import logger
+from robottelo.utils.import_profile import format_report, profiler
+
+# number of the most expensive modules and packages in the report
+REPORT_SIZE = 30
+
+
+def pytest_addoption(parser):
+    """Add --import-profile option to report the import time of the modules.
+
+    Examples:
+        pytest tests/robottelo --collect-only --import-profile
+    """
+    parser.addoption(
+        '--import-profile',
+        action='store_true',
+        default=False,
+        help='Report the modules, imported by conftest.py and by the tests, taking the most time '
+        'to import. Only the imports of the main pytest process are recorded.',
+    )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report the modules and the top level packages taking the most time to import"""
+    if not config.getoption('import_profile') or hasattr(config, 'workerinput'):
+        return
+    if not profiler.records:
+        terminalreporter.write_line('No imports recorded, the profiler is installed by conftest.py')
+        return
+    lines = format_report(profiler.records, top=REPORT_SIZE)
+    logger.info('Import profile:\n' + '\n'.join(lines))
+    terminalreporter.write_sep('-', 'import profile')
+    for line in lines:
+        terminalreporter.write_line(line)
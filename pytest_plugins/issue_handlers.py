@@ -1,19 +1,47 @@
 from collections import defaultdict
-import inspect
-import re
+from pathlib import Path
 
 import pytest
 
+from robottelo.logging import collection_logger as logger
 from robottelo.utils import slugify_component
 from robottelo.utils.issue_handlers import (
     add_workaround,
     should_deselect,
 )
+from robottelo.utils.issue_handlers.jira import CACHED_RESPONSES, prefetch_jira
+from robottelo.utils.metadata_index import is_jira_issue_key, metadata_index
+
+# Issues prefetched by the xdist controller, published to every worker through workerinput
+jira_issue_data_key = pytest.StashKey[dict]()
 
 
 def pytest_configure(config):
-    """Register custom markers to avoid warnings."""
-    pass
+    """Register custom markers to avoid warnings.
+
+    On a xdist worker, reuse the Jira issues prefetched by the controller.
+    """
+    if workerinput := getattr(config, 'workerinput', None):
+        CACHED_RESPONSES['get_single'].update(workerinput.get('jira_issue_data') or {})
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Prefetch the Jira issues referenced by the selected test files once on the xdist
+    controller and publish them to the worker"""
+    config = node.config
+    if jira_issue_data_key not in config.stash:
+        paths = [Path(config.invocation_params.dir, arg.split('::')[0]) for arg in config.args]
+        config.stash[jira_issue_data_key] = _prefetch(collect_source_issue_keys(paths))
+    node.workerinput['jira_issue_data'] = config.stash[jira_issue_data_key]
+
+
+@pytest.hookimpl(hookwrapper=True, specname='pytest_collection_modifyitems')
+def pytest_prefetch_jira_issues(session, items, config):
+    """Resolve the Jira issues referenced by the collected tests in a few batched queries
+    before any plugin checks their status one by one"""
+    _prefetch(collect_issue_keys(items))
+    yield
 
 
 @pytest.hookimpl(trylast=True)
@@ -25,35 +53,45 @@ def pytest_collection_modifyitems(session, items, config):
     pytest.issue_data = generate_issue_collection(items, config)
 
 
-IS_OPEN = re.compile(
-    # To match `if is_open('SAT:123456'):`
-    r"\s*if\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
-)
-
-NOT_IS_OPEN = re.compile(
-    # To match `if not is_open('SAT:123456'):`
-    r"\s*if\snot\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
-)
-
-COMPONENT = re.compile(
-    # To match :CaseComponent: FooBar
-    r"\s*:CaseComponent:\s*(?P<component>\S*)",
-    re.IGNORECASE,
-)
-
-IMPORTANCE = re.compile(
-    # To match :CaseImportance: Critical
-    r"\s*:CaseImportance:\s*(?P<importance>\S*)",
-    re.IGNORECASE,
-)
-
-# Only treat as Jira issue if it looks like PROJECT-NUM (e.g. SAT-20548, RHEL-55871)
-JIRA_ISSUE_PATTERN = re.compile(r'^[A-Za-z]+[-]\d+$')
-
-
-def _is_jira_issue_key(text):
-    """Return True if text looks like a Jira issue id (e.g. SAT-12345, RHEL-55871)."""
-    return bool(text and JIRA_ISSUE_PATTERN.match(text.strip()))
+def collect_issue_keys(items):
+    """Return the Jira issue ids referenced by the modules of the collected test items"""
+    modules = {
+        item.module
+        for item in items
+        if getattr(item, 'module', None) and not item.nodeid.startswith('tests/robottelo/')
+    }
+    keys = set()
+    for module in modules:
+        try:
+            keys.update(metadata_index.module(module)['jira_keys'])
+        except (AttributeError, OSError, TypeError, UnicodeDecodeError):
+            continue
+    return keys
+
+
+def collect_source_issue_keys(paths):
+    """Return the Jira issue ids referenced by the test files found in ``paths``"""
+    keys = set()
+    for path in paths:
+        files = sorted(path.rglob('test_*.py')) if path.is_dir() else [path]
+        for test_file in files:
+            if '/tests/robottelo/' in test_file.as_posix() or test_file.suffix != '.py':
+                continue
+            try:
+                keys.update(metadata_index.module_file(test_file)['jira_keys'])
+            except (OSError, UnicodeDecodeError):
+                continue
+    metadata_index.save()
+    return keys
+
+
+def _prefetch(keys):
+    """Prefetch the Jira issues ``keys``, status checks fall back to single lookups on errors"""
+    try:
+        return prefetch_jira(keys)
+    except Exception as err:
+        logger.warning(f'Failed to prefetch {len(keys)} Jira issues: {err}')
+        return {}
 
 
 def generate_issue_collection(items, config):  # pragma: no cover
@@ -127,7 +165,7 @@ def generate_issue_collection(items, config):  # pragma: no cover
             if marker.name in valid_markers:
                 issue = marker.kwargs.get('reason') or marker.args[0]
                 issue_key = issue.strip()
-                if not _is_jira_issue_key(issue_key):
+                if not is_jira_issue_key(issue_key):
                     continue
                 collected_data[issue_key]['used_in'].append(
                     {
@@ -145,8 +183,8 @@ def generate_issue_collection(items, config):  # pragma: no cover
                 deselect_data[item.location] = issue_key
 
         # Then take the workarounds using `is_open` helper.
-        source = inspect.getsource(item.function)
-        if 'is_open(' in source:
+        is_open_matches, not_is_open_matches = metadata_index.workarounds(item.function)
+        if is_open_matches or not_is_open_matches:
             kwargs = {
                 'filepath': filepath,
                 'lineno': lineno,
@@ -155,17 +193,14 @@ def generate_issue_collection(items, config):  # pragma: no cover
                 'importance': importance_mark,
                 'component_mark': component_slug,
             }
-            add_workaround(collected_data, IS_OPEN.findall(source), 'is_open', **kwargs)
-            add_workaround(collected_data, NOT_IS_OPEN.findall(source), 'not is_open', **kwargs)
+            add_workaround(collected_data, is_open_matches, 'is_open', **kwargs)
+            add_workaround(collected_data, not_is_open_matches, 'not is_open', **kwargs)
 
     # Take uses of `is_open` from outside of test cases e.g: SetUp methods
     for test_module in test_modules:
-        module_source = inspect.getsource(test_module)
-        component_matches = COMPONENT.findall(module_source)
-        module_component = None
-        if component_matches:
-            module_component = component_matches[0]
-        if 'is_open(' in module_source:
+        is_open_matches, not_is_open_matches = metadata_index.workarounds(test_module)
+        if is_open_matches or not_is_open_matches:
+            module_component = metadata_index.module(test_module)['component']
             kwargs = {
                 'filepath': test_module.__file__,
                 'lineno': 1,
@@ -178,14 +213,14 @@ def generate_issue_collection(items, config):  # pragma: no cover
 
             add_workaround(
                 collected_data,
-                IS_OPEN.findall(module_source),
+                is_open_matches,
                 'is_open',
                 validation=validation,
                 **kwargs,
             )
             add_workaround(
                 collected_data,
-                NOT_IS_OPEN.findall(module_source),
+                not_is_open_matches,
                 'not is_open',
                 validation=validation,
                 **kwargs,
@@ -0,0 +1,33 @@
+"""Record the lock telemetry of the session and summarize the most contended locks."""
+
+from pathlib import Path
+
+from robottelo.config import robottelo_tmp_dir
+from robottelo.logging import logger
+from robottelo.utils import lock_telemetry
+
+TELEMETRY_FILE_NAME = 'lock_telemetry.jsonl'
+# number of the most contended locks in the summary
+SUMMARY_SIZE = 10
+
+
+def pytest_configure(config):
+    """Enable the lock telemetry, the controller starts a new telemetry file for the session"""
+    lock_telemetry.enable(
+        Path(robottelo_tmp_dir, TELEMETRY_FILE_NAME),
+        truncate=not hasattr(config, 'workerinput'),
+    )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Summarize the locks the processes of the session waited the longest for"""
+    if hasattr(config, 'workerinput'):
+        return
+    stats = lock_telemetry.summarize(lock_telemetry.read_records(), top=SUMMARY_SIZE)
+    if not any(stat['total_wait'] or stat['count'] for stat in stats):
+        return
+    lines = lock_telemetry.format_summary(stats)
+    logger.info('Most contended locks:\n' + '\n'.join(lines))
+    terminalreporter.write_sep('-', f'most contended locks, see {lock_telemetry.telemetry_file}')
+    for line in lines:
+        terminalreporter.write_line(line)
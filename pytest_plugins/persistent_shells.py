@@ -0,0 +1,10 @@
+"""Stop the persistent hammer and psql processes of the session."""
+
+from robottelo.cli.hammer_shell import close_hammer_shells
+from robottelo.host_helpers.psql import close_psql_sessions
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Stop the processes and close their ssh connections, every worker stops its own"""
+    close_hammer_shells()
+    close_psql_sessions()
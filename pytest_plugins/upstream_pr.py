@@ -12,11 +12,11 @@ Configuration:
 
 import re
 
-from github import Auth, Github
-from github.GithubException import GithubException
-
 from robottelo.config import settings
 from robottelo.logging import collection_logger as logger
+from robottelo.utils.lazy import lazy_import
+
+github = lazy_import('github')
 
 
 def match_file_to_rule(filename, rule):
@@ -118,8 +118,8 @@ def pytest_collection_modifyitems(session, items, config):
 
     auth = None
     if token := gh_settings.get('token'):
-        auth = Auth.Token(token)
-    github_client = Github(auth=auth)
+        auth = github.Auth.Token(token)
+    github_client = github.Github(auth=auth)
 
     for pr_info in upstream_prs:
         try:
@@ -156,7 +156,7 @@ def pytest_collection_modifyitems(session, items, config):
                 if pr.state != 'open':
                     logger.warning(f"PR {repo_key}/{pr_id} is {pr.state}, results may be outdated")
 
-            except GithubException as e:
+            except github.GithubException as e:
                 if e.status == 404:
                     logger.error(
                         f"PR {repo_key}/{pr_id} not found. Check PR number and repository access."
@@ -203,7 +203,7 @@ def pytest_collection_modifyitems(session, items, config):
                     f"Unmatched files in {repo_key}/{pr_id}: {sorted(unprocessed_filenames)}"
                 )
 
-        except (ValueError, GithubException) as e:
+        except (ValueError, github.GithubException) as e:
             logger.error(f"Error processing PR {pr_info}: {e}")
             raise
 
@@ -33,6 +33,7 @@ class ActivationKey(Base):
     """Manipulates Katello's activation-key."""
 
     command_base = 'activation-key'
+    create_output_fields = ('id', 'name')
 
     @classmethod
     def add_host_collection(cls, options=None):
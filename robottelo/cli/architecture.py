@@ -28,3 +28,4 @@ class Architecture(Base):
     """
 
     command_base = 'architecture'
+    create_output_fields = ('id', 'name')
@@ -1,17 +1,103 @@
 """Generic base class for cli hammer commands."""
 
+from functools import partial
+import itertools
 import re
+from uuid import uuid4
 
+from box import Box
+from broker.helpers import Result, translate_timeout
 from wait_for import wait_for
 
 from robottelo import ssh
-from robottelo.cli import hammer
+from robottelo.cli import hammer, hammer_shell
 from robottelo.config import settings
-from robottelo.exceptions import CLIDataBaseError, CLIError, CLIReturnCodeError
+from robottelo.exceptions import (
+    CLIBaseError,
+    CLIDataBaseError,
+    CLIError,
+    CLIReturnCodeError,
+    PersistentShellUnsupportedError,
+)
 from robottelo.logging import logger
 from robottelo.utils.ssh import get_client
 
 
+class LazyInfoBox(Box):
+    """Box holding the ``create`` output of a record, which fetches the full ``info`` of
+    the record the first time a key it doesn't have, or the whole mapping, is accessed.
+    """
+
+    def __init__(self, *args, info_loader=None, **kwargs):
+        kwargs.setdefault('box_class', Box)
+        super().__init__(*args, **kwargs)
+        # set the loader as an attribute, Box would store it as a key
+        object.__setattr__(self, '_info_loader', info_loader)
+
+    @property
+    def info_loaded(self):
+        return self.__dict__.get('_info_loader') is None
+
+    def load_info(self):
+        """Fetch the ``info`` of the record and merge it into this box, once"""
+        if not self.info_loaded:
+            loader = self.__dict__['_info_loader']
+            object.__setattr__(self, '_info_loader', None)
+            self.update(loader())
+
+    def __getitem__(self, item, _ignore_default=False):
+        try:
+            return super().__getitem__(item, _ignore_default)
+        except KeyError:
+            # never fetch for private and dunder attribute lookups
+            if self.info_loaded or (isinstance(item, str) and item.startswith('_')):
+                raise
+            self.load_info()
+            return super().__getitem__(item, _ignore_default)
+
+    def __contains__(self, item):
+        if not super().__contains__(item):
+            self.load_info()
+        return super().__contains__(item)
+
+    def get(self, key, default=None):
+        if not super().__contains__(key):
+            self.load_info()
+        return super().get(key, default)
+
+    def __eq__(self, other):
+        self.load_info()
+        return super().__eq__(other)
+
+    def __iter__(self):
+        self.load_info()
+        return super().__iter__()
+
+    def __len__(self):
+        self.load_info()
+        return super().__len__()
+
+    def keys(self, *args, **kwargs):
+        self.load_info()
+        return super().keys(*args, **kwargs)
+
+    def values(self, *args, **kwargs):
+        self.load_info()
+        return super().values(*args, **kwargs)
+
+    def items(self, *args, **kwargs):
+        self.load_info()
+        return super().items(*args, **kwargs)
+
+    def to_dict(self):
+        self.load_info()
+        return super().to_dict()
+
+    def __repr__(self):
+        self.load_info()
+        return super().__repr__()
+
+
 class Base:
     """Base class for hammer CLI interaction
 
@@ -24,6 +110,7 @@ class Base:
     command_end = None  # extending commands like for directory to pass
     command_requires_org = False  # True when command requires organization-id
     hostname = None  # Now used for Satellite class hammer execution
+    create_output_fields = ()  # fields returned by create --output=csv, besides its message
     logger = logger
     _db_error_regex = re.compile(r'.*INSERT INTO|.*SELECT .*FROM|.*violates foreign key')
 
@@ -83,9 +170,14 @@ class Base:
         return cls.execute(cls._construct_command(options))
 
     @classmethod
-    def create(cls, options=None, timeout=None):
+    def create(cls, options=None, timeout=None, fields=None):
         """
         Creates a new record using the arguments passed via dictionary.
+
+        The new record is fetched with ``info`` right away, unless the caller lists the
+        ``fields`` it needs and the entity declares them all in ``create_output_fields``.
+        In that case a :class:`LazyInfoBox` built from the ``create`` output is returned,
+        which only runs ``info`` when some other key is accessed.
         """
 
         cls.command_sub = 'create'
@@ -97,28 +189,18 @@ class Base:
 
         # Extract new object ID if it was successfully created
         if len(result) > 0 and 'id' in result[0]:
-            obj_id = result[0]['id']
-
-            # Fetch new object
-            # Some Katello obj require the organization-id for subcommands
-            info_options = {'id': obj_id}
-            if cls.command_requires_org:
-                if 'organization-id' not in options:
-                    tmpl = 'organization-id option is required for {0}.create'
-                    raise CLIError(tmpl.format(cls.__name__))
-                info_options['organization-id'] = options['organization-id']
-
-            # organization creation can take some time
-            if cls.command_base == 'organization':
-                new_obj, _ = wait_for(
-                    lambda: cls.info(info_options),
-                    timeout=300000,
-                    delay=5,
-                    silent_failure=True,
-                    handle_exception=True,
+            info_options = cls._created_info_options(result[0]['id'], options)
+            if (
+                fields is not None
+                and set(fields).issubset(cls.create_output_fields)
+                and set(cls.create_output_fields).issubset(result[0])
+            ):
+                return LazyInfoBox(
+                    {key: value for key, value in result[0].items() if key != 'message'},
+                    info_loader=partial(cls._info_created, info_options),
                 )
-            else:
-                new_obj = cls.info(info_options)
+            # Fetch new object
+            new_obj = cls._info_created(info_options)
 
             # stdout should be a dictionary containing the object
             if len(new_obj) > 0:
@@ -126,6 +208,88 @@ class Base:
 
         return result
 
+    @classmethod
+    def create_many(cls, options_list, timeout=None):
+        """
+        Creates several records, one per dictionary of arguments in ``options_list``.
+
+        All ``create`` commands run in a single remote call and the follow-up ``info``
+        commands for the created records in another one, see :meth:`execute_many`.
+
+        :return: a list with one result per item of ``options_list``, as :meth:`create`
+            returns it.
+        :raises robottelo.exceptions.CLIReturnCodeError: for the first create that failed, once
+            the other records are created and fetched. Its ``results`` attribute holds the
+            result of each create, ``None`` for the failed ones.
+        """
+        cls.command_sub = 'create'
+        options_list = [options or {} for options in options_list]
+
+        responses = cls.execute_many(
+            [cls._construct_command(options) for options in options_list],
+            output_format='csv',
+            timeout=timeout,
+            return_raw_response=True,
+        )
+        results, errors = [], []
+        for response in responses:
+            try:
+                results.append(cls._handle_response(response))
+            except CLIBaseError as err:
+                results.append(None)
+                errors.append(err)
+
+        info_options = {
+            index: cls._created_info_options(result[0]['id'], options)
+            for index, (result, options) in enumerate(zip(results, options_list, strict=True))
+            if result and 'id' in result[0]
+        }
+        if info_options:
+            cls.command_sub = 'info'
+            responses = cls.execute_many(
+                [cls._construct_command(options) for options in info_options.values()],
+                return_raw_response=True,
+            )
+            for (index, options), response in zip(info_options.items(), responses, strict=True):
+                if response.status == 0:
+                    new_obj = hammer.parse_info(cls._handle_response(response))
+                else:
+                    # the record may not be available yet, fetch it the way create does
+                    new_obj = cls._info_created(options)
+                if len(new_obj) > 0:
+                    results[index] = new_obj
+        if errors:
+            errors[0].results = results
+            raise errors[0]
+        return results
+
+    @classmethod
+    def _created_info_options(cls, obj_id, options):
+        """Return the ``info`` options of a record created with ``options``"""
+        # Some Katello obj require the organization-id for subcommands
+        info_options = {'id': obj_id}
+        if cls.command_requires_org:
+            if 'organization-id' not in options:
+                tmpl = 'organization-id option is required for {0}.create'
+                raise CLIError(tmpl.format(cls.__name__))
+            info_options['organization-id'] = options['organization-id']
+        return info_options
+
+    @classmethod
+    def _info_created(cls, info_options):
+        """Fetch a freshly created record"""
+        # organization creation can take some time
+        if cls.command_base == 'organization':
+            new_obj, _ = wait_for(
+                lambda: cls.info(info_options),
+                timeout=300000,
+                delay=5,
+                silent_failure=True,
+                handle_exception=True,
+            )
+            return new_obj
+        return cls.info(info_options)
+
     @classmethod
     def delete(cls, options=None, timeout=None):
         """Deletes existing record."""
@@ -183,32 +347,168 @@ class Base:
         timeout=None,
         ignore_stderr=None,
         return_raw_response=None,
+        json_parser=None,
+        csv_parser=None,
     ):
-        """Executes the cli ``command`` on the server via ssh"""
+        """Executes the cli ``command`` on the server via ssh
+
+        ``json_parser`` and ``csv_parser`` select the :func:`robottelo.cli.hammer.parse_json`
+        and :func:`robottelo.cli.hammer.parse_csv` parsers of the ``output_format``.
+        """
         if cls.omitting_credentials:
             user, password = None, None
         else:
             user, password = cls._get_username_password(user, password)
         time_hammer = settings.performance.time_hammer
+        hostname = hostname or cls.hostname or settings.server.hostname
+        args = cls._hammer_args(command, user, password, output_format)
+        # the output is parsed here instead of by the transport when a json parser is chosen
+        parse_format = output_format
+        parser = {'json': json_parser, 'csv': csv_parser}.get(output_format)
+        if parser not in (None, 'default'):
+            parse_format = None
+
+        response = None
+        if (
+            settings.performance.hammer_shell
+            and not time_hammer
+            and timeout is None
+            and hammer_shell.is_shell_compatible(args)
+        ):
+            try:
+                response = hammer_shell.command(
+                    args,
+                    hostname=hostname,
+                    user=user,
+                    password=password,
+                    locale=settings.robottelo.locale,
+                    output_format=parse_format,
+                )
+            except PersistentShellUnsupportedError as err:
+                logger.debug(f'Running hammer without the persistent hammer process: {err}')
+        if response is None:
+            # add time to measure hammer performance
+            cmd = 'LANG={} {} hammer {}'.format(
+                settings.robottelo.locale,
+                'time -p' if time_hammer else '',
+                args,
+            )
+            response = ssh.command(
+                cmd,
+                hostname=hostname,
+                output_format=parse_format,
+                timeout=timeout,
+            )
+        if parse_format != output_format:
+            hammer.parse_output(
+                response, output_format, json_parser=json_parser, csv_parser=csv_parser
+            )
+        if return_raw_response:
+            return response
+        return cls._handle_response(response, ignore_stderr=ignore_stderr)
 
-        # add time to measure hammer performance
-        cmd = 'LANG={} {} hammer -v {} {} {} {}'.format(
-            settings.robottelo.locale,
-            'time -p' if time_hammer else '',
-            f'-u {user}' if user else "--interactive no",
-            f'-p {password}' if password else "",
-            f'--output={output_format}' if output_format else "",
-            command,
-        )
+    @classmethod
+    def execute_many(
+        cls,
+        commands,
+        hostname=None,
+        user=None,
+        password=None,
+        output_format=None,
+        timeout=None,
+        ignore_stderr=None,
+        return_raw_response=None,
+    ):
+        """Executes several cli ``commands`` on the server in a single ssh call
+
+        The commands run one after another in one remote script, each one's stdout,
+        stderr and exit status is framed by a unique marker so they can be told apart.
+        When the persistent hammer process is enabled, the commands are sent to it instead.
+
+        ``timeout``, the ssh command timeout by default, applies to each command, the remote
+        call waits for as many times it as there are commands.
+
+        :return: a list with the result of each command, in order, as :meth:`execute` returns it
+        :raises robottelo.exceptions.CLIReturnCodeError: for the first command that failed,
+            unless ``return_raw_response`` is set.
+        """
+        if settings.performance.hammer_shell:
+            return [
+                cls.execute(
+                    command,
+                    hostname=hostname,
+                    user=user,
+                    password=password,
+                    output_format=output_format,
+                    timeout=timeout,
+                    ignore_stderr=ignore_stderr,
+                    return_raw_response=return_raw_response,
+                )
+                for command in commands
+            ]
+        if cls.omitting_credentials:
+            user, password = None, None
+        else:
+            user, password = cls._get_username_password(user, password)
+        marker = f'robottelo-batch-{uuid4().hex}'
+        script = ['tmp=$(mktemp)']
+        for index, command in enumerate(commands):
+            script.extend(
+                [
+                    f"echo '{marker} {index} stdout'",
+                    f'LANG={settings.robottelo.locale} hammer '
+                    f'{cls._hammer_args(command, user, password, output_format)} 2>"$tmp"',
+                    'rc=$?',
+                    'echo',
+                    f"echo '{marker} {index} stderr'",
+                    'cat "$tmp"',
+                    'echo',
+                    f"echo '{marker} {index} status' $rc",
+                ]
+            )
+        script.append('rm -f "$tmp"')
+        timeout = translate_timeout(timeout or settings.server.ssh_client.command_timeout)
         response = ssh.command(
-            cmd,
+            '\n'.join(script),
             hostname=hostname or cls.hostname or settings.server.hostname,
-            output_format=output_format,
-            timeout=timeout,
+            timeout=timeout * len(commands) or None,
         )
-        if return_raw_response:
-            return response
-        return cls._handle_response(response, ignore_stderr=ignore_stderr)
+        responses = cls._split_batch_response(response.stdout, marker, len(commands))
+        results = []
+        for response in responses:
+            hammer.parse_output(response, output_format)
+            if return_raw_response:
+                results.append(response)
+            else:
+                results.append(cls._handle_response(response, ignore_stderr=ignore_stderr))
+        return results
+
+    @staticmethod
+    def _split_batch_response(stdout, marker, count):
+        """Split the output of an :meth:`execute_many` script into one result per command"""
+        sections = {}
+        current = None
+        for line in stdout.splitlines(keepends=True):
+            if line.startswith(marker):
+                _, index, stream, *status = line.split()
+                current = (int(index), stream)
+                sections[current] = status[0] if status else ''
+            elif current is not None:
+                sections[current] += line
+        results = []
+        for index in range(count):
+            status = sections.get((index, 'status'))
+            if status is None:
+                raise CLIError(f'Batch execution was interrupted before command {index} finished')
+            results.append(
+                Result(
+                    # the framing adds one newline after each stream
+                    stdout=sections[(index, 'stdout')][:-1],
+                    stderr=sections[(index, 'stderr')][:-1],
+                    status=int(status),
+                )
+            )
+        return results
 
     @classmethod
     def sm_execute(cls, command, hostname=None, timeout=None, **kwargs):
@@ -235,11 +535,14 @@ class Base:
         if search is not None and 'search' not in options:
             options.update({'search': f'{search[0]}=\\"{search[1]}\\"'})
 
-        result = cls.list(options)
-        if result:
-            result = result[0]
+        if next(klass for klass in cls.__mro__ if 'list' in vars(klass)) is not Base:
+            # entities listing their own way are not paginated
+            result = cls.list(options)
+            if result:
+                result = result[0]
+            return result
 
-        return result
+        return next(cls.iter_list(options, page_size=1), [])
 
     @classmethod
     def info(cls, options=None, output_format=None, return_raw_response=None):
@@ -262,10 +565,17 @@ class Base:
         return result
 
     @classmethod
-    def list(cls, options=None, per_page=True, output_format='csv'):
+    def list(
+        cls, options=None, per_page=True, output_format='csv', json_parser=None, csv_parser=None
+    ):
         """
         List information.
         @param options: ID (sometimes name works as well) to retrieve info.
+        @param json_parser: :func:`robottelo.cli.hammer.parse_json` parser used for the
+            ``json`` output_format, defaults to ``performance.hammer_json_parser``.
+        @param csv_parser: :func:`robottelo.cli.hammer.parse_csv` parser used for the
+            ``csv`` output_format, ``table`` returns a columnar
+            :class:`robottelo.cli.hammer.CSVTable`.
         """
 
         cls.command_sub = 'list'
@@ -282,7 +592,34 @@ class Base:
         # if cls.command_requires_org and 'organization-id' not in options:
         #     raise CLIError(f'organization-id option is required for {cls.__name__}.list')
 
-        return cls.execute(cls._construct_command(options), output_format=output_format)
+        parser_kwargs = {}
+        if output_format == 'json':
+            json_parser = json_parser or settings.performance.hammer_json_parser
+            if json_parser != 'default':
+                parser_kwargs['json_parser'] = json_parser
+        if output_format == 'csv' and csv_parser not in (None, 'default'):
+            parser_kwargs['csv_parser'] = csv_parser
+        return cls.execute(
+            cls._construct_command(options), output_format=output_format, **parser_kwargs
+        )
+
+    @classmethod
+    def iter_list(cls, options=None, page_size=1000):
+        """Iterate over the listed entities, requesting ``page_size`` of them at a time
+
+        Pages are requested with ``--page`` and ``--per-page`` only when the iteration
+        reaches them, stopping the iteration skips the remaining ones.
+        """
+        options = options or {}
+        for page in itertools.count(1):
+            cls.command_sub = 'list'
+            rows = cls.execute(
+                cls._construct_command({**options, 'page': page, 'per-page': page_size}),
+                output_format='csv',
+            )
+            yield from rows
+            if len(rows) < page_size:
+                return
 
     @classmethod
     def puppetclasses(cls, options=None):
@@ -353,6 +690,16 @@ class Base:
 
         return Wrapper
 
+    @classmethod
+    def _hammer_args(cls, command, user=None, password=None, output_format=None):
+        """Build the hammer arguments for ``command`` with credentials and output format"""
+        return '-v {} {} {} {}'.format(
+            f'-u {user}' if user else "--interactive no",
+            f'-p {password}' if password else "",
+            f'--output={output_format}' if output_format else "",
+            command,
+        )
+
     @classmethod
     def _construct_command(cls, options=None):
         """Build a hammer cli command based on the options passed"""
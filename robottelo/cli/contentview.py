@@ -87,6 +87,7 @@ class ContentView(Base):
     """Manipulates Foreman's content view."""
 
     command_base = 'content-view'
+    create_output_fields = ('id', 'name')
 
     filter = ContentViewFilter
 
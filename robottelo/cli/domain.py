@@ -28,3 +28,4 @@ class Domain(Base):
     """
 
     command_base = 'domain'
+    create_output_fields = ('id', 'name')
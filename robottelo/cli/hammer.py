@@ -1,12 +1,24 @@
 """Helpers to interact with hammer command line utility."""
 
+from array import array
+from collections.abc import Mapping, Sequence
 import csv
+from functools import lru_cache
 import json
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from robottelo.logging import logger
 
+CSV_PARSERS = ('default', 'table')
+JSON_PARSERS = ('default', 'hook', 'lazy')
+
 
+@lru_cache(maxsize=4096)
 def _normalize(header):
     """Replace empty spaces with '-' and lower all chars"""
     return header.replace(' ', '-').lower()
@@ -17,17 +29,36 @@ def parse_ping(output):
     return dict(re.findall(r'^(\S.*?):\s*\n\s+Status:\s+(\S+)', output, re.MULTILINE))
 
 
-def parse_json(stdout):
+def parse_json(stdout, parser='default'):
     """Parse JSON output from Hammer CLI and convert it to python dictionary
     while normalizing keys.
+
+    :param str parser: one of :data:`JSON_PARSERS`. ``default`` normalizes a copy of the
+        decoded output, ``hook`` normalizes keys and values while decoding and ``lazy``
+        returns read-only :class:`LazyJSONMapping`/:class:`LazyJSONList` views normalizing
+        on access, decoding with orjson when it is installed.
     """
     new_object_index = stdout.find('\n}\n{')
     if new_object_index > -1:
         stdout = stdout[new_object_index + 3 :]  # noqa: E203
+    if parser == 'hook':
+        return json.loads(stdout, object_pairs_hook=_normalize_pairs, parse_int=_parse_int)
+    if parser == 'lazy':
+        return _lazy_json_value(orjson.loads(stdout) if orjson else json.loads(stdout))
     parsed = json.loads(stdout)
     return _normalize_obj(parsed)
 
 
+def _parse_int(value):
+    # doing this to conform to csv parser
+    return str(int(value))
+
+
+def _normalize_pairs(pairs):
+    """Build a dict of decoded JSON object pairs with normalized keys"""
+    return {_normalize(key): value for key, value in pairs}
+
+
 def _normalize_obj(obj):
     """Normalize all dict's keys replacing empty spaces with "-" and lowering
     chars
@@ -42,19 +73,202 @@ def _normalize_obj(obj):
     return obj
 
 
-def parse_csv(output):
-    """Parse CSV output from Hammer CLI and return a Python dictionary."""
+def _lazy_json_value(value):
+    """Wrap decoded JSON containers into lazy views, normalize scalars"""
+    if isinstance(value, dict):
+        return LazyJSONMapping(value)
+    if isinstance(value, list):
+        return LazyJSONList(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+class LazyJSONMapping(Mapping):
+    """Read-only view of a decoded JSON object with the keys and values normalized the
+    same way :func:`parse_json` does, computed when accessed instead of upfront.
+    """
+
+    __slots__ = ('_cache', '_keys', '_raw')
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._keys = None
+        self._cache = {}
+
+    def _key_map(self):
+        if self._keys is None:
+            self._keys = {_normalize(key): key for key in self._raw}
+        return self._keys
+
+    def __getitem__(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = _lazy_json_value(self._raw[self._key_map()[key]])
+            return value
+
+    def __iter__(self):
+        return iter(self._key_map())
+
+    def __len__(self):
+        return len(self._key_map())
+
+    def __repr__(self):
+        return f'{type(self).__name__}({dict(self)!r})'
+
+    def to_dict(self):
+        """Return a normalized deep copy made of plain dicts and lists"""
+        return {key: _materialize(value) for key, value in self.items()}
+
+
+class LazyJSONList(Sequence):
+    """Read-only view of a decoded JSON array, see :class:`LazyJSONMapping`"""
+
+    __slots__ = ('_cache', '_raw')
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._cache = {}
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        if index < 0:
+            index += len(self._raw)
+        try:
+            return self._cache[index]
+        except KeyError:
+            value = self._cache[index] = _lazy_json_value(self._raw[index])
+            return value
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)!r})'
+
+    def to_list(self):
+        """Return a normalized deep copy made of plain dicts and lists"""
+        return [_materialize(value) for value in self]
+
+
+def _materialize(value):
+    if isinstance(value, LazyJSONMapping):
+        return value.to_dict()
+    if isinstance(value, LazyJSONList):
+        return value.to_list()
+    return value
+
+
+def parse_csv(output, parser='default'):
+    """Parse CSV output from Hammer CLI and return a Python dictionary.
+
+    :param str parser: one of :data:`CSV_PARSERS`. ``default`` returns a list of dicts,
+        ``table`` returns a columnar :class:`CSVTable`.
+    """
     output = output.splitlines()
 
     # Normalize the column names to use when generating the dictionary
     try:
-        keys = [_normalize(header) for header in next(csv.reader(output))]
+        keys = [_normalize(header) for header in next(csv.reader(output), [])]
+        if parser == 'table':
+            return CSVTable(keys, [tuple(row) for row in csv.reader(output[1:]) if row])
         return [value for value in csv.DictReader(output[1:], fieldnames=keys)]
     except csv.Error as err:
         logger.error(f'Exception while parsing CSV output {output}: {err}')
         raise
 
 
+class CSVTable(Sequence):
+    """Columnar result of :func:`parse_csv`, the header is stored once and rows as tuples
+
+    Indexing and iterating build the same row dicts :func:`parse_csv` returns, on access.
+    Column oriented methods work on the tuples without building any row dict.
+    """
+
+    __slots__ = ('_index', 'header', 'rows')
+
+    def __init__(self, header=(), rows=()):
+        self.header = tuple(header)
+        self.rows = list(rows)
+        self._index = {name: position for position, name in enumerate(self.header)}
+
+    def _row_dict(self, row):
+        # short and long rows are handled the same way csv.DictReader does
+        result = dict(zip(self.header, row, strict=False))
+        if len(row) > len(self.header):
+            result[None] = list(row[len(self.header) :])
+        else:
+            for name in self.header[len(row) :]:
+                result[name] = None
+        return result
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CSVTable(self.header, self.rows[index])
+        return self._row_dict(self.rows[index])
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __eq__(self, other):
+        if isinstance(other, CSVTable):
+            return self.to_dicts() == other.to_dicts()
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return self.to_dicts() == list(other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'{type(self).__name__}(header={self.header!r}, rows={len(self.rows)})'
+
+    def column(self, name):
+        """Return the values of the column ``name`` as a tuple"""
+        position = self._index[name]
+        return tuple(row[position] if position < len(row) else None for row in self.rows)
+
+    def numeric_column(self, name, typecode='q'):
+        """Return the values of the column ``name`` as an :class:`array.array`
+
+        :param str typecode: array typecode, e.g. ``q`` for integers or ``d`` for floats
+        """
+        convert = float if typecode in 'fd' else int
+        return array(typecode, (convert(value) for value in self.column(name)))
+
+    def filter(self, name, value):
+        """Return a table of the rows whose column ``name`` equals ``value``
+
+        ``value`` can also be a callable taking the column value and returning a bool.
+        """
+        position = self._index[name]
+        match = value if callable(value) else (lambda cell: cell == value)
+        return CSVTable(
+            self.header,
+            [row for row in self.rows if position < len(row) and match(row[position])],
+        )
+
+    def find(self, name, value):
+        """Return the dict of the first row whose column ``name`` equals ``value``, if any"""
+        position = self._index[name]
+        for row in self.rows:
+            if position < len(row) and row[position] == value:
+                return self._row_dict(row)
+        return None
+
+    def to_dicts(self):
+        """Return the rows as the list of dicts :func:`parse_csv` returns by default"""
+        return [self._row_dict(row) for row in self.rows]
+
+
 def parse_help(output):
     """Parse the help output from a hammer command and return a dictionary
     mapping the subcommands and options accepted by that command.
@@ -138,16 +352,8 @@ def get_line_indentation_spaces(line, tab_spaces=4):
     """
     if not line or len(line) < tab_spaces:
         return 0
-    spaces = 0
-    for char in line:
-        if char not in (' ', '\t'):
-            break
-        if char == '\t':
-            spaces += tab_spaces
-        else:
-            spaces += 1
-
-    return spaces
+    indentation = line[: len(line) - len(line.lstrip(' \t'))]
+    return len(indentation) + indentation.count('\t') * (tab_spaces - 1)
 
 
 def get_line_indentation_level(line, tab_spaces=4, indentation_spaces=4):
@@ -171,18 +377,50 @@ def get_line_indentation_level(line, tab_spaces=4, indentation_spaces=4):
 
     """
     spaces = get_line_indentation_spaces(line, tab_spaces=tab_spaces)
-    return spaces // indentation_spaces + (1 if spaces % indentation_spaces > 0 else 0)
+    return -(-spaces // indentation_spaces)
+
+
+def iter_lines(chunks):
+    """Yield the lines of a text received as an iterable of ``str`` chunks
+
+    Lines are split the same way :meth:`str.splitlines` splits them, so the output of a
+    command can be parsed while it is being read, without joining it first.
+    """
+    pending = ''
+    for chunk in chunks:
+        lines = (pending + chunk).splitlines(keepends=True)
+        if not lines:
+            continue
+        pending = lines.pop()
+        # a trailing '\r' may be the first half of a '\r\n' split between two chunks
+        if not pending.endswith('\r') and pending.splitlines()[0] != pending:
+            lines.append(pending)
+            pending = ''
+        for line in lines:
+            yield line.splitlines()[0]
+    if pending:
+        yield pending.splitlines()[0]
+
+
+# precompiled patterns of parse_info, which is called for every created and read entity
+_INFO_NUMBERED_VALUE_REGEX = re.compile(r'\d+\)\s+(.+)$')
+_INFO_NUMBERED_KEY_REGEX = re.compile(r'(\d+)\)')
 
 
 def parse_info(output):
-    """Parse the info output and returns a dict mapping the values."""
+    """Parse the info output and returns a dict mapping the values.
+
+    :param output: the whole output as a ``str`` or an iterable of output chunks, e.g.
+        stdout read from a stream. Either way the output is parsed in a single pass.
+    """
+    lines = output.splitlines() if isinstance(output, str) else iter_lines(output)
     # info dictionary
     contents = {}
     sub_prop = None  # stores name of the last group of sub-properties
     sub_num = None  # is not None when list of properties
     second_level_key = None  # is set when a possible second level is detected
 
-    for line in output.splitlines():
+    for line in lines:
         # skip empty lines and dividers
         if line == '' or line == '---':
             continue
@@ -191,13 +429,14 @@ def parse_info(output):
             # we are entering or leaving a second level from lower/upper levels
             # clear the second level key
             second_level_key = None
+        stripped = line.lstrip()
         if line.startswith(' '):  # sub-properties are indented
             # values are separated by ':' or '=>', but not by '::' which can be
             # entity name like 'test::params::keys'
-            if line.find(':') != -1 and line.find('::') == -1:
-                key, value = line.lstrip().split(":", 1)
-            elif line.find('=>') != -1 and len(line.lstrip().split(" =>", 1)) == 2:
-                key, value = line.lstrip().split(" =>", 1)
+            if ':' in line and '::' not in line:
+                key, value = stripped.split(':', 1)
+            elif '=>' in line and ' =>' in stripped:
+                key, value = stripped.split(' =>', 1)
             else:
                 key = value = None
 
@@ -211,18 +450,13 @@ def parse_info(output):
                 # Template
                 #  template1
                 #  template2
-                match = re.match(r'\d+\)\s+(.+)$', line.lstrip())
-
-                if match is None:
-                    match = re.match(r'(.*)$', line.lstrip())
-
-                value = match.group(1)
+                match = _INFO_NUMBERED_VALUE_REGEX.match(stripped)
+                value = stripped if match is None else match.group(1)
 
                 # adding list to 1 level, for example:
                 # {'template': ['template1', 'template2']}
                 if isinstance(contents[sub_prop], dict) and not contents[sub_prop]:
-                    contents[sub_prop] = []
-                    contents[sub_prop].append(value)
+                    contents[sub_prop] = [value]
                 elif isinstance(contents[sub_prop], list):
                     contents[sub_prop].append(value)
                 else:
@@ -230,7 +464,7 @@ def parse_info(output):
                     # {'subscription-information':
                     #      {'registered-by-activation-keys': ['ak1', 'ak2']}
                     #  }
-                    last_key = list(contents[sub_prop].keys())[-1]
+                    last_key = next(reversed(contents[sub_prop].keys()))
                     if not contents[sub_prop][last_key]:
                         contents[sub_prop][last_key] = [value]
                     else:
@@ -243,7 +477,7 @@ def parse_info(output):
                 #     URL:       /custom/4f84fc90-9ffa-...
                 #  2) Repo Name: puppet1
                 #     URL:       /custom/4f84fc90-9ffa-...
-                starts_with_number = re.match(r'(\d+)\)', key)
+                starts_with_number = _INFO_NUMBERED_KEY_REGEX.match(key)
                 if starts_with_number:
                     # if this is a numbered list on level 2, do nothing - this script doesn't support it
                     if current_indent_level >= 2:
@@ -253,7 +487,7 @@ def parse_info(output):
                     if sub_num == 1:
                         contents[sub_prop] = []
                     # remove number from key
-                    key = re.sub(r'\d+\)', '', key)
+                    key = _INFO_NUMBERED_KEY_REGEX.sub('', key)
                     # append empty dict to array
                     contents[sub_prop].append({})
 
@@ -285,12 +519,30 @@ def parse_info(output):
                         second_level_key = key
         else:
             sub_num = None  # new property implies no sub property
-            key, value = line.lstrip().split(":", 1)
+            key, value = stripped.split(':', 1)
             key = key.lstrip().replace(' ', '-').lower()
-            if value.lstrip() == '':  # 'key:' no value, new sub-property
+            value = value.lstrip()
+            if value == '':  # 'key:' no value, new sub-property
                 sub_prop = key
                 contents[sub_prop] = {}
             else:  # 'key: value' line
-                contents[key] = value.lstrip()
+                contents[key] = value
 
     return contents
+
+
+def parse_output(result, output_format, json_parser='default', csv_parser='default'):
+    """Parse ``result.stdout`` in place according to the hammer ``output_format``
+
+    Only the output of successful commands is parsed, ``json_parser`` is passed to
+    :func:`parse_json` and ``csv_parser`` to :func:`parse_csv`.
+    """
+    if output_format and result.status == 0:
+        if output_format == 'csv':
+            if csv_parser == 'table':
+                result.stdout = parse_csv(result.stdout, csv_parser)
+            else:
+                result.stdout = parse_csv(result.stdout) if result.stdout else {}
+        if output_format == 'json':
+            result.stdout = parse_json(result.stdout, json_parser) if result.stdout else None
+    return result
@@ -0,0 +1,195 @@
+"""Persistent hammer process used as an opt-in execution backend by
+:meth:`robottelo.cli.base.Base.execute`.
+
+Every regular hammer call starts a new Ruby interpreter, loads the apipie cache and
+authenticates again. :class:`HammerShell` instead keeps one hammer process running on the
+Satellite per credential pair and thread, the same way ``hammer shell`` does, and feeds it
+commands over the channel of a :class:`robottelo.utils.ssh.PersistentShell`. The remote driver
+reports stdout, stderr and the exit status of every command, so the response can be handled
+exactly like the result of :func:`robottelo.ssh.command`. A process found dead is started again
+before the next command.
+
+Enable it with ``performance.hammer_shell``.
+"""
+
+import json
+import re
+import shlex
+import threading
+
+from broker.helpers import Result
+
+from robottelo.cli import hammer
+from robottelo.exceptions import CLIError, PersistentShellError, PersistentShellUnsupportedError
+from robottelo.logging import logger
+from robottelo.utils.ssh import PersistentShell, get_client
+
+HAMMER_SHELL_DRIVER_PATH = '/tmp/robottelo_hammer_shell.rb'
+HAMMER_SHELL_LOG_PATH = '/tmp/robottelo_hammer_shell.log'
+HAMMER_SHELL_READY = 'ROBOTTELO-HAMMER-SHELL-READY'
+# Ruby driver that bootstraps hammer once, then runs one JSON encoded argv per stdin line
+# and answers with one JSON encoded line holding the exit status, stdout and stderr.
+HAMMER_SHELL_DRIVER = f"""\
+require 'json'
+require 'stringio'
+
+def capture
+  out, err = StringIO.new, StringIO.new
+  $stdout, $stderr = out, err
+  status = begin
+    yield
+  rescue SystemExit => e
+    e.status
+  rescue StandardError => e
+    err.puts(e.full_message(highlight: false))
+    1
+  ensure
+    $stdout, $stderr = STDOUT, STDERR
+  end
+  [status.is_a?(Integer) ? status : 0, out.string, err.string]
+end
+
+hammer_bin = ARGV.shift
+ARGV.replace(['--version'])
+capture {{ load hammer_bin }}
+STDOUT.puts '{HAMMER_SHELL_READY}'
+STDOUT.flush
+STDIN.each_line do |line|
+  status, out, err = capture {{ HammerCLI::MainCommand.new('hammer', HammerCLI.context).run(JSON.parse(line)) }}
+  STDOUT.puts JSON.generate('status' => status, 'stdout' => out, 'stderr' => err)
+  STDOUT.flush
+end
+"""
+# commands relying on shell features have to go through a real shell
+_SHELL_SYNTAX_REGEX = re.compile(r'[`$|;&<>]')
+
+_shells = {}
+_shells_lock = threading.Lock()
+# set once the ssh backend is known not to support persistent shells
+_unsupported = None
+
+
+class HammerShell:
+    """A long-lived hammer process on a Satellite, driven over an ssh channel
+
+    :param hostname: Satellite hostname
+    :param user: hammer username, ``None`` when credentials are omitted
+    :param password: hammer password
+    :param locale: value of ``LANG`` for the hammer process
+    """
+
+    def __init__(self, hostname, user=None, password=None, locale=None):
+        self.hostname = hostname
+        self.user = user
+        self.password = password
+        self.locale = locale
+        self._shell = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        return self._shell is not None and self._shell.running
+
+    def start(self):
+        """Upload the driver and start the hammer process"""
+        from robottelo.config import settings
+
+        logger.debug(f'Starting persistent hammer process on {self.hostname}')
+        get_client(hostname=self.hostname).put(
+            HAMMER_SHELL_DRIVER, HAMMER_SHELL_DRIVER_PATH, temp_file=True
+        )
+        self._shell = PersistentShell(
+            self.hostname,
+            username=settings.server.ssh_username,
+            password=settings.server.ssh_password,
+            port=settings.server.ssh_client.port,
+        )
+        self._shell.open()
+        self._shell.send(
+            f'LANG={self.locale} exec ruby {HAMMER_SHELL_DRIVER_PATH} "$(command -v hammer)" '
+            f'2>>{HAMMER_SHELL_LOG_PATH}'
+        )
+        try:
+            while (line := self._shell.readline().strip()) != HAMMER_SHELL_READY:
+                logger.debug(f'hammer shell on {self.hostname}: {line}')
+        except PersistentShellError as err:
+            raise CLIError(f'Persistent hammer process on {self.hostname} did not start') from err
+
+    def close(self):
+        """Stop the hammer process"""
+        if self._shell is not None:
+            self._shell.close()
+        self._shell = None
+
+    def _send(self, line):
+        """Send a line, starting the process again when it is not running anymore"""
+        if not (self._shell and self._shell.alive()):
+            self.close()
+            self.start()
+        try:
+            self._shell.send(line)
+        except Exception as err:
+            # nothing was run, the command is sent again to a new process
+            logger.debug(f'Restarting persistent hammer process on {self.hostname}: {err}')
+            self.close()
+            self.start()
+            self._shell.send(line)
+
+    def run(self, args):
+        """Run hammer with the list of arguments ``args``
+
+        :return: a result object with ``status``, ``stdout`` and ``stderr``
+        """
+        with self._lock:
+            self._send(json.dumps(args))
+            try:
+                response = json.loads(self._shell.readline())
+            except PersistentShellError as err:
+                self.close()
+                raise CLIError(
+                    f'Persistent hammer process on {self.hostname} exited while running a command'
+                ) from err
+            except (ValueError, UnicodeDecodeError) as err:
+                self.close()
+                raise CLIError(f'Invalid response from hammer process: {err}') from err
+        return Result(**response)
+
+
+def get_hammer_shell(hostname, user=None, password=None, locale=None):
+    """Return the hammer shell of a Satellite and credential pair for the calling thread"""
+    key = (hostname, user, password, threading.get_ident())
+    with _shells_lock:
+        if key not in _shells:
+            _shells[key] = HammerShell(hostname, user=user, password=password, locale=locale)
+        return _shells[key]
+
+
+def close_hammer_shells():
+    """Stop all persistent hammer processes of this process"""
+    with _shells_lock:
+        for shell in _shells.values():
+            shell.close()
+        _shells.clear()
+
+
+def is_shell_compatible(command):
+    """Whether ``command`` can be run without a shell interpreting it"""
+    return not _SHELL_SYNTAX_REGEX.search(command)
+
+
+def command(args, hostname, user=None, password=None, locale=None, output_format=None):
+    """Run hammer ``args`` through the persistent hammer process of ``hostname``
+
+    Mirrors :func:`robottelo.ssh.command`, ``args`` is the hammer command line
+    without the leading ``hammer``.
+    """
+    global _unsupported
+    if _unsupported is not None:
+        raise _unsupported
+    shell = get_hammer_shell(hostname, user=user, password=password, locale=locale)
+    try:
+        response = shell.run(shlex.split(args))
+    except PersistentShellUnsupportedError as err:
+        _unsupported = err
+        raise
+    return hammer.parse_output(response, output_format)
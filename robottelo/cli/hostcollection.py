@@ -31,6 +31,7 @@ class HostCollection(Base):
     """Manipulates Katello engine's host-collection command."""
 
     command_base = 'host-collection'
+    create_output_fields = ('id', 'name')
 
     @classmethod
     def add_host(cls, options=None):
@@ -30,6 +30,7 @@ class HostGroup(Base):
     """Manipulates Foreman's hostgroups."""
 
     command_base = 'hostgroup'
+    create_output_fields = ('id', 'name')
 
     @classmethod
     def ansible_roles_assign(cls, options):
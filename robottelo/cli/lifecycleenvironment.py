@@ -27,6 +27,7 @@ class LifecycleEnvironment(Base):
 
     command_base = 'lifecycle-environment'
     command_requires_org = True
+    create_output_fields = ('id', 'name')
 
     @classmethod
     def list(cls, options=None, per_page=False):
@@ -44,6 +44,7 @@ class Location(Base):
     """Manipulates Foreman's Locations"""
 
     command_base = 'location'
+    create_output_fields = ('id', 'name')
 
     @classmethod
     def add_compute_resource(cls, options=None):
@@ -28,3 +28,4 @@ class Medium(Base):
     """
 
     command_base = 'medium'
+    create_output_fields = ('id', 'name')
@@ -26,3 +26,4 @@ class Model(Base):
     """
 
     command_base = 'model'
+    create_output_fields = ('id', 'name')
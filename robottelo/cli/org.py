@@ -48,6 +48,7 @@ class Org(Base):
     """Manipulates Foreman's Organizations"""
 
     command_base = 'organization'
+    create_output_fields = ('id', 'name')
 
     @classmethod
     def add_compute_resource(cls, options=None):
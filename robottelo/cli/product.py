@@ -32,6 +32,7 @@ class Product(Base):
 
     command_base = 'product'
     command_requires_org = True
+    create_output_fields = ('id', 'name')
 
     @classmethod
     def remove_sync_plan(cls, options=None):
@@ -31,14 +31,15 @@ class Repository(Base):
 
     command_base = 'repository'
     command_requires_org = True
+    create_output_fields = ('id', 'name')
 
     @classmethod
-    def create(cls, options=None, timeout=None):
+    def create(cls, options=None, timeout=None, fields=None):
         """Create a custom repository"""
         cls.command_requires_org = False
 
         try:
-            result = super().create(options, timeout)
+            result = super().create(options, timeout, fields=fields)
         finally:
             cls.command_requires_org = True
 
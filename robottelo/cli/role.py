@@ -25,6 +25,7 @@ class Role(Base):
     """Manipulates Katello engine's role command."""
 
     command_base = 'role'
+    create_output_fields = ('id', 'name')
 
     @classmethod
     def filters(cls, options=None):
@@ -27,3 +27,4 @@ class Subnet(Base):
     """
 
     command_base = 'subnet'
+    create_output_fields = ('id', 'name')
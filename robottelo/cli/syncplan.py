@@ -25,13 +25,14 @@ class SyncPlan(Base):
     """Manipulates Katello engine's sync-plan command."""
 
     command_base = 'sync-plan'
+    create_output_fields = ('id', 'name')
 
     @classmethod
-    def create(cls, options=None, timeout=None):
+    def create(cls, options=None, timeout=None, fields=None):
         """Create a SyncPlan"""
         cls.command_sub = 'create'
 
         if options.get('interval') == 'custom cron' and options.get('cron-expression') is None:
             raise CLIError('Missing "cron-expression" option for "custom cron" interval.')
 
-        return super().create(options, timeout)
+        return super().create(options, timeout, fields=fields)
@@ -28,6 +28,7 @@ class UserGroup(Base):
     """Manipulates Foreman's user group."""
 
     command_base = 'user-group'
+    create_output_fields = ('id', 'name')
 
     @classmethod
     def add_role(cls, options=None):
@@ -35,6 +35,7 @@ VALIDATORS = dict(
         Validator('server.deploy_workflows.product', must_exist=True),
         Validator('server.deploy_workflows.os', must_exist=True),
         Validator('server.deploy_arguments', must_exist=True, is_type_of=dict, default={}),
+        Validator('server.warm_pool_size', default=0, gte=0, cast=int),
         Validator('server.scheme', default='https'),
         Validator('server.port', default=443),
         Validator('server.ssh_username', default='root'),
@@ -46,6 +47,10 @@ VALIDATORS = dict(
             default=NetworkType.IPV4.value,
         ),
         Validator('server.is_ipv6', is_type_of=bool, must_exist=False),
+        Validator('server.ssh_client.pool.enabled', default=True, is_type_of=bool),
+        Validator('server.ssh_client.pool.max_sessions', default=32, gte=1, cast=int),
+        Validator('server.ssh_client.pool.idle_timeout', default=600, cast=float),
+        Validator('server.ssh_client.pool.keepalive_interval', default=30, cast=float),
     ],
     content_host=[
         Validator('content_host.default_rhel_version', must_exist=True),
@@ -104,6 +109,7 @@ VALIDATORS = dict(
         Validator('capsule.deploy_workflows.product', must_exist=True),
         Validator('capsule.deploy_workflows.os', must_exist=True),
         Validator('capsule.deploy_arguments', must_exist=True, is_type_of=dict, default={}),
+        Validator('capsule.warm_pool_size', default=0, gte=0, cast=int),
     ],
     libvirt=[
         Validator('libvirt.libvirt_hostname', must_exist=True),
@@ -265,6 +271,8 @@ VALIDATORS = dict(
         Validator('jira.issue_status', default=["Testing", "Release Pending"]),
         Validator('jira.cache_file', default='jira_status_cache.json'),
         Validator('jira.cache_ttl_days', default=7, is_type_of=int),
+        Validator('jira.cache_backend', default='json', is_in=['json', 'sqlite']),
+        Validator('jira.cache_db', default='jira_status_cache.db'),
     ],
     ldap=[
         Validator(
@@ -333,7 +341,14 @@ VALIDATORS = dict(
             must_exist=True,
         ),
     ],
-    performance=[Validator('performance.time_hammer', default=False)],
+    performance=[
+        Validator('performance.time_hammer', default=False),
+        Validator('performance.hammer_shell', default=False, is_type_of=bool),
+        Validator('performance.psql_session', default=False, is_type_of=bool),
+        Validator(
+            'performance.hammer_json_parser', default='default', is_in=['default', 'hook', 'lazy']
+        ),
+    ],
     report_portal=[
         Validator(
             'report_portal.portal_url',
@@ -438,9 +453,10 @@ VALIDATORS = dict(
             cast=lambda x: list(map(str, x)),
         ),
         Validator('robottelo.shared_resource_wait', default=60, cast=float),
+        Validator('robottelo.host_facts_ttl', default=3600, cast=float),
     ],
     shared_function=[
-        Validator('shared_function.storage', is_in=('file', 'redis'), default='file'),
+        Validator('shared_function.storage', is_in=('file', 'redis', 'sqlite'), default='file'),
         Validator('shared_function.share_timeout', lte=86400, default=86400),
         Validator('shared_function.scope', default=None),
         Validator('shared_function.enabled', default=False),
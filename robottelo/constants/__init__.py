@@ -2,8 +2,7 @@
 
 from pathlib import Path
 
-from box import Box
-from nailgun import entities
+from robottelo.utils.lazy import lazy_attributes
 
 # This should be updated after each version branch
 SATELLITE_VERSION = "6.20"
@@ -174,7 +173,12 @@ AZURERM_FILE_URI = (
     'https://raw.githubusercontent.com/SatelliteQE/robottelo/master/tests/foreman/data/uri.sh'
 )
 
-OPERATING_SYSTEMS = entities._OPERATING_SYSTEMS
+
+def _operating_systems():
+    from nailgun import entities
+
+    return entities._OPERATING_SYSTEMS
+
 
 TEMPLATE_TYPES = [
     'finish',
@@ -2053,38 +2057,48 @@ ROLES_LOCKED = [
     'Viewer',
 ]
 
-BOOKMARK_ENTITIES_SELECTION = [
-    {
-        'name': 'ActivationKey',
-        'controller': 'katello_activation_keys',
-        'session_name': 'activationkey',
-        'old_ui': True,
-    },
-    {'name': 'Errata', 'controller': 'katello_errata', 'session_name': 'errata', 'old_ui': True},
-    {
-        'name': 'UserGroup',
-        'controller': 'usergroups',
-        'setup': entities.UserGroup,
-        'session_name': 'usergroup',
-    },
-    {
-        'name': 'PartitionTable',
-        'controller': 'ptables',
-        'setup': entities.PartitionTable,
-        'session_name': 'partitiontable',
-    },
-    {
-        'name': 'Product',
-        'controller': 'katello_products',
-        'session_name': 'product',
-        'old_ui': True,
-    },
-    {
-        'name': 'ProvisioningTemplate',
-        'controller': 'provisioning_templates',
-        'session_name': 'provisioningtemplate',
-    },
-]
+
+def _bookmark_entities_selection():
+    from nailgun import entities
+
+    return [
+        {
+            'name': 'ActivationKey',
+            'controller': 'katello_activation_keys',
+            'session_name': 'activationkey',
+            'old_ui': True,
+        },
+        {
+            'name': 'Errata',
+            'controller': 'katello_errata',
+            'session_name': 'errata',
+            'old_ui': True,
+        },
+        {
+            'name': 'UserGroup',
+            'controller': 'usergroups',
+            'setup': entities.UserGroup,
+            'session_name': 'usergroup',
+        },
+        {
+            'name': 'PartitionTable',
+            'controller': 'ptables',
+            'setup': entities.PartitionTable,
+            'session_name': 'partitiontable',
+        },
+        {
+            'name': 'Product',
+            'controller': 'katello_products',
+            'session_name': 'product',
+            'old_ui': True,
+        },
+        {
+            'name': 'ProvisioningTemplate',
+            'controller': 'provisioning_templates',
+            'session_name': 'provisioningtemplate',
+        },
+    ]
+
 
 STRING_TYPES = ['alpha', 'numeric', 'alphanumeric', 'latin1', 'utf8', 'cjk', 'html']
 
@@ -2539,25 +2553,39 @@ FOREMANCTL_PARAMETERS_FILE = '/var/lib/foremanctl/parameters.yaml'
 
 
 # Data File Paths
-class DataFile(Box):
-    """The boxed Data directory class with its attributes pointing to the Data directory files"""
-
-    DATA_DIR = Path('tests/foreman/data')
-    OSCAP_TAILORING_FILE = DATA_DIR.joinpath(OSCAP_TAILORING_FILE)
-    REPORT_TEMPLATE_FILE = DATA_DIR.joinpath(REPORT_TEMPLATE_FILE)
-    VALID_GPG_KEY_FILE = DATA_DIR.joinpath(VALID_GPG_KEY_FILE)
-    VALID_GPG_KEY_BETA_FILE = DATA_DIR.joinpath(VALID_GPG_KEY_BETA_FILE)
-    VALID_CERT_FILE = DATA_DIR.joinpath('valid_cert.crt')
-    RPM_TO_UPLOAD = DATA_DIR.joinpath(RPM_TO_UPLOAD)
-    SRPM_TO_UPLOAD = DATA_DIR.joinpath(SRPM_TO_UPLOAD)
-    FAKE_FILE_NEW_NAME = DATA_DIR.joinpath(FAKE_FILE_NEW_NAME)
-    ZOO_CUSTOM_GPG_KEY = DATA_DIR.joinpath(ZOO_CUSTOM_GPG_KEY)
-    SSH_KEYS_JSON = DATA_DIR.joinpath('sshkeys.json')
-    HAMMER_COMMANDS_JSON = DATA_DIR.joinpath('hammer_commands.json')
-    SNIPPET_DATA_FILE = DATA_DIR.joinpath(SNIPPET_DATA_FILE)
-    PARTITION_SCRIPT_DATA_FILE = DATA_DIR.joinpath(PARTITION_SCRIPT_DATA_FILE)
-    OS_TEMPLATE_DATA_FILE = DATA_DIR.joinpath(OS_TEMPLATE_DATA_FILE)
-    FAKE_3_YUM_REPO_RPMS_ANT = DATA_DIR.joinpath(FAKE_3_YUM_REPO_RPMS[0])
-    EXPIRED_MANIFEST_FILE = DATA_DIR.joinpath(EXPIRED_MANIFEST)
-    USAGE_REPORT_ITEMS = DATA_DIR.joinpath('usage_report.yml')
-    USAGE_REPORT_ITEMS_CONDENSED = DATA_DIR.joinpath('usage_report_condensed.yml')
+def _data_file():
+    from box import Box
+
+    class DataFile(Box):
+        """The boxed Data directory class with its attributes pointing to the Data directory files"""
+
+        DATA_DIR = Path('tests/foreman/data')
+        OSCAP_TAILORING_FILE = DATA_DIR.joinpath(OSCAP_TAILORING_FILE)
+        REPORT_TEMPLATE_FILE = DATA_DIR.joinpath(REPORT_TEMPLATE_FILE)
+        VALID_GPG_KEY_FILE = DATA_DIR.joinpath(VALID_GPG_KEY_FILE)
+        VALID_GPG_KEY_BETA_FILE = DATA_DIR.joinpath(VALID_GPG_KEY_BETA_FILE)
+        VALID_CERT_FILE = DATA_DIR.joinpath('valid_cert.crt')
+        RPM_TO_UPLOAD = DATA_DIR.joinpath(RPM_TO_UPLOAD)
+        SRPM_TO_UPLOAD = DATA_DIR.joinpath(SRPM_TO_UPLOAD)
+        FAKE_FILE_NEW_NAME = DATA_DIR.joinpath(FAKE_FILE_NEW_NAME)
+        ZOO_CUSTOM_GPG_KEY = DATA_DIR.joinpath(ZOO_CUSTOM_GPG_KEY)
+        SSH_KEYS_JSON = DATA_DIR.joinpath('sshkeys.json')
+        HAMMER_COMMANDS_JSON = DATA_DIR.joinpath('hammer_commands.json')
+        SNIPPET_DATA_FILE = DATA_DIR.joinpath(SNIPPET_DATA_FILE)
+        PARTITION_SCRIPT_DATA_FILE = DATA_DIR.joinpath(PARTITION_SCRIPT_DATA_FILE)
+        OS_TEMPLATE_DATA_FILE = DATA_DIR.joinpath(OS_TEMPLATE_DATA_FILE)
+        FAKE_3_YUM_REPO_RPMS_ANT = DATA_DIR.joinpath(FAKE_3_YUM_REPO_RPMS[0])
+        EXPIRED_MANIFEST_FILE = DATA_DIR.joinpath(EXPIRED_MANIFEST)
+        USAGE_REPORT_ITEMS = DATA_DIR.joinpath('usage_report.yml')
+        USAGE_REPORT_ITEMS_CONDENSED = DATA_DIR.joinpath('usage_report_condensed.yml')
+
+    return DataFile
+
+
+# values needing heavy imports, computed on first access
+__getattr__ = lazy_attributes(
+    __name__,
+    BOOKMARK_ENTITIES_SELECTION=_bookmark_entities_selection,
+    DataFile=_data_file,
+    OPERATING_SYSTEMS=_operating_systems,
+)
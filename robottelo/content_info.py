@@ -7,6 +7,7 @@ import requests
 
 from robottelo import ssh
 from robottelo.exceptions import CLIReturnCodeError
+from robottelo.utils.repo_inspector import inspector
 
 
 def get_repo_files(repo_path, extension='rpm', hostname=None):
@@ -36,27 +37,16 @@ def get_repo_files(repo_path, extension='rpm', hostname=None):
 def get_repo_files_urls_by_url(url, extension='rpm'):
     """Returns a list of URLs of repo files (for example rpms) in a specific repository
     published at some URL.
+
+    The packages are read from the repository metadata, other files and repositories without
+    metadata are listed from the index pages, see
+    :class:`robottelo.utils.repo_inspector.RepositoryInspector`.
+
     :param url: URL where the repo or CV is published
     :param extension: extension of searched files. Defaults to 'rpm'
     :return:  list representing package URLs
     """
-    if not url.endswith('/'):
-        url += '/'
-
-    result = requests.get(url, verify=False)
-    if result.status_code != 200:
-        raise requests.HTTPError(f'{url} is not accessible')
-
-    links = re.findall(r'(?<=href=")(?!\.\.).*?(?=">)', result.text)
-    if 'Packages/' not in links:
-        files = sorted(line for line in links if extension in line)
-        return [f'{url}{file}' for file in files]
-
-    files = []
-    subs = get_repo_files_urls_by_url(f'{url}Packages/', extension='/')
-    for sub in subs:
-        files.extend(get_repo_files_urls_by_url(sub, extension))
-    return sorted(files)
+    return inspector.file_urls(url, extension)
 
 
 def get_repo_files_by_url(url, extension='rpm'):
@@ -69,6 +59,16 @@ def get_repo_files_by_url(url, extension='rpm'):
     return sorted([os.path.basename(f) for f in get_repo_files_urls_by_url(url, extension)])
 
 
+def get_repo_packages_by_url(url):
+    """Returns the packages of a repository published at some URL, read from its metadata
+
+    :param url: URL where the repo or CV is published
+    :return: list of :class:`robottelo.utils.repo_inspector.Package` with the name, NEVRA and
+        checksum of each package
+    """
+    return inspector.packages(url)
+
+
 def get_baseurl_by_repofile(repo_url, verify_ssl=True):
     """
     Returns the baseurl from a remote yum .repo file.
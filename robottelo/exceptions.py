@@ -64,13 +64,29 @@ class DownloadFileError(Exception):
 
 
 class CLIFactoryError(Exception):
-    """Indicates an error occurred while creating an entity using hammer"""
+    """Indicates an error occurred while creating an entity using hammer
+
+    :param results: the entities created when several were created at once, ``None`` for the
+        ones that failed
+    """
+
+    def __init__(self, *args, results=None):
+        super().__init__(*args)
+        self.results = results
 
 
 class CLIError(Exception):
     """Indicates that a CLI command could not be run."""
 
 
+class PersistentShellError(CLIError):
+    """Indicates that the channel of a persistent shell was closed."""
+
+
+class PersistentShellUnsupportedError(PersistentShellError):
+    """Indicates that the ssh backend can not read a shell channel while it is open."""
+
+
 class CapsuleHostError(Exception):
     """Indicates error in capsule configuration etc"""
 
@@ -136,3 +152,17 @@ class CLIDataBaseError(CLIBaseError):
 
 class NoManifestProvidedError(Exception):
     """Raised when a manifest is not provided to a helper function that expects one"""
+
+
+class HostGroupError(Exception):
+    """Indicates that an action failed on some hosts of a group
+
+    :param failures: ``(host, exception)`` pairs of the hosts the action failed on
+    :param results: the results of all the hosts, failed hosts hold their exception
+    """
+
+    def __init__(self, failures, results=None):
+        self.failures = failures
+        self.results = results
+        details = '\n'.join(f'{host}: {err!r}' for host, err in failures)
+        super().__init__(f'Failed on {len(failures)} host(s):\n{details}')
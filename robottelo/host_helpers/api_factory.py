@@ -21,6 +21,7 @@ from robottelo.constants import (
 )
 from robottelo.exceptions import APIResponseError
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
+from robottelo.host_helpers.task_watcher import TaskWatcher
 
 
 class APIFactory:
@@ -435,52 +436,50 @@ class APIFactory:
         :param int from_when: Epoch Time (seconds in UTC) to limit number of returned tasks to investigate.
         :param int search_rate: Delay between searches.
         :param int max_tries: How many times search should be executed.
-        :param int poll_rate: Delay between the end of one task check-up and
-                the start of the next check-up. Parameter for
-                ``nailgun.entities.ForemanTask.poll()`` method.
+        :param int poll_rate: Delay between two check-ups of the tasks found, at first.
+                Parameter for ``TaskWatcher``.
         :param int poll_timeout: Maximum number of seconds to wait until timing out.
-                Parameter for ``nailgun.entities.ForemanTask.poll()`` method.
-        :return: Relevant errata applicability task.
+                Parameter for ``TaskWatcher``.
+        :return: Relevant errata applicability tasks.
         :raises: ``AssertionError``. If not tasks were found for given host until timeout.
         """
         assert isinstance(host_id, int), 'Param host_id have to be int'
         assert isinstance(from_when, int), 'Param from_when have to be int'
         now = int(time.time())
         assert from_when <= now, 'Param from_when have to be epoch time in the past'
-        for _ in range(max_tries):
-            now = int(time.time())
-            # Format epoch time for search, one second prior margin of safety
-            timestamp = datetime.fromtimestamp(from_when - 1).strftime('%m-%d-%Y %H:%M:%S')
-            # Long format to match search: ex. 'January 03, 2024 at 03:08:08 PM'
-            long_format = datetime.strptime(timestamp, '%m-%d-%Y %H:%M:%S').strftime(
-                '%B %d, %Y at %I:%M:%S %p'
-            )
-            search_query = (
-                '( label = Actions::Katello::Applicability::Hosts::BulkGenerate OR'
-                ' label = Actions::Katello::Host::UploadPackageProfile ) AND'
-                f' started_at >= "{long_format}" '
+        # Format epoch time for search, one second prior margin of safety
+        timestamp = datetime.fromtimestamp(from_when - 1).strftime('%m-%d-%Y %H:%M:%S')
+        # Long format to match search: ex. 'January 03, 2024 at 03:08:08 PM'
+        long_format = datetime.strptime(timestamp, '%m-%d-%Y %H:%M:%S').strftime(
+            '%B %d, %Y at %I:%M:%S %p'
+        )
+        search_query = (
+            '( label = Actions::Katello::Applicability::Hosts::BulkGenerate OR'
+            ' label = Actions::Katello::Host::UploadPackageProfile ) AND'
+            f' started_at >= "{long_format}" '
+        )
+
+        def is_host_task(task):
+            return (
+                task.label == 'Actions::Katello::Applicability::Hosts::BulkGenerate'
+                and 'host_ids' in task.input
+                and host_id in task.input['host_ids']
+            ) or (
+                task.label == 'Actions::Katello::Host::UploadPackageProfile'
+                and 'host' in task.input
+                and host_id == task.input['host']['id']
             )
-            tasks = self._satellite.api.ForemanTask().search(query={'search': search_query})
-            tasks_finished = 0
-            for task in tasks:
-                if (
-                    task.label == 'Actions::Katello::Applicability::Hosts::BulkGenerate'
-                    and 'host_ids' in task.input
-                    and host_id in task.input['host_ids']
-                ) or (
-                    task.label == 'Actions::Katello::Host::UploadPackageProfile'
-                    and 'host' in task.input
-                    and host_id == task.input['host']['id']
-                ):
-                    task.poll(poll_rate=poll_rate, timeout=poll_timeout)
-                    tasks_finished += 1
-            if tasks_finished > 0:
-                break
-            time.sleep(search_rate)
-        else:
+
+        watcher = TaskWatcher(self._satellite, poll_rate=poll_rate, timeout=poll_timeout)
+        watcher.watch_query(
+            search_query, max_tries=max_tries, search_rate=search_rate, select=is_host_task
+        )
+        try:
+            return watcher.wait()
+        except AssertionError as err:
             raise AssertionError(
                 f'No task was found using query " {search_query} " for host id: {host_id}'
-            )
+            ) from err
 
     def register_host_and_needed_setup(
         self,
@@ -1,4 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from functools import partial
 import time
 
 from box import Box
@@ -12,10 +14,140 @@ from robottelo.constants import (
     PUPPET_COMMON_INSTALLER_OPTS,
 )
 from robottelo.enums import NetworkType
+from robottelo.host_helpers.task_watcher import TaskWatcher
 from robottelo.logging import logger
 from robottelo.utils.installer import InstallerCommand
 
 
+def _downloaded_artifacts(task):
+    """Return the number of artifacts downloaded so far by the pulp tasks of a sync task"""
+    output = getattr(task, 'output', None) or {}
+    reports = [
+        report
+        for pulp_task in output.get('pulp_tasks') or []
+        for report in pulp_task.get('progress_reports') or []
+        if report.get('code') == 'sync.downloading.artifacts'
+    ]
+    return sum(report.get('done') or 0 for report in reports) if reports else None
+
+
+def _log_sync_progress(hostname, waiting_since, task):
+    progress = getattr(task, 'progress', None)
+    downloaded = _downloaded_artifacts(task)
+    logger.info(
+        f'Capsule {hostname} sync task {task.id}: '
+        f'{"unknown" if progress is None else f"{progress * 100:.0f}%"} done, '
+        f'{"no" if downloaded is None else downloaded} artifacts downloaded, '
+        f'{time.monotonic() - waiting_since:.0f}s elapsed'
+    )
+
+
+def _sync_task_finished(result, waiting_since, task):
+    result.tasks.append(task)
+    result.waited = time.monotonic() - waiting_since
+    logger.info(
+        f'Capsule {result.hostname} sync task {task.id} finished after {result.waited:.0f}s, '
+        f'result: {task.result}.'
+    )
+
+
+def wait_for_capsules_sync(capsules, start_time=None, timeout=600):
+    """Wait for the content sync of several capsules to finish and assert success.
+
+    Same checks as ``wait_for_sync`` for all the capsules at once: their sync status is read
+    concurrently, and the active sync tasks of the capsules of a Satellite are watched together
+    by a ``TaskWatcher``, logging the progress of each capsule.
+
+    :param capsules: the Capsule hosts.
+    :param start_time: (datetime): UTC time to compare against capsules' last_sync_time.
+        Default: None (current UTC).
+    :param timeout: (int) maximum seconds for active task(s) and queries to finish.
+    :return: list of Box, one by capsule in the order of ``capsules``, with the keys:
+        ``hostname``; ``tasks``, the sync tasks that were active, in the order they finished;
+        ``last_sync_time``; ``sync_duration``, the seconds from ``start_time`` to
+        ``last_sync_time``; and ``waited``, the seconds until the last active sync task of the
+        capsule finished.
+    """
+    capsules = list(capsules)
+    if not capsules:
+        return []
+    waiting_since = time.monotonic()
+    # Current UTC time for start_time, if not provided
+    if start_time is None:
+        start_time = datetime.now(UTC).replace(microsecond=0)
+    # 1s margin of safety for rounding
+    start_time = (
+        (start_time - timedelta(seconds=1)).replace(microsecond=0).strftime('%Y-%m-%d %H:%M:%S UTC')
+    )
+
+    def get_sync_status(capsule):
+        return capsule.nailgun_capsule.content_get_sync(timeout=timeout, synchronous=True)
+
+    # Fetch initial capsules sync status
+    logger.info(f"Waiting for capsules {[c.hostname for c in capsules]} sync to finish ...")
+    with ThreadPoolExecutor(max_workers=len(capsules)) as executor:
+        sync_statuses = list(executor.map(get_sync_status, capsules))
+    results = []
+    watchers = {}
+    for capsule, sync_status in zip(capsules, sync_statuses, strict=True):
+        # Assert presence of recent sync activity:
+        #   one or more ongoing sync tasks for the capsule,
+        #   Or, capsule's last_sync_time is on or after start_time
+        assert len(sync_status['active_sync_tasks']) or (
+            parse(sync_status['last_sync_time']) >= parse(start_time)
+        ), (
+            f"No active or recent sync found for capsule {capsule.hostname}."
+            f" `active_sync_tasks` was empty: {sync_status['active_sync_tasks']},"
+            f" and the `last_sync_time`: {sync_status['last_sync_time']},"
+            f" was prior to the `start_time`: {start_time}."
+        )
+        logger.info(
+            f"Active tasks of capsule {capsule.hostname}: {sync_status['active_sync_tasks']}"
+        )
+        result = Box(hostname=capsule.hostname, tasks=[], waited=0.0)
+        results.append(result)
+        # the active sync tasks of all the capsules of a Satellite are refreshed together
+        satellite = capsule.satellite
+        watcher = watchers.setdefault(satellite.hostname, TaskWatcher(satellite, timeout=timeout))
+        watcher.watch(
+            sync_status['active_sync_tasks'],
+            callback=partial(_sync_task_finished, result, waiting_since),
+            progress=partial(_log_sync_progress, capsule.hostname, waiting_since),
+        )
+    # Wait and verify succeeds, any active sync task from initial status.
+    with ThreadPoolExecutor(max_workers=len(watchers)) as executor:
+        list(executor.map(TaskWatcher.wait, watchers.values()))
+
+    # Fetch updated capsules status (expect no ongoing sync)
+    logger.info(f"Querying updated sync status from capsules {[c.hostname for c in capsules]}.")
+    with ThreadPoolExecutor(max_workers=len(capsules)) as executor:
+        updated_statuses = list(executor.map(get_sync_status, capsules))
+    for capsule, updated_status, result in zip(capsules, updated_statuses, results, strict=True):
+        # Last sync task end time is the same as capsule's last sync time.
+        assert parse(updated_status['last_sync_time']) == parse(
+            updated_status['last_sync_task']['ended_at']
+        ), f"`last_sync_time` does not match final task's end time. Capsule: {capsule.hostname}"
+
+        # Total time taken is not negative (sync prior to start_time),
+        # and did not exceed timeout.
+        sync_duration = parse(updated_status['last_sync_time']) - parse(start_time)
+        assert timedelta(seconds=0) <= sync_duration <= timedelta(seconds=timeout), (
+            f"No recent sync task(s) were found for capsule: {capsule.hostname}, or task(s) timed out."
+            f" `last_sync_time`: ({updated_status['last_sync_time']}) was prior to `start_time`: ({start_time})"
+            f" or exceeded timeout ({timeout}s)."
+        )
+        # No failed or active tasks remaining
+        assert len(updated_status['last_failed_sync_tasks']) == 0
+        assert len(updated_status['active_sync_tasks']) == 0
+        result.last_sync_time = updated_status['last_sync_time']
+        result.sync_duration = sync_duration.total_seconds()
+        logger.info(
+            f"Capsule {capsule.hostname} synced in {result.sync_duration:.0f}s"
+            f" (waited {result.waited:.0f}s for {len(result.tasks)} active task(s))."
+        )
+    return results
+
+
 class EnablePluginsCapsule:
     """Miscellaneous settings helper methods"""
 
@@ -45,30 +177,29 @@ class CapsuleInfo:
         poll_timeout=None,
         must_succeed=True,
     ):
-        """Search for tasks by specified search query and poll them to ensure that
-        task has finished.
+        """Search for tasks by specified search query and wait for them to finish.
 
         :param search_query: Search query that will be passed to API call.
         :param search_rate: Delay between searches.
         :param max_tries: How many times search should be executed.
-        :param poll_rate: Delay between the end of one task check-up and
-            the start of the next check-up. Parameter for ``sat.api.ForemanTask.poll()`` method.
+        :param poll_rate: Delay between two check-ups of the tasks found, at first.
+            Parameter for ``TaskWatcher``.
         :param poll_timeout: Maximum number of seconds to wait until timing out.
-            Parameter for ``sat.api.ForemanTask.poll()`` method.
+            Parameter for ``TaskWatcher``.
         :param must_succeed: Assert success result on finished task.
-        :return: List of ``sat.api.ForemanTask`` entities.
+        :return: List of ``sat.api.ForemanTask`` entities of the finished tasks.
         :raises: ``AssertionError``. If not tasks were found until timeout.
         """
-        for _ in range(max_tries):
-            tasks = self.satellite.api.ForemanTask().search(query={'search': search_query})
-            if tasks:
-                for task in tasks:
-                    task.poll(poll_rate=poll_rate, timeout=poll_timeout, must_succeed=must_succeed)
-                break
-            time.sleep(search_rate)
-        else:
-            raise AssertionError(f"No task was found using query '{search_query}'")
-        return tasks
+        return (
+            TaskWatcher(self.satellite, poll_rate=poll_rate, timeout=poll_timeout)
+            .watch_query(
+                search_query,
+                max_tries=max_tries,
+                search_rate=search_rate,
+                must_succeed=must_succeed,
+            )
+            .wait()
+        )
 
     def wait_for_sync(self, start_time=None, timeout=600):
         """Wait for capsule sync to finish and assert success.
@@ -88,61 +219,7 @@ class CapsuleInfo:
         :return:
             list of polled finished tasks that were in-progress from `active_sync_tasks`.
         """
-        # Fetch initial capsule sync status
-        logger.info(f"Waiting for capsule {self.hostname} sync to finish ...")
-        sync_status = self.nailgun_capsule.content_get_sync(timeout=timeout, synchronous=True)
-        # Current UTC time for start_time, if not provided
-        if start_time is None:
-            start_time = datetime.now(UTC).replace(microsecond=0)
-        # 1s margin of safety for rounding
-        start_time = (
-            (start_time - timedelta(seconds=1))
-            .replace(microsecond=0)
-            .strftime('%Y-%m-%d %H:%M:%S UTC')
-        )
-        # Assert presence of recent sync activity:
-        #   one or more ongoing sync tasks for the capsule,
-        #   Or, capsule's last_sync_time is on or after start_time
-        assert len(sync_status['active_sync_tasks']) or (
-            parse(sync_status['last_sync_time']) >= parse(start_time)
-        ), (
-            f"No active or recent sync found for capsule {self.hostname}."
-            f" `active_sync_tasks` was empty: {sync_status['active_sync_tasks']},"
-            f" and the `last_sync_time`: {sync_status['last_sync_time']},"
-            f" was prior to the `start_time`: {start_time}."
-        )
-        sync_tasks = []
-        # Poll and verify succeeds, any active sync task from initial status.
-        logger.info(f"Active tasks: {sync_status['active_sync_tasks']}")
-        for task in sync_status['active_sync_tasks']:
-            sync_tasks.append(self.satellite.api.ForemanTask(id=task['id']).poll(timeout=timeout))
-            logger.info(f"Active sync task :id {task['id']} succeeded.")
-
-        # Fetch updated capsule status (expect no ongoing sync)
-        logger.info(f"Querying updated sync status from capsule {self.hostname}.")
-        updated_status = self.nailgun_capsule.content_get_sync(timeout=timeout, synchronous=True)
-        # Last sync task end time is the same as capsule's last sync time.
-        assert parse(updated_status['last_sync_time']) == parse(
-            updated_status['last_sync_task']['ended_at']
-        ), f"`last_sync_time` does not match final task's end time. Capsule: {self.hostname}"
-
-        # Total time taken is not negative (sync prior to start_time),
-        # and did not exceed timeout.
-        assert (
-            timedelta(seconds=0)
-            <= parse(updated_status['last_sync_time']) - parse(start_time)
-            <= timedelta(seconds=timeout)
-        ), (
-            f"No recent sync task(s) were found for capsule: {self.hostname}, or task(s) timed out."
-            f" `last_sync_time`: ({updated_status['last_sync_time']}) was prior to `start_time`: ({start_time})"
-            f" or exceeded timeout ({timeout}s)."
-        )
-        # No failed or active tasks remaining
-        assert len(updated_status['last_failed_sync_tasks']) == 0
-        assert len(updated_status['active_sync_tasks']) == 0
-
-        # return any polled sync tasks, that were initially in-progress
-        return sync_tasks
+        return wait_for_capsules_sync([self], start_time=start_time, timeout=timeout)[0].tasks
 
     def get_published_repo_url(self, org, prod, repo, lce=None, cv=None):
         """Forms url of a repo or CV published on a Satellite or Capsule.
@@ -27,13 +27,16 @@ from fauxfactory import (
 )
 
 from robottelo import constants
+from robottelo.cli.base import LazyInfoBox
 from robottelo.cli.proxy import CapsuleTunnelError
 from robottelo.config import settings
 from robottelo.exceptions import CLIFactoryError, CLIReturnCodeError
 from robottelo.host_helpers.repository_mixins import initiate_repo_helpers
 
 
-def create_object(cli_object, options, values=None, credentials=None, timeout=None):
+def create_object(
+    cli_object, options, values=None, credentials=None, timeout=None, fields=None, lazy=False
+):
     """
     Creates <object> with dictionary of arguments.
 
@@ -42,28 +45,76 @@ def create_object(cli_object, options, values=None, credentials=None, timeout=No
         create
     :param dict values: Custom values to override default ones.
     :param list|tuple credentials: Username and password for non-default user.
+    :param fields: The fields of the resource the caller needs. When the create command of the
+        entity already returns them all, the resource is not fetched with info right away.
+    :param bool lazy: Shortcut for ``fields`` set to the fields the create command returns.
     :raise robottelo.host_helpers.cli_factory.CLIFactoryError: Raise an exception if object
         cannot be created.
     :rtype: dict
-    :return: A dictionary representing the newly created resource.
+    :return: A dictionary representing the newly created resource. When ``fields`` or ``lazy``
+        are given, it may be a LazyInfoBox that only fetches the rest of the resource when it
+        is accessed.
 
     """
     options.update(values or {})
     if credentials:
         cli_object = cli_object.with_user(*credentials)
+    if lazy:
+        fields = cli_object.create_output_fields
+    create_kwargs = {}
+    if fields:
+        create_kwargs['fields'] = fields
     try:
-        result = cli_object.create(options, timeout)
+        result = cli_object.create(options, timeout, **create_kwargs)
     except CLIReturnCodeError as err:
         # If the object is not created, raise exception, stop the show.
         raise CLIFactoryError(
             f'Failed to create {cli_object.__name__} with data:\n{pprint.pformat(options, indent=2)}\n{err.msg}'
         ) from err
+    if isinstance(result, LazyInfoBox):
+        return result
     # Sometimes we get a list with a dictionary and not a dictionary.
     if isinstance(result, list) and len(result) > 0:
         result = result[0]
     return Box(result)
 
 
+def create_objects(cli_object, options_list, credentials=None, timeout=None):
+    """
+    Creates several <object>s, one per dictionary of arguments.
+
+    All creates run in a single remote call and so do the follow-up info calls,
+    see :meth:`robottelo.cli.base.Base.create_many`.
+
+    :param cli_object: A valid CLI object.
+    :param list options_list: The options of each object to create.
+    :param list|tuple credentials: Username and password for non-default user.
+    :raise robottelo.host_helpers.cli_factory.CLIFactoryError: Raise an exception if any object
+        cannot be created, its ``results`` hold the objects that were created, ``None`` for
+        the others.
+    :rtype: list
+    :return: A list of dictionaries representing the newly created resources, in order.
+
+    """
+    if credentials:
+        cli_object = cli_object.with_user(*credentials)
+    try:
+        results = cli_object.create_many(options_list, timeout)
+    except CLIReturnCodeError as err:
+        results = getattr(err, 'results', None)
+        raise CLIFactoryError(
+            f'Failed to create {cli_object.__name__} objects with data:\n'
+            f'{pprint.pformat(options_list, indent=2)}\n{err.msg}',
+            results=results and [None if result is None else _box(result) for result in results],
+        ) from err
+    return [_box(result) for result in results]
+
+
+def _box(result):
+    # Sometimes we get a list with a dictionary and not a dictionary.
+    return Box(result[0] if isinstance(result, list) and len(result) > 0 else result)
+
+
 """
 The following dictionary is used to define the simple make methods in this factory.
 Each key corresponds to the name of the entity (e.g. make_<entity_name>)
@@ -257,27 +308,63 @@ class CLIFactory:
         The keys in the dictionary above correspond to potential make_<key> methods
         These are all basic cases where the make method just need some default values.
         For more complex make methods, we define them in methods below.
+
+        make_<key> methods accept the ``fields`` and ``lazy`` arguments of ``create_object``
+        to skip fetching the new entity with info. make_many_<key> methods create several
+        entities at once, see ``_make_many``.
         """
-        fields = ENTITY_FIELDS.get(name.replace('make_', ''))
-        if isinstance(fields, dict):
-            # someone is attempting to use a make_<entity> method
-            if setup := fields.get('_setup'):
-                # check for an evaluate _setup fields
-                fields['_setup_res'] = setup(
-                    *fields.get('_setup_args', []), **fields.get('_setup_kwargs', {})
-                )
-            # sometimes entity class names don't match the make_<entity> pattern
-            entity_cls = self._find_entity_class(
-                fields.get('_entity_cls', name.replace('make_', ''))
-            )
-            # some make_<entity> calls redirect to other methods
-            if redirect := fields.get('_redirect'):
-                return self.__getattr__(redirect)
-            # evaluate functions that provide default values
-            fields = self._evaluate_functions(fields)
-            return partial(create_object, entity_cls, fields)
+        if name.startswith('make_many_'):
+            entity_name = name.replace('make_many_', '')
+            if isinstance(ENTITY_FIELDS.get(entity_name), dict):
+                return partial(self._make_many, entity_name)
+        elif entity := self._resolve_entity(name.replace('make_', '')):
+            return partial(create_object, *entity)
         raise AttributeError(f'unknown factory method name: {name}')
 
+    def _resolve_entity(self, entity_name):
+        """Return the cli class and default options of a make_<entity> method, if there is one"""
+        fields = ENTITY_FIELDS.get(entity_name)
+        if not isinstance(fields, dict):
+            return None
+        # someone is attempting to use a make_<entity> method
+        if setup := fields.get('_setup'):
+            # check for an evaluate _setup fields
+            fields['_setup_res'] = setup(
+                *fields.get('_setup_args', []), **fields.get('_setup_kwargs', {})
+            )
+        # sometimes entity class names don't match the make_<entity> pattern
+        entity_cls = self._find_entity_class(fields.get('_entity_cls', entity_name))
+        # some make_<entity> calls redirect to other methods
+        if redirect := fields.get('_redirect'):
+            return self._resolve_entity(redirect)
+        # evaluate functions that provide default values
+        return entity_cls, self._evaluate_functions(fields)
+
+    def _make_many(self, entity_name, count=None, options=None, credentials=None, timeout=None):
+        """Create ``count`` entities with a single remote call for all creates
+
+        :param count: number of entities to create, defaults to the length of ``options``
+        :param options: dictionary of options shared by all entities,
+            or a list with a dictionary of options per entity
+        :returns: list of Box objects, in order
+        """
+        if isinstance(options, list):
+            count = len(options) if count is None else count
+            if count != len(options):
+                raise CLIFactoryError(f'Got {len(options)} sets of options for {count} entities')
+        elif count is None:
+            raise CLIFactoryError(
+                f'make_many_{entity_name} needs a count or a list of options per entity'
+            )
+        else:
+            options = [options] * count
+        options_list = []
+        for entity_options in options:
+            # defaults are evaluated again for each entity, to get unique names etc.
+            entity_cls, fields = self._resolve_entity(entity_name)
+            options_list.append({**fields, **(entity_options or {})})
+        return create_objects(entity_cls, options_list, credentials=credentials, timeout=timeout)
+
     def _evaluate_function(self, function):
         """Some functions may require an instance reference"""
         if 'self' in inspect.signature(function).parameters:
@@ -299,9 +386,9 @@ class CLIFactory:
     @lru_cache
     def _find_entity_class(self, entity_name):
         entity_name = entity_name.replace('_', '').lower()
-        for name, class_obj in self._satellite.cli.__dict__.items():
+        for name in dir(self._satellite.cli):
             if entity_name == name.lower():
-                return class_obj
+                return getattr(self._satellite.cli, name)
         return None
 
     def make_content_credential(self, options=None):
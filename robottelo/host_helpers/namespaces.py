@@ -0,0 +1,91 @@
+"""Lazy ``cli`` and ``api`` namespaces of Satellite and Capsule hosts.
+
+Every host gets its own copy of the robottelo cli classes and of the nailgun entity classes,
+bound to its hostname and server config. The classes to copy, the templates, are looked up once
+per process, and each host namespace only creates the copies it is asked for.
+
+Example:
+    >>> api = LazyNamespace(
+    ...     nailgun_entity_templates, functools.partial(bind_entity, server_config=config)
+    ... )
+    >>> api.Organization().search()  # only Organization is copied
+"""
+
+from functools import cache, partialmethod
+import importlib
+import pkgutil
+
+import robottelo.cli
+from robottelo.cli.base import Base
+
+_entity_templates = {}
+
+
+@cache
+def cli_templates(prefix=''):
+    """Return the robottelo cli classes of the modules whose name starts with ``prefix``"""
+    templates = {}
+    for module_info in sorted(pkgutil.iter_modules(robottelo.cli.__path__), key=lambda m: m.name):
+        if module_info.name.startswith('_') or not module_info.name.startswith(prefix):
+            continue
+        cli_module = importlib.import_module(f'robottelo.cli.{module_info.name}')
+        for name, obj in cli_module.__dict__.items():
+            if isinstance(obj, type) and issubclass(obj, Base):
+                templates[name] = obj
+    return templates
+
+
+def nailgun_entity_templates():
+    """Return the nailgun entity classes of the nailgun currently imported"""
+    from nailgun import entities
+    from nailgun.entity_mixins import Entity
+
+    if entities not in _entity_templates:
+        # nailgun was reinstalled and imported again, forget the entities of the previous one
+        _entity_templates.clear()
+        _entity_templates[entities] = {
+            name: obj
+            for name, obj in entities.__dict__.items()
+            if isinstance(obj, type) and issubclass(obj, Entity)
+        }
+    return _entity_templates[entities]
+
+
+def bind_entity(name, template, server_config):
+    """Return a copy of a nailgun entity class using ``server_config`` by default"""
+    return type(
+        name,
+        (template,),
+        {'__init__': partialmethod(template.__init__, server_config=server_config)},
+    )
+
+
+class LazyNamespace:
+    """Namespace of host bound classes, created on first access
+
+    :param templates: callable returning the classes of the namespace by name
+    :param bind: callable returning the host bound copy of a class from its name and the class
+    """
+
+    def __init__(self, templates, bind):
+        self._templates = templates
+        self._bind = bind
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            template = self._templates()[name]
+        except KeyError:
+            raise AttributeError(f'{type(self).__name__} has no attribute {name!r}') from None
+        bound = self._bind(name, template)
+        # next lookups find it without calling __getattr__
+        setattr(self, name, bound)
+        return bound
+
+    def __dir__(self):
+        return sorted(self._templates())
+
+    def bound_classes(self):
+        """Return the classes created so far by name"""
+        return {name: obj for name, obj in vars(self).items() if not name.startswith('_')}
@@ -0,0 +1,289 @@
+"""Long-lived ``psql`` process on a Satellite, used by :meth:`robottelo.hosts.Capsule.query_db`.
+
+Every ``query_db`` call starts ``sudo -u postgres psql`` over ssh and fetches the whole result as
+one ``json_agg`` document. :class:`PsqlSession` instead keeps one ``psql`` process running per
+host, database and thread, fed over the channel of a :class:`robottelo.utils.ssh.PersistentShell`
+and started again when it is found dead:
+
+* several statements are sent in a single round trip with :meth:`PsqlSession.batch`
+* query parameters are quoted as SQL literals with :func:`format_query`
+* :meth:`PsqlSession.copy_rows` streams the rows of large tables using ``COPY ... TO STDOUT``,
+  the rows are parsed while they are read instead of being decoded as a single document
+
+Every statement is followed by an ``\\echo`` of a marker holding the ``ERROR`` and
+``LAST_ERROR_MESSAGE`` variables of psql, so the output and the failures of the statements can
+be told apart.
+
+Enable it for ``query_db`` with ``performance.psql_session``.
+
+Example:
+    >>> psql = target_sat.psql_session()
+    >>> psql.query('SELECT id, name FROM katello_repositories WHERE name = %s', ['zoo'])
+    >>> for row in psql.copy_rows('SELECT * FROM katello_rpms'):
+    ...     ...
+"""
+
+import csv
+from datetime import date, datetime
+import json
+import threading
+import uuid
+
+from robottelo.exceptions import (
+    CLIError,
+    CLIReturnCodeError,
+    PersistentShellError,
+    PersistentShellUnsupportedError,
+)
+from robottelo.logging import logger
+from robottelo.utils.ssh import PersistentShell
+
+PSQL_LOG_PATH = '/tmp/robottelo_psql.log'
+# psql settings: no psqlrc, quiet, unaligned tuples only, keep going after a failed statement
+PSQL_OPTIONS = '-X -q -A -t -v ON_ERROR_STOP=0'
+# meta-commands surrounding a statement whose output is returned as ``psql -c`` prints it
+_ALIGNED_ON = '\\pset format aligned\n\\pset tuples_only off'
+_ALIGNED_OFF = '\\pset format unaligned\n\\pset tuples_only on'
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+# set once the ssh backend is known not to support persistent shells
+_unsupported = None
+
+
+def literal(value):
+    """Return ``value`` as a SQL literal
+
+    ``None`` is ``NULL``, lists are arrays and tuples are lists of values for ``IN``.
+    Strings are quoted for ``standard_conforming_strings``, the default since PostgreSQL 9.1.
+    """
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int | float):
+        return repr(value)
+    if isinstance(value, list):
+        return f'ARRAY[{", ".join(literal(item) for item in value)}]'
+    if isinstance(value, tuple):
+        return f'({", ".join(literal(item) for item in value)})'
+    if isinstance(value, datetime | date):
+        value = value.isoformat()
+    value = str(value)
+    if '\x00' in value:
+        raise ValueError('SQL literals can not contain NUL characters')
+    return "'{}'".format(value.replace("'", "''"))
+
+
+def format_query(query, params=None):
+    """Substitute ``params`` in ``query`` as SQL literals
+
+    Placeholders are ``%s`` for a sequence of parameters and ``%(name)s`` for a dict of
+    parameters, a literal ``%`` is written ``%%`` when parameters are given.
+    """
+    if params is None:
+        return query
+    if isinstance(params, dict):
+        return query % {name: literal(value) for name, value in params.items()}
+    return query % tuple(literal(value) for value in params)
+
+
+def _statement(query, params=None):
+    """Return the statement of a query and its parameters, terminated by a single ``;``"""
+    return f'{format_query(query, params).strip().rstrip(";").rstrip()};'
+
+
+class PsqlSession:
+    """A long-lived ``psql`` process on a host, driven over an ssh channel
+
+    The session is not shared between threads, see :func:`get_psql_session`.
+
+    :param host: the host running the database, usually a Satellite
+    :param db: the database the process is connected to
+    """
+
+    def __init__(self, host, db='foreman'):
+        self.host = host
+        self.db = db
+        self.marker = f'ROBOTTELO-PSQL-{uuid.uuid4().hex}'
+        self._null = f'{self.marker}-NULL'
+        self._shell = None
+        self._busy = False
+
+    @property
+    def running(self):
+        return self._shell is not None and self._shell.running
+
+    def start(self):
+        """Start the psql process, on its own ssh connection to the host
+
+        :raises robottelo.exceptions.PersistentShellUnsupportedError: if the ssh backend can not
+            read the channel of a shell
+        """
+        global _unsupported
+        if _unsupported is not None:
+            raise _unsupported
+        logger.debug(f'Starting persistent psql process on {self.host.hostname} for {self.db}')
+        self._shell = PersistentShell(
+            self.host.hostname,
+            username=getattr(self.host, 'username', None),
+            password=getattr(self.host, 'password', None),
+            port=getattr(self.host, 'port', None),
+            key_filename=getattr(self.host, 'key_filename', None),
+        )
+        try:
+            self._shell.open()
+        except PersistentShellUnsupportedError as err:
+            _unsupported = err
+            self._shell = None
+            raise
+        self._shell.send(
+            f'PGCLIENTENCODING=UTF8 exec sudo -u postgres psql {PSQL_OPTIONS} -d {self.db} '
+            f'2>>{PSQL_LOG_PATH}'
+        )
+        self._shell.send(f'\\echo {self.marker}')
+        while (line := self._readline()) != self.marker:
+            logger.debug(f'psql on {self.host.hostname}: {line}')
+
+    def close(self):
+        """Stop the psql process"""
+        if self._shell is not None:
+            self._shell.close()
+        self._shell = None
+        self._busy = False
+
+    def _readline(self):
+        try:
+            return self._shell.readline()
+        except PersistentShellError as err:
+            self.close()
+            raise CLIError(f'Persistent psql process on {self.host.hostname} exited') from err
+
+    def _send(self, statements):
+        """Send statements in one write, each one followed by its marker
+
+        A process found dead is started again first, and once more when the write fails since
+        none of the statements ran.
+        """
+        if self._busy:
+            raise CLIError(f'psql session on {self.host.hostname} is still streaming rows')
+        text = '\n'.join(
+            f'{statement}\n\\echo {self.marker} :ERROR :LAST_ERROR_MESSAGE'
+            for statement in statements
+        )
+        if not (self._shell and self._shell.alive()):
+            self.close()
+            self.start()
+        try:
+            self._shell.send(text)
+        except Exception as err:
+            logger.debug(f'Restarting persistent psql process on {self.host.hostname}: {err}')
+            self.close()
+            self.start()
+            self._shell.send(text)
+
+    def _lines(self, status):
+        """Yield the output lines of the next statement, store its failure in ``status``"""
+        while not (line := self._readline()).startswith(f'{self.marker} '):
+            yield line
+        _, failed, message = f'{line} '.split(' ', 2)
+        status['error'] = message.strip() if failed == 'true' else None
+
+    def batch(self, queries, output_format='json'):
+        """Run several queries in a single round trip
+
+        The queries are run one after another even when one of them fails, use ``BEGIN`` and
+        ``COMMIT`` statements to run them in a transaction.
+
+        :param queries: queries as strings or ``(query, params)`` pairs
+        :param output_format: 'json' to return the rows of each query as a list of dicts,
+            the output of ``psql -c`` otherwise
+        :return: a list with the result of each query, in order
+        :raises robottelo.exceptions.CLIReturnCodeError: for the first query that failed
+        """
+        queries = [(query, None) if isinstance(query, str) else query for query in queries]
+        statements = [_statement(*query) for query in queries]
+        if output_format == 'json':
+            sent = [
+                f'SELECT json_agg(row_to_json(t)) FROM ({statement[:-1]}) t;'
+                for statement in statements
+            ]
+        else:
+            sent = [f'{_ALIGNED_ON}\n{statement}\n{_ALIGNED_OFF}' for statement in statements]
+        self._send(sent)
+        results, errors = [], []
+        for statement in statements:
+            status = {}
+            output = '\n'.join(self._lines(status))
+            if status['error']:
+                errors.append((statement, status['error']))
+            if output_format == 'json':
+                output = json.loads(output) if output.strip() and not status['error'] else []
+            results.append(output)
+        if errors:
+            statement, error = errors[0]
+            raise CLIReturnCodeError(1, error, f'"{statement}" failed')
+        return results
+
+    def query(self, query, params=None):
+        """Run a query and return its rows as a list of dicts"""
+        return self.batch([(query, params)])[0]
+
+    def execute(self, query, params=None):
+        """Run a statement and return its output as ``psql -c`` prints it"""
+        return self.batch([(query, params)], output_format='raw')[0]
+
+    def copy_rows(self, query, params=None):
+        """Yield the rows of a query as dicts, while they are read
+
+        The rows are streamed with ``COPY (query) TO STDOUT`` in the CSV format, the values are
+        strings or ``None``. The session can not run other queries until all the rows are read,
+        when the iteration stops early the psql process is stopped instead of reading the rest of
+        the rows, and started again by the next query.
+
+        :raises robottelo.exceptions.CLIReturnCodeError: if the query failed
+        """
+        statement = _statement(query, params)
+        self._send(
+            [
+                f'COPY ({statement[:-1]}) TO STDOUT '
+                f'WITH (FORMAT csv, HEADER true, NULL {literal(self._null)});'
+            ]
+        )
+        self._busy = True
+        status = {}
+        lines = self._lines(status)
+        try:
+            # the csv reader needs the line ends, to read the values spanning several lines
+            reader = csv.reader(f'{line}\n' for line in lines)
+            header = next(reader, None)
+            for row in reader:
+                yield {
+                    column: None if value == self._null else value
+                    for column, value in zip(header, row, strict=True)
+                }
+            # the marker ending the output
+            next(lines, None)
+        finally:
+            if 'error' not in status:
+                self.close()
+            self._busy = False
+        if status['error']:
+            raise CLIReturnCodeError(1, status['error'], f'"{statement}" failed')
+
+
+def get_psql_session(host, db='foreman'):
+    """Return the psql session of a host and database for the calling thread"""
+    key = (host.hostname, db, threading.get_ident())
+    with _sessions_lock:
+        if key not in _sessions:
+            _sessions[key] = PsqlSession(host, db=db)
+        return _sessions[key]
+
+
+def close_psql_sessions():
+    """Stop all persistent psql processes of this process"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
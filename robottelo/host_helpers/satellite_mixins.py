@@ -21,6 +21,7 @@ from robottelo.constants import (
     PUPPET_COMMON_INSTALLER_OPTS,
     PUPPET_SATELLITE_INSTALLER,
 )
+from robottelo.content_info import get_repo_files_by_url
 from robottelo.enums import NetworkType
 from robottelo.exceptions import CLIReturnCodeError, NoManifestProvidedError, SatelliteHostError
 from robottelo.host_helpers.api_factory import APIFactory
@@ -77,24 +78,7 @@ class ContentInfo:
         :param extension: extension of searched files. Defaults to 'rpm'
         :return:  list representing rpm package names
         """
-        if not url.endswith('/'):
-            url += '/'
-
-        result = requests.get(url, verify=False)
-        if result.status_code != 200:
-            raise requests.HTTPError(f'{url} is not accessible')
-
-        links = re.findall(r'(?<=href=").*?(?=">)', result.text)
-
-        if 'Packages/' not in links:
-            return sorted(line for line in links if extension in line)
-
-        files = []
-        subs = self.get_repo_files_by_url(f'{url}Packages/', extension='/')
-        for sub in subs:
-            files.extend(self.get_repo_files_by_url(f'{url}Packages/{sub}', extension))
-
-        return sorted(files)
+        return get_repo_files_by_url(url, extension)
 
     def get_repomd(self, repo_url):
         """Fetches content of the repomd file of a repository
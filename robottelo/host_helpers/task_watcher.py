@@ -0,0 +1,230 @@
+"""Wait for many foreman tasks with one ``foreman_tasks`` search per tick.
+
+Polling each task with ``ForemanTask.poll()`` makes one polling loop per task, each one making
+its own API calls. :class:`TaskWatcher` refreshes all the tasks it watches with a single
+``id ^ (...)`` search per tick, waiting longer between ticks while none of them changes.
+
+Tasks are watched by id, or by search query when they are not known yet, like the tasks started
+by a rake command.
+
+Example:
+    >>> watcher = TaskWatcher(satellite, timeout=1500)
+    >>> watcher.watch([repo.sync(synchronous=False) for repo in repos])
+    >>> watcher.watch_query('label = Actions::Katello::OrphanCleanup::RemoveOrphans')
+    >>> tasks = watcher.wait()
+"""
+
+import time
+
+from nailgun.entity_mixins import TaskFailedError, TaskTimedOutError
+
+from robottelo.logging import logger
+
+# states of the finished tasks, as nailgun.entity_mixins._poll_task
+FINISHED_STATES = ('paused', 'stopped')
+# default seconds between two ticks, the delay grows up to MAX_POLL_RATE while no task changes
+POLL_RATE = 1
+MAX_POLL_RATE = 15
+BACKOFF = 1.5
+# default seconds to wait for a task, from when it is watched, as nailgun.entity_mixins
+TASK_TIMEOUT = 300
+# number of task ids refreshed by a single search, and of tasks read per search query
+SEARCH_BATCH_SIZE = 100
+QUERY_PAGE_SIZE = 1000
+
+
+def _task_id(task):
+    """Return the id of a task given as an id, a task dict or a ``ForemanTask`` entity"""
+    if isinstance(task, dict):
+        return task['id']
+    return getattr(task, 'id', task)
+
+
+class _Query:
+    """Search for tasks not known yet"""
+
+    def __init__(self, search_query, max_tries, search_rate, select, must_succeed, callback):
+        self.search_query = search_query
+        self.max_tries = max_tries
+        self.search_rate = search_rate
+        self.select = select
+        self.must_succeed = must_succeed
+        self.callback = callback
+        self.tries = 0
+
+
+class TaskWatcher:
+    """Wait for foreman tasks of a Satellite, refreshing all of them together
+
+    :param satellite: the Satellite running the tasks
+    :param poll_rate: seconds between two ticks, after a tick where a task changed
+    :param max_poll_rate: maximum seconds between two ticks, while no task changes
+    :param timeout: seconds to wait for each task from when it is watched
+    :param fail_fast: raise ``TaskFailedError`` on the first task failing, instead of once all
+        the tasks finished
+    """
+
+    def __init__(
+        self,
+        satellite,
+        poll_rate=None,
+        max_poll_rate=MAX_POLL_RATE,
+        timeout=None,
+        fail_fast=True,
+    ):
+        self.satellite = satellite
+        self.poll_rate = poll_rate or POLL_RATE
+        self.max_poll_rate = max(max_poll_rate, self.poll_rate)
+        self.timeout = timeout or TASK_TIMEOUT
+        self.fail_fast = fail_fast
+        # the latest state of each task by id, in the order they were watched
+        self.tasks = {}
+        self.failed = []
+        self._watches = {}
+        self._finished = set()
+        self._queries = []
+
+    def watch(self, tasks, must_succeed=True, callback=None, progress=None):
+        """Watch tasks given as ids, task dicts or ``ForemanTask`` entities
+
+        :param must_succeed: a task finishing with a result other than success is a failure
+        :param callback: called with the ``ForemanTask`` entity of each task once it finished
+        :param progress: called with the ``ForemanTask`` entity of each running task when its
+            state or progress changed
+        :return: the watcher
+        """
+        deadline = time.monotonic() + self.timeout
+        for task in tasks:
+            self.tasks.setdefault(_task_id(task), None)
+            self._watches[_task_id(task)] = (must_succeed, callback, progress, deadline)
+        return self
+
+    def watch_query(
+        self,
+        search_query,
+        max_tries=10,
+        search_rate=1,
+        select=None,
+        must_succeed=True,
+        callback=None,
+    ):
+        """Watch the tasks found by a search query, searched once per tick until it finds some
+
+        :param search_query: the search query of the tasks
+        :param max_tries: how many times the query is searched before raising ``AssertionError``
+        :param search_rate: maximum seconds between two searches
+        :param select: callable returning whether to watch a task found, all by default
+        :param must_succeed: a task finishing with a result other than success is a failure
+        :param callback: called with the ``ForemanTask`` entity of each task once it finished
+        :return: the watcher
+        """
+        self._queries.append(
+            _Query(search_query, max_tries, search_rate, select, must_succeed, callback)
+        )
+        return self
+
+    @property
+    def pending(self):
+        """The ids of the watched tasks not finished yet"""
+        return [task_id for task_id in self.tasks if task_id not in self._finished]
+
+    def _search(self, search_query, per_page):
+        return self.satellite.api.ForemanTask().search(
+            query={'search': search_query, 'per_page': str(per_page)}
+        )
+
+    def _update(self, task):
+        """Store the new state of a task, return whether it changed"""
+        previous = self.tasks.get(task.id)
+        self.tasks[task.id] = task
+        changed = previous is None or (
+            (previous.state, getattr(previous, 'progress', None))
+            != (task.state, getattr(task, 'progress', None))
+        )
+        must_succeed, callback, progress, _ = self._watches[task.id]
+        if task.id in self._finished:
+            return changed
+        if task.state not in FINISHED_STATES:
+            if changed and progress:
+                progress(task)
+            return changed
+        self._finished.add(task.id)
+        logger.debug(f'Task {task.id} {task.label} finished, result: {task.result}')
+        if callback:
+            callback(task)
+        if must_succeed and task.result != 'success':
+            self.failed.append(task)
+            if self.fail_fast:
+                self._raise_failed()
+        return True
+
+    def _raise_failed(self):
+        raise TaskFailedError(
+            '\n'.join(
+                f'Task {task.id} {task.label} did not succeed, result: {task.result}'
+                for task in self.failed
+            )
+        )
+
+    def _refresh(self):
+        """Refresh the pending tasks, return whether any changed"""
+        pending = self.pending
+        changed = False
+        for start in range(0, len(pending), SEARCH_BATCH_SIZE):
+            batch = pending[start : start + SEARCH_BATCH_SIZE]
+            search_query = f'id ^ ({", ".join(str(task_id) for task_id in batch)})'
+            for task in self._search(search_query, len(batch)):
+                if task.id in self._watches:
+                    changed |= self._update(task)
+        return changed
+
+    def _search_queries(self):
+        """Search the queries that did not find tasks yet, return whether any found some"""
+        found = False
+        for query in list(self._queries):
+            query.tries += 1
+            tasks = [
+                task
+                for task in self._search(query.search_query, QUERY_PAGE_SIZE)
+                if query.select is None or query.select(task)
+            ]
+            if tasks:
+                self._queries.remove(query)
+                self.watch(tasks, must_succeed=query.must_succeed, callback=query.callback)
+                for task in tasks:
+                    self._update(task)
+                found = True
+            elif query.tries >= query.max_tries:
+                raise AssertionError(f"No task was found using query '{query.search_query}'")
+        return found
+
+    def _check_timeout(self):
+        now = time.monotonic()
+        timed_out = [task_id for task_id in self.pending if self._watches[task_id][3] <= now]
+        if timed_out:
+            states = {task_id: getattr(self.tasks[task_id], 'state', None) for task_id in timed_out}
+            raise TaskTimedOutError(f'Timed out waiting for tasks, states by id: {states}')
+
+    def wait(self):
+        """Wait for all the watched tasks to finish
+
+        :return: the ``ForemanTask`` entities of the finished tasks, in the order they were watched
+        :raises: ``nailgun.entity_mixins.TaskFailedError`` if a task that must succeed did not
+        :raises: ``nailgun.entity_mixins.TaskTimedOutError`` if a task did not finish in time
+        :raises: ``AssertionError`` if a search query did not find any task
+        """
+        delay = self.poll_rate
+        while True:
+            # tasks found by the queries are fresh, refresh the others first
+            changed = self._refresh()
+            changed |= self._search_queries()
+            if not self.pending and not self._queries:
+                break
+            self._check_timeout()
+            delay = self.poll_rate if changed else min(delay * BACKOFF, self.max_poll_rate)
+            if self._queries:
+                delay = min(delay, *(query.search_rate for query in self._queries))
+            time.sleep(delay)
+        if self.failed:
+            self._raise_failed()
+        return list(self.tasks.values())
@@ -3,8 +3,7 @@ from configparser import ConfigParser
 import contextlib
 from contextlib import contextmanager
 from datetime import UTC, datetime
-from functools import cached_property, lru_cache
-import importlib
+from functools import cached_property, lru_cache, partial
 import io
 import json
 from pathlib import Path, PurePath
@@ -33,7 +32,6 @@ from wrapanapi.entities.vm import VmState
 import yaml
 
 from robottelo import constants
-from robottelo.cli.base import Base
 from robottelo.config import (
     configure_airgun,
     configure_nailgun,
@@ -63,6 +61,7 @@ from robottelo.exceptions import (
     DownloadFileError,
     HostPingFailed,
     IPAHostError,
+    PersistentShellUnsupportedError,
     ProxyHostError,
     SatelliteHostError,
 )
@@ -71,10 +70,21 @@ from robottelo.host_helpers import (
     ContentHostMixins,
     SatelliteMixins,
 )
+from robottelo.host_helpers.namespaces import (
+    LazyNamespace,
+    bind_entity,
+    cli_templates,
+    nailgun_entity_templates,
+)
+from robottelo.host_helpers.psql import format_query, get_psql_session
+from robottelo.host_helpers.task_watcher import TaskWatcher
 from robottelo.logging import logger
 from robottelo.utils import validate_ssh_pub_key
 from robottelo.utils.datafactory import valid_emails_list
+from robottelo.utils.host_facts import cached_host_fact, host_facts
+from robottelo.utils.host_group import HostGroupExecutor
 from robottelo.utils.installer import InstallerCommand
+from robottelo.utils.ssh import session_pool
 
 POWER_OPERATIONS = {
     VmState.RUNNING: 'running',
@@ -159,6 +169,64 @@ class ContentHost(Host, ContentHostMixins):
             self._net_type = NetworkType(settings.content_host.network_type)
         return self._net_type
 
+    @property
+    def _use_session_pool(self):
+        """Whether this host shares its ssh session through the process-wide session pool"""
+        return (
+            session_pool.enabled
+            and not getattr(self, 'is_container', None)
+            and not getattr(self, '_cont_inst', None)
+        )
+
+    def _open_session(self):
+        """Open a new ssh session that is owned by the session pool instead of this host"""
+        super().connect()
+        session, self._session = self._session, None
+        return session
+
+    @property
+    def session(self):
+        if self._use_session_pool:
+            return session_pool.acquire(self, self._open_session)
+        return super().session
+
+    def execute(self, command, timeout=None):
+        if not self._use_session_pool:
+            return super().execute(command, timeout=timeout)
+        timeout = self.DEFAULT_TIMEOUT if timeout is None else timeout
+        logger.debug(f'{self.hostname} executing command: {command}')
+        with session_pool.use(self, self._open_session) as session:
+            res = session.run(command, timeout=timeout)
+        logger.debug(f'{self.hostname} command result:\n{res}')
+        return res
+
+    def connect(self, **kwargs):
+        if self._use_session_pool:
+            for key, val in kwargs.items():
+                setattr(self, key, val)
+            session_pool.reconnect(self, self._open_session)
+        else:
+            super().connect(**kwargs)
+
+    def close(self):
+        if self._use_session_pool:
+            session_pool.release(self)
+        super().close()
+
+    @staticmethod
+    def run_many(hosts, cmd, timeout=None, max_workers=None, check=False):
+        """Run ``cmd`` on all the ``hosts`` concurrently
+
+        :param timeout: command timeout on each host
+        :param max_workers: the maximum number of hosts running ``cmd`` at the same time
+        :param check: raise when ``cmd`` exits with a non-zero status on any host
+        :return: the command results in the order of the hosts
+        :raises robottelo.exceptions.HostGroupError: when ``cmd`` failed on any host
+        """
+        return HostGroupExecutor(hosts, max_workers=max_workers).execute(
+            cmd, timeout=timeout, check=check
+        )
+
     @classmethod
     def get_hosts_from_inventory(cls, filter):
         """Get an instance of a host from inventory using a filter"""
@@ -239,15 +307,22 @@ class ContentHost(Host, ContentHostMixins):
         return id_dict
 
     @property
+    def fact_cache_hostname(self):
+        """The hostname the facts of this host are shared by, None for containers"""
+        if getattr(self, 'is_container', None) or getattr(self, '_cont_inst', None):
+            return None
+        return self.hostname
+
+    @cached_host_fact
     def ip_addr(self):
         ipv4, *ipv6 = self.execute('hostname -I').stdout.split()
         return ipv4
 
-    @cached_property
+    @cached_host_fact
     def arch(self):
         return self.get_facts().get('lscpu.architecture') or self.execute('uname -m').stdout.strip()
 
-    @cached_property
+    @cached_host_fact
     def _redhat_release(self):
         """Process redhat-release file for distro and version information
         This is a fallback for when /etc/os-release is not available
@@ -277,7 +352,7 @@ class ContentHost(Host, ContentHostMixins):
                 break
         return r_release
 
-    @cached_property
+    @cached_host_fact
     def _os_release(self):
         """Process os-release file for distro and version information"""
         facts = {}
@@ -316,7 +391,7 @@ class ContentHost(Host, ContentHostMixins):
         """Get host's OS ID information"""
         return self._os_release['ID']
 
-    @cached_property
+    @cached_host_fact
     def is_el(self):
         """Boolean representation of whether this host is an EL host"""
         return self.execute('stat /etc/redhat-release').status == 0
@@ -346,13 +421,18 @@ class ContentHost(Host, ContentHostMixins):
         return {name: getattr(self, name) for name in self.list_cached_properties()}
 
     def clean_cached_properties(self):
-        """Delete all cached properties for this class"""
+        """Delete all cached properties for this class, and the facts cached for its host"""
         for name in self.list_cached_properties():
             with contextlib.suppress(KeyError):  # ignore if property is not cached
                 del self.__dict__[name]
+        if self.fact_cache_hostname:
+            host_facts.invalidate(self.fact_cache_hostname)
 
     def setup(self):
         logger.debug('START: setting up host %s', self)
+        # a new host may reuse the hostname of a previous one
+        if self.fact_cache_hostname:
+            host_facts.invalidate(self.fact_cache_hostname)
         if not self.blank:
             self.reset_rhsm()
 
@@ -1727,7 +1807,7 @@ class Capsule(ContentHost, CapsuleMixins):
                 self._satellite = Satellite()
         return self._satellite
 
-    @cached_property
+    @cached_host_fact
     def is_upstream(self):
         """Figure out which product distribution is installed on the server.
 
@@ -1736,7 +1816,7 @@ class Capsule(ContentHost, CapsuleMixins):
         """
         return self.execute(f'rpm -q {self.product_rpm_name}').status != 0
 
-    @cached_property
+    @cached_host_fact
     def is_stream(self):
         """Check if the Capsule is a stream release or not
 
@@ -1749,7 +1829,7 @@ class Capsule(ContentHost, CapsuleMixins):
             'stream' in self.execute(f'rpm -q --qf "%{{RELEASE}}" {self.product_rpm_name}').stdout
         )
 
-    @cached_property
+    @cached_host_fact
     def version(self):
         rpm_name = self.upstream_rpm_name if self.is_upstream else self.product_rpm_name
         return self.execute(f'rpm -q --qf "%{{VERSION}}" {rpm_name}').stdout
@@ -1917,28 +1997,12 @@ class Capsule(ContentHost, CapsuleMixins):
 
     @property
     def cli(self):
-        """Import only satellite-maintain robottelo cli entities and wrap them under self.cli"""
-        self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
-
-        for file in Path('robottelo/cli/').iterdir():
-            if (
-                file.suffix == '.py'
-                and not file.name.startswith('_')
-                and file.name.startswith('sm_')
-            ):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(name, (obj,), {'hostname': self.hostname})
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
+        """The satellite-maintain robottelo cli entities running on this capsule"""
+        if getattr(self, '_cli', None) is None:
+            self._cli = LazyNamespace(
+                partial(cli_templates, 'sm_'),
+                lambda name, template: type(name, (template,), {'hostname': self.hostname}),
+            )
         return self._cli
 
     def enable_satellite_or_capsule_module_for_rhel8(self):
@@ -2026,13 +2090,25 @@ class Capsule(ContentHost, CapsuleMixins):
         )
         return
 
-    def query_db(self, query, db='foreman', output_format='json'):
+    def psql_session(self, db='foreman'):
+        """Return the persistent psql session of a database for the calling thread
+
+        See :class:`robottelo.host_helpers.psql.PsqlSession`.
+        """
+        return get_psql_session(self, db=db)
+
+    def query_db(self, query, db='foreman', output_format='json', params=None):
         """Execute a PostgreSQL query and return the result.
 
+        The query runs in the persistent psql session of the database when
+        ``performance.psql_session`` is enabled, in a new psql process otherwise.
+
         Args:
             query: SQL query to execute
             db: Database name (default: 'foreman')
             output_format: Output format - 'json' for JSON array, raw output otherwise
+            params: Parameters substituted in the ``%s`` or ``%(name)s`` placeholders of the
+                query, see :func:`robottelo.host_helpers.psql.format_query`
 
         Returns:
             list of dicts if output_format='json', str otherwise
@@ -2040,6 +2116,15 @@ class Capsule(ContentHost, CapsuleMixins):
         Raises:
             CLIReturnCodeError: If the database query fails
         """
+        if settings.performance.psql_session:
+            try:
+                results = self.psql_session(db).batch(
+                    [(query, params)], output_format=output_format
+                )
+            except PersistentShellUnsupportedError as err:
+                logger.debug(f'Running the query without the persistent psql process: {err}')
+            else:
+                return results[0]
 
         def _execute_db_query(cmd):
             result = self.execute(cmd)
@@ -2047,6 +2132,7 @@ class Capsule(ContentHost, CapsuleMixins):
                 raise CLIReturnCodeError(result.status, result.stderr, f'"{cmd}" failed')
             return result
 
+        query = format_query(query, params)
         base_cmd = f'sudo -u postgres psql -d {db}'
 
         if output_format == 'json':
@@ -2073,9 +2159,9 @@ class Satellite(Capsule, SatelliteMixins):
         self.port = kwargs.get('port', settings.server.port)
         kwargs.setdefault('net_type', settings.server.network_type)
         super().__init__(hostname=hostname, **kwargs)
-        # create dummy classes for later population
-        self._api = type('api', (), {'_configured': False})
-        self._cli = type('cli', (), {'_configured': False})
+        # namespaces created on first access
+        self._api = None
+        self._cli = None
         self._apidoc = None
         self.record_property = None
 
@@ -2122,48 +2208,27 @@ class Satellite(Capsule, SatelliteMixins):
         # Clear module cache after lock is released (each worker clears its own cache).
         # Run this even if the worker didn't need to reinstall nailgun,
         # to make sure it has the correct api.
-        self._api = type('api', (), {'_configured': False})
+        self._api = None
         to_clear = [k for k in sys.modules if 'nailgun' in k]
         for k in to_clear:
             sys.modules.pop(k)
 
     @property
     def api(self):
-        """Import all nailgun entities and wrap them under self.api"""
-        if not self._api:
-            self._api = type('api', (), {'_configured': False})
-        if self._api._configured:
-            return self._api
-        from nailgun import entities as _entities  # use a private import
-        from nailgun.config import ServerConfig
-        from nailgun.entity_mixins import Entity
-
-        def inject_config(cls, server_config):
-            """inject a nailgun server config into the init of nailgun entity classes"""
-            import functools
-
-            class DecClass(cls):
-                __init__ = functools.partialmethod(cls.__init__, server_config=server_config)
-
-            return DecClass
-
-        # set the server configuration to point to this satellite
-        self.nailgun_cfg = ServerConfig(
-            auth=(settings.server.admin_username, settings.server.admin_password),
-            url=f'{self.url}',
-            verify=settings.server.verify_ca,
-        )
-        # add each nailgun entity to self.api, injecting our server config
-        for name, obj in _entities.__dict__.items():
-            try:
-                if Entity in obj.mro():
-                    #  create a copy of the class and inject our server config into the __init__
-                    new_cls = type(name, (obj,), {})
-                    setattr(self._api, name, inject_config(new_cls, self.nailgun_cfg))
-            except AttributeError:
-                # not everything has an mro method, we don't care about them
-                pass
-        self._api._configured = True
+        """The nailgun entities using the server config of this satellite"""
+        if self._api is None:
+            from nailgun.config import ServerConfig
+
+            # set the server configuration to point to this satellite
+            self.nailgun_cfg = ServerConfig(
+                auth=(settings.server.admin_username, settings.server.admin_password),
+                url=f'{self.url}',
+                verify=settings.server.verify_ca,
+            )
+            self._api = LazyNamespace(
+                nailgun_entity_templates,
+                partial(bind_entity, server_config=self.nailgun_cfg),
+            )
         return self._api
 
     @property
@@ -2181,32 +2246,16 @@ class Satellite(Capsule, SatelliteMixins):
 
     @property
     def cli(self):
-        """Import all robottelo cli entities and wrap them under self.cli"""
-        if not self._cli:
-            self._cli = type('cli', (), {'_configured': False})
-        if self._cli._configured:
-            return self._cli
-
-        for file in Path('robottelo/cli/').iterdir():
-            if file.suffix == '.py' and not file.name.startswith('_'):
-                cli_module = importlib.import_module(f'robottelo.cli.{file.stem}')
-                for name, obj in cli_module.__dict__.items():
-                    try:
-                        if Base in obj.mro():
-                            # create a copy of the class and set our hostname as a class attribute
-                            new_cls = type(
-                                name,
-                                (obj,),
-                                {
-                                    'hostname': self.hostname,
-                                    'omitting_credentials': self.omitting_credentials,
-                                },
-                            )
-                            setattr(self._cli, name, new_cls)
-                    except AttributeError:
-                        # not everything has an mro method, we don't care about them
-                        pass
-        self._cli._configured = True
+        """The robottelo cli entities running on this satellite"""
+        if self._cli is None:
+            self._cli = LazyNamespace(
+                cli_templates,
+                lambda name, template: type(
+                    name,
+                    (template,),
+                    {'hostname': self.hostname, 'omitting_credentials': self.omitting_credentials},
+                ),
+            )
         return self._cli
 
     @contextmanager
@@ -2214,24 +2263,16 @@ class Satellite(Capsule, SatelliteMixins):
         change = not self.omitting_credentials  # if not already set to omit
         if change:
             self.omitting_credentials = True
-            # if CLI is already created
-            if self._cli._configured:
-                for name, obj in self._cli.__dict__.items():
-                    with contextlib.suppress(
-                        AttributeError
-                    ):  # not everything has an mro method, we don't care about them
-                        if Base in obj.mro():
-                            getattr(self._cli, name).omitting_credentials = True
+            # cli classes created later get omitting_credentials from this satellite
+            if self._cli is not None:
+                for cli_class in self._cli.bound_classes().values():
+                    cli_class.omitting_credentials = True
         yield
         if change:
             self.omitting_credentials = False
-            if self._cli._configured:
-                for name, obj in self._cli.__dict__.items():
-                    with contextlib.suppress(
-                        AttributeError
-                    ):  # not everything has an mro method, we don't care about them
-                        if Base in obj.mro():
-                            getattr(self._cli, name).omitting_credentials = False
+            if self._cli is not None:
+                for cli_class in self._cli.bound_classes().values():
+                    cli_class.omitting_credentials = False
 
     @contextmanager
     def ui_session(self, testname=None, user=None, password=None, url=None, login=True):
@@ -2555,13 +2596,7 @@ class Satellite(Capsule, SatelliteMixins):
             repos.append(repo)
             task = repo.sync(synchronous=False)
             tasks.append(task)
-        for task in tasks:
-            self.wait_for_tasks(
-                search_query=(f'id = {task["id"]}'),
-                poll_timeout=1500,
-            )
-            task_status = self.api.ForemanTask(id=task['id']).poll()
-            assert task_status['result'] == 'success'
+        TaskWatcher(self, timeout=1500).watch(tasks).wait()
 
         # register contenthost
         ak = self.api.ActivationKey(
@@ -38,18 +38,52 @@ Usage::
        def test_that_conflict_with_test_to_lock(self)
             with locking_function(self.test_to_lock):
                 # do some operations that conflict with test_to_lock
+
+
+    # tests that only read what an other test changes can run concurrently,
+    # they only wait for the exclusive holders of the lock
+    class SomeTestCase(TestCase):
+
+       @lock_function
+       def test_changing_setting(self):
+          pass
+
+       @lock_function(mode=LOCK_MODE_SHARED)
+       def test_reading_setting(self):
+          pass
+
+       def test_reading_setting_too(self)
+            with locking_function(self.test_changing_setting, mode=LOCK_MODE_SHARED):
+                # read the setting
+
+    # at most 3 workers run the test at once
+    @lock_function(permits=3)
+    def test_using_limited_resource():
+        pass
+
+An exclusive holder waiting for the lock keeps new shared holders from acquiring it, so a
+stream of shared holders can not starve it. A process holding a lock in shared mode can not
+acquire it in exclusive mode, the upgrade would wait for the process itself.
+
+The time spent waiting for every lock is logged when the lock is acquired, the wait and hold
+times are recorded by :mod:`robottelo.utils.lock_telemetry`.
 """
 
-from contextlib import contextmanager
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+import fcntl
 import functools
 import inspect
 import os
+import random
 import tempfile
+import time
 
 from pytest_services.locks import file_lock
 
 from robottelo.config import settings
 from robottelo.logging import logger
+from robottelo.utils.lock_telemetry import LockTimer
 
 TEMP_ROOT_DIR = 'robottelo'
 TEMP_FUNC_LOCK_DIR = 'lock_functions'
@@ -57,9 +91,16 @@ LOCK_DIR = None
 LOCK_DEFAULT_TIMEOUT = 1800  # 30 minutes
 LOCK_FILE_NAME_EXT = 'lock'
 LOCK_DEFAULT_SCOPE = None
+# an exclusive lock holder runs alone, shared lock holders run concurrently
+LOCK_MODE_EXCLUSIVE = 'exclusive'
+LOCK_MODE_SHARED = 'shared'
+LOCK_MODES = (LOCK_MODE_EXCLUSIVE, LOCK_MODE_SHARED)
 
 _DEFAULT_CLASS_NAME_DEPTH = 3
 
+# number of shared holders of each lock file in this process
+_shared_holders = Counter()
+
 
 class FunctionLockerError(Exception):
     """the default function locker error"""
@@ -188,12 +229,144 @@ def _write_content(handler, content):
     handler.flush()
 
 
+def _wait_flock(handler, operation, deadline):
+    """Try to flock handler until deadline, return whether it was acquired"""
+    while True:
+        try:
+            fcntl.flock(handler, operation | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                return False
+        # same retry delay as pytest_services file_lock
+        time.sleep(random.random() * 0.1 + 0.05)
+
+
+def _intent_lock_path(lock_file_path):
+    """Return the path of the file an exclusive holder locks while it waits for the lock file"""
+    return f'{lock_file_path[: -len(LOCK_FILE_NAME_EXT)]}intent.{LOCK_FILE_NAME_EXT}'
+
+
+@contextmanager
+def _intent_lock(lock_file_path, deadline):
+    """Hold the writer intent lock of the lock file"""
+    with open(_intent_lock_path(lock_file_path), 'a') as handler:
+        if not _wait_flock(handler, fcntl.LOCK_EX, deadline):
+            raise FunctionLockerError(f'Timeout while waiting for lock {lock_file_path}')
+        try:
+            yield handler
+        finally:
+            fcntl.flock(handler, fcntl.LOCK_UN)
+
+
+@contextmanager
+def _shared_lock(lock_file_path, deadline):
+    """Hold a shared lock of the file, conflicting only with exclusive locks of the file
+
+    New shared holders wait for the exclusive holders already waiting, through the writer
+    intent lock. A process already holding the lock in shared mode does not wait for them, they
+    wait for that process.
+    """
+    if not _shared_holders[lock_file_path]:
+        with _intent_lock(lock_file_path, deadline):
+            pass
+    with open(lock_file_path, 'a') as handler:
+        if not _wait_flock(handler, fcntl.LOCK_SH, deadline):
+            raise FunctionLockerError(f'Timeout while waiting for shared lock {lock_file_path}')
+        _shared_holders[lock_file_path] += 1
+        try:
+            yield handler
+        finally:
+            _shared_holders[lock_file_path] -= 1
+            if not _shared_holders[lock_file_path]:
+                del _shared_holders[lock_file_path]
+            fcntl.flock(handler, fcntl.LOCK_UN)
+
+
+@contextmanager
+def _semaphore_permit(lock_file_path, permits, deadline):
+    """Hold one of the permits lock files of the lock file"""
+    permit_paths = [
+        f'{lock_file_path[: -len(LOCK_FILE_NAME_EXT)]}permit{index}.{LOCK_FILE_NAME_EXT}'
+        for index in range(permits)
+    ]
+    with ExitStack() as stack:
+        handlers = [stack.enter_context(open(path, 'a')) for path in permit_paths]
+        while True:
+            for handler in handlers:
+                try:
+                    fcntl.flock(handler, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    continue
+                try:
+                    yield handler
+                finally:
+                    fcntl.flock(handler, fcntl.LOCK_UN)
+                return
+            if time.monotonic() >= deadline:
+                raise FunctionLockerError(
+                    f'Timeout while waiting for one of the {permits} permits of {lock_file_path}'
+                )
+            time.sleep(random.random() * 0.1 + 0.05)
+
+
+@contextmanager
+def _lock(function_name, lock_file_path, mode, permits, timeout):
+    """Lock the lock file in mode, or with one of its permits, and log the time waited"""
+    if mode not in LOCK_MODES:
+        raise FunctionLockerError(f'Unknown lock mode {mode}, expected one of {LOCK_MODES}')
+    if permits is not None and permits < 1:
+        raise FunctionLockerError(f'A semaphore needs at least one permit, got {permits}')
+    process_id = str(os.getpid())
+    # to prevent dead lock when recursively calling this function
+    # check if the same process is trying to acquire the lock
+    _check_deadlock(lock_file_path, process_id)
+    if mode == LOCK_MODE_EXCLUSIVE and permits is None and _shared_holders[lock_file_path]:
+        raise FunctionLockerError(
+            'recursion detected: the function file is already locked in shared mode by the same '
+            'process, it can not be locked in exclusive mode'
+        )
+
+    if permits is not None:
+        mode = f'{permits} permits semaphore'
+    with LockTimer('func_locker', function_name, mode=mode) as timer, ExitStack() as stack:
+        deadline = time.monotonic() + timeout
+        if mode == LOCK_MODE_EXCLUSIVE:
+            # new shared holders wait while the lock is waited for, it is released once the
+            # lock is held to let the next exclusive holder queue
+            with _intent_lock(lock_file_path, deadline):
+                handler = stack.enter_context(
+                    file_lock(
+                        lock_file_path,
+                        remove=False,
+                        timeout=max(deadline - time.monotonic(), 0),
+                    )
+                )
+            # write the process id that locked this function
+            _write_content(handler, process_id)
+            # clear the file
+            stack.callback(_write_content, handler, None)
+        else:
+            # semaphore permit holders are shared holders of the lock file
+            handler = stack.enter_context(_shared_lock(lock_file_path, deadline))
+            if permits is not None:
+                stack.enter_context(_semaphore_permit(lock_file_path, permits, deadline))
+        timer.acquired()
+        logger.info(
+            f'process id: {process_id} - lock function name: {function_name} - {mode} lock '
+            f'acquired in {timer.wait:.3f}s - using file path: {lock_file_path}'
+        )
+        yield handler
+
+
 def lock_function(
     function=None,
     scope=_get_default_scope,
     scope_context=None,
     scope_kwargs=None,
     timeout=LOCK_DEFAULT_TIMEOUT,
+    mode=LOCK_MODE_EXCLUSIVE,
+    permits=None,
 ):
     """Generic function locker, lock any decorated function. Any parallel
      pytest xdist worker will wait for this function to finish
@@ -210,6 +383,10 @@ def lock_function(
            lock in combination with scope and function.
     :param scope_kwargs: kwargs to be passed to scope if is a callable
     :param timeout: the time in seconds to wait for acquiring the lock
+    :param mode: ``LOCK_MODE_EXCLUSIVE`` to run alone, ``LOCK_MODE_SHARED`` to run
+           concurrently with the other shared holders of the lock
+    :param permits: when set, the lock is a counting semaphore, at most ``permits``
+           holders run concurrently, as shared holders of the lock
     """
     class_names = []
     class_name = None
@@ -233,25 +410,9 @@ def lock_function(
             lock_file_path = _get_function_name_lock_path(
                 function_name, scope=scope, scope_kwargs=scope_kwargs, scope_context=scope_context
             )
-            process_id = str(os.getpid())
-            # to prevent dead lock when recursively calling this function
-            # check if the same process is trying to acquire the lock
-            _check_deadlock(lock_file_path, process_id)
-
-            with file_lock(lock_file_path, remove=False, timeout=timeout) as handler:
-                logger.info(
-                    f'process id: {process_id} lock function using file path: {lock_file_path}'
-                )
-                # write the process id that locked this function
-                _write_content(handler, process_id)
+            with _lock(function_name, lock_file_path, mode, permits, timeout):
                 # call the locked function
-                try:
-                    res = func(*args, **kwargs)
-                finally:
-                    # clear the file
-                    _write_content(handler, None)
-
-            return res
+                return func(*args, **kwargs)
 
         return function_wrapper
 
@@ -270,6 +431,8 @@ def locking_function(
     scope_context=None,
     scope_kwargs=None,
     timeout=LOCK_DEFAULT_TIMEOUT,
+    mode=LOCK_MODE_EXCLUSIVE,
+    permits=None,
 ):
     """Lock a function in combination with a scope and scope_context.
     Any parallel pytest xdist worker will wait for this function to finish.
@@ -286,6 +449,10 @@ def locking_function(
            lock in combination with scope and function.
     :param scope_kwargs: kwargs to be passed to scope if is a callable
     :param timeout: the time in seconds to wait for acquiring the lock
+    :param mode: ``LOCK_MODE_EXCLUSIVE`` to run alone, ``LOCK_MODE_SHARED`` to run
+           concurrently with the other shared holders of the lock
+    :param permits: when set, the lock is a counting semaphore, at most ``permits``
+           holders run concurrently, as shared holders of the lock
     """
     if not getattr(function, '__function_locked__', False):
         raise FunctionLockerError('Cannot ensure locking when using a non locked function')
@@ -294,20 +461,6 @@ def locking_function(
     lock_file_path = _get_function_name_lock_path(
         function_name, scope=scope, scope_kwargs=scope_kwargs, scope_context=scope_context
     )
-    process_id = str(os.getpid())
-    # to prevent dead lock when recursively calling this function
-    # check if the same process is trying to acquire the lock
-    _check_deadlock(lock_file_path, process_id)
-
-    with file_lock(lock_file_path, remove=False, timeout=timeout) as handler:
-        logger.info(
-            f'process id: {process_id} - lock function name:{function_name}  - using file path: {lock_file_path}'
-        )
-        # write the process id that locked this function
-        _write_content(handler, process_id)
+    with _lock(function_name, lock_file_path, mode, permits, timeout) as handler:
         # let the locked code run
-        try:
-            yield handler
-        finally:
-            # clear the file
-            _write_content(handler, None)
+        yield handler
@@ -99,11 +99,17 @@ from nailgun.entities import Entity
 
 from robottelo.config import setting_is_set, settings
 from robottelo.logging import logger
-from robottelo.utils.decorators.func_shared import file_storage, redis_storage
+from robottelo.utils.decorators.func_shared import file_storage, redis_storage, sqlite_storage
 from robottelo.utils.decorators.func_shared.file_storage import FileStorageHandler
 from robottelo.utils.decorators.func_shared.redis_storage import RedisStorageHandler
+from robottelo.utils.decorators.func_shared.sqlite_storage import SQLiteStorageHandler
+from robottelo.utils.lock_telemetry import LockTimer
 
-_storage_handlers = {'file': FileStorageHandler, 'redis': RedisStorageHandler}
+_storage_handlers = {
+    'file': FileStorageHandler,
+    'redis': RedisStorageHandler,
+    'sqlite': SQLiteStorageHandler,
+}
 
 DEFAULT_STORAGE_HANDLER = 'file'
 # by default using the shared data is disabled
@@ -146,6 +152,8 @@ def _check_config():
         DEFAULT_CALL_RETRIES = settings.shared_function.call_retries
         file_storage.LOCK_TIMEOUT = settings.shared_function.lock_timeout
         redis_storage.LOCK_TIMEOUT = settings.shared_function.lock_timeout
+        sqlite_storage.LOCK_TIMEOUT = settings.shared_function.lock_timeout
+        sqlite_storage.SHARE_TIMEOUT = settings.shared_function.share_timeout
         redis_storage.REDIS_HOST = settings.shared_function.redis_host
         redis_storage.REDIS_PORT = settings.shared_function.redis_port
         redis_storage.REDIS_DB = settings.shared_function.redis_db
@@ -292,7 +300,8 @@ class _SharedFunction:
         # and if an other process is running the function, I should wait it
         # to finish
         # note: when results are ready this lock has a very short time
-        with self.storage.lock(self.key) as data:
+        with LockTimer('func_shared', self.key) as timer, self.storage.lock(self.key) as data:
+            timer.acquired()
             self.storage.when_lock_acquired(data)
             # first must investigate, call the function or use the results
             result = None
@@ -322,6 +331,7 @@ class _SharedFunction:
                 else:
                     call_function = True
 
+            timer.fields['outcome'] = 'computed' if call_function else 'reused'
             if call_function is True:
                 result, exp, traceback_text = self._call_function()
                 creation_datetime = datetime.datetime.now(datetime.UTC).strftime(_DATETIME_FORMAT)
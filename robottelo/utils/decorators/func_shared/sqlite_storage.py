@@ -0,0 +1,178 @@
+"""Key value storage in a single local SQLite database.
+
+Values are rows of a table of a database in WAL mode, a value stored by a process is visible to
+the other processes as soon as its ``set`` returns. Every key is locked with an advisory
+``fcntl`` lock on its own byte of a lock file next to the database, a process waiting for a key
+retries to lock it after a short random delay until its timeout expires. Locks are released by the kernel when their holder dies. The holders of the locks are recorded
+in the ``locks`` table for debugging.
+
+The byte range locks are open file description locks, which are only available on Linux.
+"""
+
+from contextlib import contextmanager
+import fcntl
+import hashlib
+import os
+import random
+import sqlite3
+import struct
+import threading
+import time
+
+from robottelo.utils.decorators.func_shared.base import BaseStorageHandler
+from robottelo.utils.decorators.func_shared.file_storage import _get_root_dir
+
+DB_FILE_NAME = 'shared_functions.db'
+LOCK_TIMEOUT = 7200
+# results older than the longest share timeout are of no use to anybody
+SHARE_TIMEOUT = 86400
+SWEEP_INTERVAL = 600
+
+
+# one connection per database and process, a SQLite connection must not be used across a fork
+_connections = {}
+_connections_lock = threading.Lock()
+# connections inherited from the parent process, closing them would break the parent ones
+_inherited_connections = []
+
+
+def _reset_connections_after_fork():
+    _inherited_connections.extend(_connections.values())
+    _connections.clear()
+
+
+os.register_at_fork(after_in_child=_reset_connections_after_fork)
+
+
+def _connect(db_file):
+    """Return the connection of this process to ``db_file`` and the lock serializing its use"""
+    with _connections_lock:
+        if db_file not in _connections:
+            db = sqlite3.connect(db_file, timeout=60, isolation_level=None, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS shared '
+                '(key TEXT PRIMARY KEY, value TEXT NOT NULL, updated REAL NOT NULL)'
+            )
+            db.execute('CREATE INDEX IF NOT EXISTS shared_updated ON shared (updated)')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS locks '
+                '(key TEXT PRIMARY KEY, pid INTEGER, thread TEXT, acquired REAL)'
+            )
+            db.execute('CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value)')
+            _connections[db_file] = (db, threading.Lock())
+        return _connections[db_file]
+
+
+def _lock_struct(lock_type, offset):
+    # struct flock: l_type, l_whence, l_start, l_len, l_pid, l_pid must be 0 for OFD locks
+    return struct.pack('hhqqi', lock_type, os.SEEK_SET, offset, 1, 0)
+
+
+class SQLiteStorageHandler(BaseStorageHandler):
+    """SQLite key value storage handler"""
+
+    def __init__(self, db_file=None, lock_timeout=None, share_timeout=None):
+        if not hasattr(fcntl, 'F_OFD_SETLK'):
+            raise NotImplementedError('sqlite storage needs open file description locks (Linux)')
+        self._db_file = db_file or os.path.join(_get_root_dir(), DB_FILE_NAME)
+        self._lock_file = f'{self._db_file}.locks'
+        self._lock_timeout = LOCK_TIMEOUT if lock_timeout is None else lock_timeout
+        self._share_timeout = SHARE_TIMEOUT if share_timeout is None else share_timeout
+        self.sweep()
+
+    @property
+    def db_file(self):
+        return self._db_file
+
+    @contextmanager
+    def _database(self):
+        db, lock = _connect(self._db_file)
+        with lock:
+            yield db
+
+    @staticmethod
+    def _lock_offset(key):
+        return int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], 'big') >> 2
+
+    @contextmanager
+    def lock(self, key, timeout=None):
+        """Return the storage locker context manager
+
+        :raises TimeoutError: when the lock is not acquired within ``timeout`` seconds
+        """
+        timeout = self._lock_timeout if timeout is None else timeout
+        offset = self._lock_offset(key)
+        fd = os.open(self._lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if not self._acquire(fd, offset, timeout):
+                raise TimeoutError(f'Unable to lock shared function {key} in {timeout} seconds')
+            try:
+                yield key
+            finally:
+                with self._database() as db:
+                    db.execute('DELETE FROM locks WHERE key = ?', (key,))
+        finally:
+            # closing the file description releases its locks
+            os.close(fd)
+
+    @staticmethod
+    def _acquire(fd, offset, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.fcntl(fd, fcntl.F_OFD_SETLK, _lock_struct(fcntl.F_WRLCK, offset))
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    return False
+            # same retry delay as func_locker
+            time.sleep(random.random() * 0.1 + 0.05)
+
+    def when_lock_acquired(self, key):
+        """Record this process as the lock holder"""
+        with self._database() as db:
+            db.execute(
+                'INSERT OR REPLACE INTO locks (key, pid, thread, acquired) VALUES (?, ?, ?, ?)',
+                (key, os.getpid(), threading.current_thread().name, time.time()),
+            )
+
+    def get(self, key):
+        """Return the key value
+
+        :type key: str
+        """
+        with self._database() as db:
+            row = db.execute('SELECT value FROM shared WHERE key = ?', (key,)).fetchone()
+        return self.decode(row[0]) if row else None
+
+    def set(self, key, value):
+        """Write the value of key
+
+        :type key: str
+        :type value: object
+        """
+        value = self.encode(value)
+        with self._database() as db:
+            db.execute(
+                'INSERT OR REPLACE INTO shared (key, value, updated) VALUES (?, ?, ?)',
+                (key, value, time.time()),
+            )
+        self.sweep()
+
+    def sweep(self, force=False):
+        """Delete the values older than the share timeout, at most once per ``SWEEP_INTERVAL``
+
+        :return: the number of deleted values
+        """
+        now = time.time()
+        with self._database() as db, db:
+            db.execute('BEGIN IMMEDIATE')
+            row = db.execute("SELECT value FROM meta WHERE name = 'swept'").fetchone()
+            if not force and row and now - row[0] < SWEEP_INTERVAL:
+                return 0
+            db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('swept', ?)", (now,))
+            return db.execute(
+                'DELETE FROM shared WHERE updated < ?', (now - self._share_timeout,)
+            ).rowcount
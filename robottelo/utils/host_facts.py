@@ -0,0 +1,153 @@
+"""Cache of host facts shared by the pytest-xdist workers of a test session.
+
+Host objects cache facts like the OS release, the architecture or the Satellite version in
+``cached_property`` attributes, so every new host object, in every worker, gets them again over
+ssh. Properties decorated with :class:`cached_host_fact` are also stored by hostname in a JSON file of
+``robottelo_tmp_dir``, and read from it by the other host objects of the same host, until they
+are older than ``settings.robottelo.host_facts_ttl`` seconds or invalidated. A file changed by
+another process is read again, and the files are removed when a session starts.
+
+Facts are invalidated when a host is checked out and by ``clean_cached_properties``, call it
+after changing the OS or upgrading the Satellite of a host.
+
+Example:
+    >>> class ContentHost(Host):
+    ...     @cached_host_fact
+    ...     def arch(self):
+    ...         return self.execute('uname -m').stdout.strip()
+    >>> host_facts.invalidate('host.example.com')
+"""
+
+from functools import cached_property
+import json
+import os
+from pathlib import Path
+import time
+
+from robottelo.config import robottelo_tmp_dir, settings
+from robottelo.logging import logger
+
+FACTS_DIR_NAME = 'host_facts'
+MISSING = object()
+
+
+class HostFactCache:
+    """Facts of hosts stored in a JSON file per hostname
+
+    :param cache_dir: the directory of the files, defaults to a directory of ``robottelo_tmp_dir``
+    :param ttl: seconds facts are valid for, defaults to ``settings.robottelo.host_facts_ttl``,
+        facts are not cached when 0
+    """
+
+    def __init__(self, cache_dir=None, ttl=None):
+        self.cache_dir = Path(cache_dir or Path(robottelo_tmp_dir, FACTS_DIR_NAME))
+        self._ttl = ttl
+        # hostname: (version of the file when it was read, facts)
+        self._facts = {}
+
+    @property
+    def ttl(self):
+        if self._ttl is None:
+            return float(settings.robottelo.get('host_facts_ttl', 0))
+        return self._ttl
+
+    def _path(self, hostname):
+        return self.cache_dir / f'{hostname}.json'
+
+    def _load(self, hostname):
+        try:
+            return json.loads(self._path(hostname).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _version(self, hostname):
+        """Return an identifier of the content of the file, None if there is no file"""
+        try:
+            stat = self._path(hostname).stat()
+        except OSError:
+            return None
+        # the file is replaced by every write, the inode tells writes of the same tick apart
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _current(self, hostname):
+        """Return the facts of the host, read again when another process changed its file"""
+        version = self._version(hostname)
+        if hostname in self._facts and self._facts[hostname][0] == version:
+            return self._facts[hostname][1]
+        facts = self._load(hostname) if version is not None else {}
+        self._facts[hostname] = (version, facts)
+        return facts
+
+    def get(self, hostname, name, default=MISSING):
+        """Return the value of the fact ``name`` of the host, ``default`` if it is not cached"""
+        if not self.ttl:
+            return default
+        fact = self._current(hostname).get(name)
+        if not fact or time.time() - fact['time'] > self.ttl:
+            return default
+        return fact['value']
+
+    def _write(self, hostname, facts):
+        path = self._path(hostname)
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}')
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(facts))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError) as err:
+            # TypeError: a value JSON can not store
+            logger.debug(f'Failed to write the facts of {hostname}: {err}')
+            tmp_path.unlink(missing_ok=True)
+            return False
+        return True
+
+    def set(self, hostname, name, value):
+        """Cache the value of the fact ``name`` of the host"""
+        if not self.ttl:
+            return
+        facts = self._load(hostname)
+        facts[name] = {'value': value, 'time': time.time()}
+        if self._write(hostname, facts):
+            self._facts[hostname] = (self._version(hostname), facts)
+
+    def invalidate(self, hostname, names=None):
+        """Forget the facts ``names`` of the host, all its facts by default"""
+        self._facts.pop(hostname, None)
+        if names is None:
+            self._path(hostname).unlink(missing_ok=True)
+            return
+        facts = self._load(hostname)
+        for name in names:
+            facts.pop(name, None)
+        self._write(hostname, facts)
+
+    def clear(self):
+        """Forget the facts of all the hosts"""
+        self._facts.clear()
+        for path in self.cache_dir.glob('*.json'):
+            path.unlink(missing_ok=True)
+
+
+host_facts = HostFactCache()
+
+
+class cached_host_fact(cached_property):
+    """A ``cached_property`` of a host, also cached in :data:`host_facts` by hostname
+
+    The host class decides which hosts share their facts through its ``fact_cache_hostname``
+    attribute, facts of hosts where it is ``None`` are only cached by the host object.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        if self.attrname in instance.__dict__:
+            return instance.__dict__[self.attrname]
+        hostname = getattr(instance, 'fact_cache_hostname', None)
+        if hostname and (value := host_facts.get(hostname, self.attrname)) is not MISSING:
+            instance.__dict__[self.attrname] = value
+            return value
+        value = super().__get__(instance, owner)
+        if hostname:
+            host_facts.set(hostname, self.attrname, value)
+        return value
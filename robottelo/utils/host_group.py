@@ -0,0 +1,114 @@
+"""Run the same action on a group of hosts concurrently.
+
+Setting up many content hosts one after another makes scale scenarios linear in the number of
+hosts. :class:`HostGroupExecutor` dispatches an action to every host of a group over a bounded
+thread pool, collects the results in the order of the hosts and reports all the failures at
+once.
+
+Example:
+    >>> results = HostGroupExecutor(hosts).execute('subscription-manager refresh', timeout=300)
+    >>> HostGroupExecutor(hosts, max_workers=5).call('register', org, None, ak.name, target_sat)
+"""
+
+from concurrent.futures import ThreadPoolExecutor, wait
+import time
+
+from robottelo.exceptions import ContentHostError, HostGroupError
+from robottelo.logging import logger
+from robottelo.utils.ssh import session_pool
+
+DEFAULT_MAX_WORKERS = 16
+
+
+class HostGroupExecutor:
+    """Dispatch actions to hosts concurrently
+
+    :param hosts: the hosts, anything with an ``execute`` method for :meth:`execute`
+    :param max_workers: the maximum number of hosts acted on at the same time
+    :param timeout: seconds an action may run on one host before it is reported as failed,
+        the action itself keeps running in its thread
+    """
+
+    def __init__(self, hosts, max_workers=None, timeout=None):
+        self.hosts = list(hosts)
+        self.max_workers = max_workers or min(len(self.hosts), DEFAULT_MAX_WORKERS) or 1
+        self.timeout = timeout
+
+    def map(self, func, *args, raise_on_error=True, **kwargs):
+        """Call ``func(host, *args, **kwargs)`` for every host
+
+        :param raise_on_error: raise :class:`robottelo.exceptions.HostGroupError` when any call
+            failed, otherwise the exception takes the place of the result of the failed host
+        :return: the results in the order of the hosts
+        """
+        started = {}
+
+        def run(index, host):
+            started[index] = time.monotonic()
+            try:
+                return func(host, *args, **kwargs)
+            finally:
+                # pooled sessions are per thread and the pool threads do not outlive this call
+                session_pool.release_thread()
+
+        results, failures = [], []
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='host-group')
+        try:
+            futures = [pool.submit(run, index, host) for index, host in enumerate(self.hosts)]
+            for index, (host, future) in enumerate(zip(self.hosts, futures, strict=True)):
+                try:
+                    results.append(self._wait(future, started, index))
+                except Exception as err:
+                    logger.warning(f'Action failed on {host}: {err!r}')
+                    failures.append((host, err))
+                    results.append(err)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        if failures and raise_on_error:
+            raise HostGroupError(failures, results)
+        return results
+
+    def _wait(self, future, started, index):
+        """Wait for the result of a host, the timeout counts from the start of its action"""
+        while self.timeout is not None and not future.done():
+            start = started.get(index)
+            if start is None:
+                # still queued behind the actions of other hosts
+                wait([future], timeout=self.timeout)
+                continue
+            remaining = start + self.timeout - time.monotonic()
+            if remaining <= 0:
+                future.cancel()
+                raise TimeoutError(f'Action did not finish within {self.timeout} seconds')
+            wait([future], timeout=remaining)
+        return future.result()
+
+    def call(self, method, *args, raise_on_error=True, **kwargs):
+        """Call the ``method`` of every host with the same arguments, see :meth:`map`"""
+        return self.map(
+            lambda host: getattr(host, method)(*args, **kwargs), raise_on_error=raise_on_error
+        )
+
+    def execute(self, cmd, timeout=None, check=False, raise_on_error=True):
+        """Run ``cmd`` on every host
+
+        :param timeout: command timeout on each host, passed to the ``execute`` of the host
+        :param check: also report hosts where ``cmd`` exited with a non-zero status as failed,
+            without ``raise_on_error`` a ``ContentHostError`` takes the place of their result
+        :return: the command results in the order of the hosts
+        """
+        results = self.map(
+            lambda host: host.execute(cmd, timeout=timeout), raise_on_error=raise_on_error
+        )
+        if check:
+            failures = []
+            for index, (host, result) in enumerate(zip(self.hosts, results, strict=True)):
+                if isinstance(result, Exception) or result.status == 0:
+                    continue
+                error = ContentHostError(f'{cmd} exited with {result.status}: {result.stderr}')
+                failures.append((host, error))
+                if not raise_on_error:
+                    results[index] = error
+            if failures and raise_on_error:
+                raise HostGroupError(failures, results)
+        return results
@@ -0,0 +1,170 @@
+"""Pool of pre-provisioned hosts shared by all the pytest-xdist workers of a test session.
+
+Provisioning a Satellite or a Capsule takes far longer than most of the destructive tests using
+it. :class:`WarmHostPool` checks out ``size`` hosts concurrently in background threads as soon as
+it starts, so factories can hand out a host that is already provisioned. Every host taken from
+the pool is replaced by a new background checkout.
+
+The pool state lives in a file next to the other robottelo temporary files, one per test run
+(see ``PYTEST_XDIST_TESTRUNUID``). It holds the hostnames of the provisioned hosts and the
+checkouts in progress of every worker, so the workers share one pool of ``size`` hosts instead
+of provisioning ``size`` hosts each. The last worker to stop checks in the hosts nobody took.
+Stopping does not wait for the checkouts in progress, a host provisioned once its worker stopped
+is given to the workers still using the pool, or checked in by the thread that provisioned it.
+
+Example:
+    >>> pool = WarmHostPool('satellite', Satellite, checkout, size=2)
+    >>> pool.start()
+    >>> sat = pool.get(timeout=3600) or checkout()
+    >>> pool.stop()
+"""
+
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from uuid import uuid4
+
+from broker import Broker
+from pytest_services.locks import file_lock
+
+from robottelo.config import robottelo_tmp_dir
+from robottelo.logging import logger
+
+
+class WarmHostPool:
+    """A pool of ``size`` provisioned hosts shared between processes
+
+    :param name: name of the pool, processes using the same name share the pool
+    :param host_class: class of the hosts, used to get the hosts from the broker inventory
+    :param checkout: callable without arguments provisioning and returning a new host
+    :param size: the number of provisioned hosts the pool holds
+    :param pool_dir: directory of the pool state file, defaults to ``robottelo_tmp_dir``
+    :param retries: the number of times a failed checkout is tried again, ``poll_interval``
+        seconds apart
+    """
+
+    def __init__(
+        self, name, host_class, checkout, size, pool_dir=None, poll_interval=10, retries=2
+    ):
+        self.name = name
+        self.host_class = host_class
+        self.size = size
+        self.poll_interval = poll_interval
+        self.retries = retries
+        self._checkout = checkout
+        run_id = os.environ.get('PYTEST_XDIST_TESTRUNUID', os.getpid())
+        self.pool_file = Path(pool_dir or robottelo_tmp_dir) / f'{name}-{run_id}.warm_pool'
+        self.lock_file = self.pool_file.with_name(f'{self.pool_file.name}.lock')
+        self.id = str(uuid4().fields[-1])
+        self._threads = []
+        self._stopped = threading.Event()
+
+    @contextmanager
+    def _state(self):
+        """Lock the pool state file and yield its content, saved when the block exits"""
+        with file_lock(self.lock_file, remove=False, timeout=60):
+            if self.pool_file.exists():
+                state = json.loads(self.pool_file.read_text())
+            else:
+                state = {'members': [], 'ready': [], 'pending': {}}
+            yield state
+            if state['members']:
+                self.pool_file.write_text(json.dumps(state, indent=4))
+            else:
+                self.pool_file.unlink(missing_ok=True)
+
+    def start(self):
+        """Join the pool and start provisioning the hosts it is missing"""
+        with self._state() as state:
+            state['members'].append(self.id)
+        logger.info(f'Joined the {self.name} warm pool of {self.size} hosts')
+        self.replenish()
+
+    def replenish(self):
+        """Start background checkouts of the hosts the pool is missing"""
+        if self._stopped.is_set():
+            return
+        with self._state() as state:
+            missing = self.size - len(state['ready']) - sum(state['pending'].values())
+            if missing > 0:
+                state['pending'][self.id] = state['pending'].get(self.id, 0) + missing
+        for _ in range(max(missing, 0)):
+            thread = threading.Thread(target=self._provision, name=f'{self.name}-warm-pool')
+            thread.start()
+            self._threads.append(thread)
+
+    def _checkout_with_retries(self):
+        """Return the hostname of a new host, None if all the attempts failed"""
+        for attempt in range(self.retries + 1):
+            if attempt and self._stopped.wait(self.poll_interval):
+                return None
+            try:
+                return self._checkout().hostname
+            except Exception as err:
+                logger.warning(
+                    f'Failed to provision a host for the {self.name} warm pool '
+                    f'(attempt {attempt + 1} of {self.retries + 1}): {err}'
+                )
+        return None
+
+    def _provision(self):
+        hostname = self._checkout_with_retries()
+        if hostname:
+            logger.info(f'Provisioned {hostname} for the {self.name} warm pool')
+        with self._state() as state:
+            # the checkouts of a stopped process are not pending anymore
+            if self.id in state['pending']:
+                state['pending'][self.id] -= 1
+            orphan = hostname if hostname and not state['members'] else None
+            if hostname and not orphan:
+                state['ready'].append(hostname)
+        if orphan:
+            logger.info(f'Checking in {orphan}, the {self.name} warm pool was stopped')
+            try:
+                self.checkin([self.host_class.get_host_by_hostname(orphan)])
+            except Exception as err:
+                logger.warning(f'Failed to check in {orphan}: {err}')
+
+    def get(self, timeout=None):
+        """Take a provisioned host out of the pool
+
+        Waits for the checkouts in progress when no host is ready yet.
+
+        :param timeout: seconds to wait for a host, no limit by default
+        :return: the host, or ``None`` when no host became ready in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._state() as state:
+                hostname = state['ready'].pop(0) if state['ready'] else None
+                pending = sum(state['pending'].values())
+            if hostname:
+                break
+            if not pending or (deadline is not None and time.monotonic() >= deadline):
+                return None
+            time.sleep(self.poll_interval)
+        logger.info(f'Took {hostname} from the {self.name} warm pool')
+        self.replenish()
+        return self.host_class.get_host_by_hostname(hostname)
+
+    def stop(self):
+        """Leave the pool, the last process leaving it checks in the hosts nobody took
+
+        The checkouts in progress are not waited for, their threads hand over or check in the
+        hosts they provision.
+        """
+        self._stopped.set()
+        with self._state() as state:
+            state['members'].remove(self.id)
+            state['pending'].pop(self.id, None)
+            leftovers = [] if state['members'] else state['ready']
+        if leftovers:
+            logger.info(f'Checking in unused {self.name} warm pool hosts: {leftovers}')
+            self.checkin([self.host_class.get_host_by_hostname(name) for name in leftovers])
+
+    @staticmethod
+    def checkin(hosts):
+        Broker(hosts=hosts).checkin()
@@ -0,0 +1,149 @@
+"""Import time of the modules imported by a process.
+
+:data:`profiler` is installed in front of ``sys.meta_path`` by ``conftest.py`` when pytest runs
+with ``--import-profile``, before it imports the plugins and the fixtures, and records the time
+spent executing each module imported afterwards: its own time, and the cumulative time including
+the modules it imported. ``pytest_plugins.import_profile`` reports the most expensive ones.
+
+Modules imported before the profiler was installed are not recorded.
+
+Example:
+    >>> profiler.install()
+    >>> import robottelo.hosts
+    >>> print('\\n'.join(format_report(profiler.records, top=10)))
+"""
+
+from operator import itemgetter
+import sys
+import threading
+import time
+
+
+class _TimedLoader:
+    """Proxy of a module loader recording the time spent creating and executing the module"""
+
+    def __init__(self, loader, profiler):
+        self.loader = loader
+        self.profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        return self.profiler.timed(spec.name, self.loader.create_module, spec)
+
+    def exec_module(self, module):
+        try:
+            self.profiler.timed(module.__name__, self.loader.exec_module, module)
+        finally:
+            # the imported module gets its real loader back
+            if getattr(module.__spec__, 'loader', None) is self:
+                module.__spec__.loader = self.loader
+            if getattr(module, '__loader__', None) is self:
+                module.__loader__ = self.loader
+
+
+class ImportProfiler:
+    """Meta path finder recording the import time of the modules found by the other finders
+
+    :attr records: the seconds spent importing each module by module name: ``self`` in the module
+        itself, ``cumulative`` including the modules it imported, and ``entry`` the cumulative
+        time of its imports from outside its top level package
+    """
+
+    def __init__(self):
+        self.records = {}
+        self._local = threading.local()
+
+    @property
+    def installed(self):
+        return self in sys.meta_path
+
+    def install(self):
+        """Record the imports from now on"""
+        if not self.installed:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        """Stop recording the imports"""
+        if self.installed:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if isinstance(finder, ImportProfiler) or not hasattr(finder, 'find_spec'):
+                continue
+            if (spec := finder.find_spec(fullname, path, target)) is not None:
+                break
+        else:
+            return None
+        if hasattr(spec.loader, 'exec_module') and hasattr(spec.loader, 'create_module'):
+            spec.loader = _TimedLoader(spec.loader, self)
+        return spec
+
+    def timed(self, name, func, *args):
+        """Call ``func`` and add the time spent to the record of module ``name``"""
+        # the top level package and the seconds spent in the nested imports, by import in
+        # progress of this thread
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        stack = self._local.stack
+        package = name.partition('.')[0]
+        entry = all(frame[0] != package for frame in stack)
+        stack.append([package, 0.0])
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested_time = stack.pop()[1]
+            if stack:
+                stack[-1][1] += elapsed
+            record = self.records.setdefault(name, {'self': 0.0, 'cumulative': 0.0, 'entry': 0.0})
+            record['self'] += elapsed - nested_time
+            record['cumulative'] += elapsed
+            if entry:
+                record['entry'] += elapsed
+
+
+profiler = ImportProfiler()
+
+
+def summarize(records, top=None):
+    """Return the modules and the top level packages sorted by decreasing self time
+
+    :param records: the records of an :class:`ImportProfiler`
+    :param top: the number of modules and packages to return, all by default
+    :return: a tuple of the module and the package lists of dicts with the keys ``name``,
+        ``self`` and ``cumulative``, the cumulative time of a package including the other
+        packages it imported
+    """
+    modules = []
+    packages = {}
+    for name, record in records.items():
+        modules.append({'name': name, 'self': record['self'], 'cumulative': record['cumulative']})
+        package_name = name.partition('.')[0]
+        package = packages.setdefault(
+            package_name, {'name': package_name, 'self': 0.0, 'cumulative': 0.0}
+        )
+        package['self'] += record['self']
+        package['cumulative'] += record['entry']
+    by_self_time = itemgetter('self')
+    return (
+        sorted(modules, key=by_self_time, reverse=True)[:top],
+        sorted(packages.values(), key=by_self_time, reverse=True)[:top],
+    )
+
+
+def format_report(records, top=None):
+    """Return the lines of a table of the most expensive modules and top level packages"""
+    modules, packages = summarize(records, top=top)
+    total = sum(record['self'] for record in records.values())
+    lines = [f'{len(records)} modules imported in {total * 1000:.0f} ms']
+    for title, stats in (('module', modules), ('package', packages)):
+        lines.append(f'{"self ms":>9} {"cumul ms":>9}  {title}')
+        lines.extend(
+            f'{stat["self"] * 1000:>9.1f} {stat["cumulative"] * 1000:>9.1f}  {stat["name"]}'
+            for stat in stats
+        )
+    return lines
@@ -1,64 +1,257 @@
 # Helper methods for tests requiring I/0
+import codecs
 import hashlib
+import io
 import json
+import lzma
 from pathlib import Path
+import re
 import tarfile
 
+# bytes read at once when hashing and reading archives
+CHUNK_SIZE = 1024 * 1024
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+# characters at the end of the text read so far which may belong to a truncated value
+_TAIL = 16
+# errors of a damaged archive or json file, read in streaming mode
+_ARCHIVE_ERRORS = (tarfile.TarError, lzma.LZMAError, EOFError, ValueError)
 
-def get_local_file_data(path):
-    """Returns information about tar file.
+
+class HashingReader:
+    """File object wrapper hashing and counting the bytes read through it
 
     Args:
-        path: path to tar file
+        fileobj: binary file object to read
+        algorithm: name of the hashlib algorithm
     """
-    size = Path(path).stat().st_size
 
-    with open(path, 'rb') as fh:
-        file_content = fh.read()
-    checksum = hashlib.sha256(file_content).hexdigest()
-
-    try:
-        with tarfile.open(path, mode='r') as tarobj:
-            host_counts = get_host_counts(tarobj)
-            extractable = True
-            json_files_parsable = True
-    except (tarfile.TarError, json.JSONDecodeError):
-        host_counts = {}
-        extractable = False
-        json_files_parsable = False
+    def __init__(self, fileobj, algorithm='sha256'):
+        self._fileobj = fileobj
+        self.hash = hashlib.new(algorithm)
+        self.size = 0
 
-    return {
-        'size': size,
-        'checksum': checksum,
-        'extractable': extractable,
-        'json_files_parsable': json_files_parsable,
-        **host_counts,
-    }
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self.hash.update(data)
+        self.size += len(data)
+        return data
 
+    def drain(self):
+        """Read the rest of the file, so the checksum covers all of it"""
+        while self.read(CHUNK_SIZE):
+            pass
 
-def get_host_counts(tarobj):
-    """Returns hosts count from tar file.
+    def hexdigest(self):
+        return self.hash.hexdigest()
+
+
+class JSONStream:
+    """A JSON document read in chunks, whose values are decoded one at a time
+
+    Only the text not consumed yet and the value being decoded are kept in memory.
 
     Args:
-        tarobj: tar file to get host count from
+        fileobj: binary file object of the JSON document
     """
-    metadata_counts = {}
-    slices_counts = {}
-    for file_ in tarobj.getmembers():
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def read_more(self):
+        """Read the next chunk, returns whether there was one"""
+        if self.eof:
+            return False
+        chunk = self._fileobj.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            self.text += self._decoder.decode(b'', final=True)
+            return False
+        self.text = self.text[self.pos :] + self._decoder.decode(chunk)
+        self.pos = 0
+        return True
+
+    def _error(self, message):
+        return json.JSONDecodeError(message, self.text, self.pos)
+
+    def peek(self):
+        """Returns the next character which is not a whitespace, '' at the end"""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text) or not self.read_more():
+                return self.text[self.pos : self.pos + 1]
+
+    def expect(self, characters):
+        """Consume and return the next character, one of ``characters``"""
+        character = self.peek()
+        if not character or character not in characters:
+            raise self._error(f'Expecting one of {characters!r}')
+        self.pos += 1
+        return character
+
+    def value(self):
+        """Decode and consume the next value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError as err:
+                # the value may continue in the next chunk, unless it failed before the end
+                truncated = err.pos >= len(self.text) - _TAIL or err.msg.startswith('Unterminated')
+                if not truncated or not self.read_more():
+                    raise
+                continue
+            # a number or a literal ending the text read so far may continue in the next chunk
+            if end >= len(self.text) - _TAIL and self.read_more():
+                continue
+            self.pos = end
+            return value
+
+    def end(self):
+        """Check that nothing follows the document"""
+        if self.peek():
+            raise self._error('Extra data')
+
+
+def count_json_array(fileobj, key):
+    """Returns the number of items of the array under a top level key of a JSON file.
+
+    The items are decoded one at a time while the file is read, the array is never built.
+
+    Args:
+        fileobj: binary file object of the JSON document
+        key: the top level key of the array
+    """
+    stream = JSONStream(fileobj)
+    count = None
+    stream.expect('{')
+    if stream.peek() == '}':
+        stream.pos += 1
+    else:
+        while True:
+            name = stream.value()
+            stream.expect(':')
+            if name == key and stream.peek() == '[':
+                stream.pos += 1
+                count = 0
+                if stream.peek() == ']':
+                    stream.pos += 1
+                else:
+                    while True:
+                        stream.value()
+                        count += 1
+                        if stream.expect(',]') == ']':
+                            break
+            else:
+                stream.value()
+            if stream.expect(',}') == '}':
+                break
+    stream.end()
+    if count is None:
+        raise KeyError(key)
+    return count
+
+
+def get_file_checksum(path, algorithm='sha256'):
+    """Returns the checksum of a file, read in chunks.
+
+    Args:
+        path: path to the file
+        algorithm: name of the hashlib algorithm
+    """
+    with open(path, 'rb') as fh:
+        reader = HashingReader(fh, algorithm)
+        reader.drain()
+    return reader.hexdigest()
+
+
+def _read_report(tarobj, keep_last_slice=False):
+    """Read the json files of a report in one pass over the members of ``tarobj``
+
+    Returns:
+        the content of metadata.json, the hosts count of each slice and the raw content of
+        the last slice when ``keep_last_slice`` is set
+    """
+    metadata, slices_counts, last_slice = {}, {}, None
+    for file_ in tarobj:
         file_name = Path(file_.name).name
         if not file_name.endswith('.json'):
             continue
-        json_data = json.load(tarobj.extractfile(file_))
         if file_name == 'metadata.json':
-            metadata_counts = {
-                f'{key}.json': value['number_hosts']
-                for key, value in json_data['report_slices'].items()
-            }
+            metadata = json.load(tarobj.extractfile(file_))
+        elif keep_last_slice:
+            last_slice = tarobj.extractfile(file_).read()
+            slices_counts[file_name] = count_json_array(io.BytesIO(last_slice), 'hosts')
         else:
-            slices_counts[file_name] = len(json_data['hosts'])
+            slices_counts[file_name] = count_json_array(tarobj.extractfile(file_), 'hosts')
+    return metadata, slices_counts, last_slice
+
+
+def _metadata_counts(metadata):
+    if not metadata:
+        return {}
+    return {
+        f'{key}.json': value['number_hosts'] for key, value in metadata['report_slices'].items()
+    }
+
+
+def inspect_report(path, report_data=False):
+    """Returns information about a report tar file, reading it once.
+
+    The file is hashed while its members are read in streaming mode, the hosts of the slices
+    are counted without decoding them.
+
+    Args:
+        path: path to tar file
+        report_data: also return the content of the last slice, as ``get_report_data``
+    """
+    info = {}
+    with open(path, 'rb') as fh:
+        reader = HashingReader(fh)
+        try:
+            with tarfile.open(fileobj=reader, mode='r|*') as tarobj:
+                metadata, slices_counts, last_slice = _read_report(tarobj, report_data)
+            info.update(
+                extractable=True,
+                json_files_parsable=True,
+                metadata_counts=_metadata_counts(metadata),
+                slices_counts=slices_counts,
+                metadata=metadata,
+            )
+            if report_data:
+                info['report_data'] = json.loads(last_slice) if last_slice else {}
+        except _ARCHIVE_ERRORS:
+            info.update(extractable=False, json_files_parsable=False)
+        reader.drain()
+    return {'size': reader.size, 'checksum': reader.hexdigest(), **info}
+
+
+def get_local_file_data(path):
+    """Returns information about tar file.
 
+    Args:
+        path: path to tar file
+    """
+    info = inspect_report(path)
+    info.pop('metadata', None)
+    return info
+
+
+def get_host_counts(tarobj):
+    """Returns hosts count from tar file.
+
+    The members are read in order, so ``tarobj`` can be opened in streaming mode.
+
+    Args:
+        tarobj: tar file to get host count from
+    """
+    metadata, slices_counts, _ = _read_report(tarobj)
     return {
-        'metadata_counts': metadata_counts,
+        'metadata_counts': _metadata_counts(metadata),
         'slices_counts': slices_counts,
     }
 
@@ -88,17 +281,16 @@ def get_report_data(report_path):
     """Returns report data from tar file.
 
     Args:
-        tarobj: tar file to get report data from
+        report_path: path to tar file
     """
-    json_data = {}
-    with tarfile.open(report_path, mode='r') as tarobj:
-        for file_ in tarobj.getmembers():
+    last_slice = None
+    with tarfile.open(report_path, mode='r|*') as tarobj:
+        for file_ in tarobj:
             file_name = Path(file_.name).name
-            if not file_name.endswith('.json'):
-                continue
-            if file_name != 'metadata.json':
-                json_data = json.load(tarobj.extractfile(file_))
-    return json_data
+            if file_name.endswith('.json') and file_name != 'metadata.json':
+                # only the last slice is decoded
+                last_slice = tarobj.extractfile(file_).read()
+    return json.loads(last_slice) if last_slice else {}
 
 
 def get_report_metadata(report_path):
@@ -107,10 +299,8 @@ def get_report_metadata(report_path):
     Args:
         report_path: path to tar file
     """
-    json_meta_data = {}
-    with tarfile.open(report_path, mode='r') as tarobj:
-        for file_ in tarobj.getmembers():
-            file_name = Path(file_.name).name
-            if file_name == 'metadata.json':
-                json_meta_data = json.load(tarobj.extractfile(file_))
-    return json_meta_data
+    with tarfile.open(report_path, mode='r|*') as tarobj:
+        for file_ in tarobj:
+            if Path(file_.name).name == 'metadata.json':
+                return json.load(tarobj.extractfile(file_))
+    return {}
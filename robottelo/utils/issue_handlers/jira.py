@@ -1,6 +1,10 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 from pathlib import Path
+import random
+import sqlite3
+import threading
 import time
 
 from jira import JIRA
@@ -19,6 +23,12 @@ from robottelo.logging import logger
 
 common_jira_fields = ['key', 'status', 'labels', 'resolution']
 
+# Batched prefetch of the issues referenced by the collected tests, see prefetch_jira
+PREFETCH_CHUNK_SIZE = 50
+PREFETCH_MAX_WORKERS = 4
+PREFETCH_ATTEMPTS = 5
+PREFETCH_BACKOFF = 2
+
 FIELD_EXTRACTORS = {
     "key": lambda issue: issue.key,
     "status": lambda issue: issue.fields.status.name if issue.fields.status else "",
@@ -78,6 +88,10 @@ class JiraStatusCache:
         logger.debug(f"Saving {len(self.cache)} entries to Jira cache file")
         self.cache_file.write_text(json.dumps({"issues": self.cache}))
 
+    def export_json(self, path=None):
+        """Write the cached issues to the JSON cache file, or to ``path``"""
+        Path(path or self.cache_file).write_text(json.dumps({"issues": self.cache}))
+
     def _clean_expired_entries(self, data):
         now = time.time()
         ttl = self.cache_ttl_days * 86400
@@ -90,8 +104,138 @@ class JiraStatusCache:
         logger.debug(f"Cleaned expired cache entries: {old_count} → {len(self.cache)}")
 
 
+class SQLiteJiraStatusCache(JiraStatusCache):
+    """Jira status cache stored in an SQLite database in WAL mode.
+
+    Every ``update`` is an upsert of a single row, so the cache is shared and kept up to date
+    between all the pytest-xdist workers and ``save`` has nothing left to write. Expiry uses
+    the indexed ``timestamp`` column. The JSON cache file stays the import/export format, it is
+    imported when it changed since the last import and written back by ``export_json``.
+    """
+
+    # sqlite limits the number of parameters of a statement
+    QUERY_CHUNK_SIZE = 500
+
+    def __init__(self, db_file=None):
+        self.cache_file = Path(settings.jira.cache_file)
+        self.cache_ttl_days = settings.jira.cache_ttl_days
+        self.db_file = Path(db_file or settings.jira.cache_db)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.db_file, timeout=60, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS issues '
+                '(key TEXT PRIMARY KEY, data TEXT NOT NULL, timestamp REAL NOT NULL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS issues_timestamp ON issues (timestamp)')
+            self._db.execute('CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value)')
+        self._import_json()
+        self._clean_expired_entries()
+
+    @property
+    def _expiry(self):
+        return time.time() - self.cache_ttl_days * 86400
+
+    def _import_json(self):
+        """Import the JSON cache file if it changed since it was last imported"""
+        if not self.cache_file.exists():
+            return
+        mtime = self.cache_file.stat().st_mtime
+        with self._lock, self._db:
+            row = self._db.execute("SELECT value FROM meta WHERE name = 'json_mtime'").fetchone()
+            if row and row[0] >= mtime:
+                return
+            issues = json.loads(self.cache_file.read_text()).get("issues", {})
+            logger.debug(f"Importing {len(issues)} entries from {self.cache_file}")
+            self._db.executemany(
+                'INSERT INTO issues (key, data, timestamp) VALUES (?, ?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET data = excluded.data, '
+                'timestamp = excluded.timestamp WHERE excluded.timestamp > issues.timestamp',
+                [
+                    (key, json.dumps(value), value.get("timestamp", 0))
+                    for key, value in issues.items()
+                ],
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('json_mtime', ?)", (mtime,)
+            )
+
+    def _clean_expired_entries(self, data=None):
+        with self._lock, self._db:
+            deleted = self._db.execute(
+                'DELETE FROM issues WHERE timestamp < ?', (self._expiry,)
+            ).rowcount
+        logger.debug(f"Cleaned {deleted} expired entries from {self.db_file}")
+
+    def get(self, issue_id):
+        with self._lock:
+            row = self._db.execute(
+                'SELECT data FROM issues WHERE key = ? AND timestamp >= ?',
+                (issue_id, self._expiry),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_many(self, issue_ids):
+        issue_ids = list(issue_ids)
+        results = dict.fromkeys(issue_ids)
+        expiry = self._expiry
+        for start in range(0, len(issue_ids), self.QUERY_CHUNK_SIZE):
+            chunk = issue_ids[start : start + self.QUERY_CHUNK_SIZE]
+            with self._lock:
+                rows = self._db.execute(
+                    f'SELECT key, data FROM issues WHERE timestamp >= ? '
+                    f'AND key IN ({",".join("?" * len(chunk))})',
+                    (expiry, *chunk),
+                ).fetchall()
+            results.update((key, json.loads(data)) for key, data in rows)
+        logger.debug(
+            f"Retrieved {sum(1 for v in results.values() if v is not None)} entries from cache"
+        )
+        return results
+
+    def update(self, issue_id, data):
+        timestamp = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO issues (key, data, timestamp) VALUES (?, ?, ?)',
+                (issue_id, json.dumps(data | {"timestamp": timestamp}), timestamp),
+            )
+
+    def save(self):
+        """Every update is already stored"""
+
+    @property
+    def cache(self):
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT key, data FROM issues WHERE timestamp >= ?', (self._expiry,)
+            ).fetchall()
+        return {key: json.loads(data) for key, data in rows}
+
+    def export_json(self, path=None):
+        """Write the cached issues to the JSON cache file, or to ``path``"""
+        path = Path(path or self.cache_file)
+        super().export_json(path)
+        if path == self.cache_file:
+            # do not import our own export back
+            with self._lock, self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('json_mtime', ?)",
+                    (path.stat().st_mtime,),
+                )
+
+
+def get_jira_cache():
+    """Return the Jira status cache of the backend set by ``jira.cache_backend``"""
+    if settings.jira.cache_backend == 'sqlite':
+        return SQLiteJiraStatusCache()
+    return JiraStatusCache()
+
+
 # Create a global instance of JiraStatusCache
-jira_cache = JiraStatusCache()
+jira_cache = get_jira_cache()
 
 
 def is_open_jira(issue_id):
@@ -351,6 +495,107 @@ def get_single_jira(issue_id, cached_data=None):  # pragma: no cover
     return jira_data or get_default_jira(issue_id)
 
 
+def _prefetch_delay(err, attempt):
+    """Seconds to wait before retrying a rate limited or failed Jira search"""
+    headers = getattr(getattr(err, 'response', None), 'headers', None) or {}
+    try:
+        return float(headers['Retry-After'])
+    except (KeyError, TypeError, ValueError):
+        return PREFETCH_BACKOFF * 2**attempt + random.uniform(0, 1)
+
+
+def _search_jira_keys(client, keys, jira_fields):
+    """Search the Jira issues ``keys`` with a single ``key in (...)`` JQL query
+
+    Rate limited (429) and failed (5xx) searches are retried with an exponential backoff that
+    honors ``Retry-After``. Jira rejects the whole query when one of the keys does not exist,
+    such a chunk is split in halves until the unknown keys are isolated and left out.
+
+    :returns: List of Issue objects from the jira library
+    """
+    jql = f'key in ({", ".join(keys)})'
+    for attempt in range(PREFETCH_ATTEMPTS):
+        try:
+            return list(
+                client.search_issues(
+                    jql_str=jql, fields=','.join(jira_fields), maxResults=len(keys)
+                )
+            )
+        except JIRAError as err:
+            status_code = getattr(err, 'status_code', None) or 0
+            if status_code == 400:
+                if len(keys) == 1:
+                    logger.warning(f"Jira rejected the prefetch of {keys[0]}: {err.text}")
+                    return []
+                middle = len(keys) // 2
+                return _search_jira_keys(client, keys[:middle], jira_fields) + _search_jira_keys(
+                    client, keys[middle:], jira_fields
+                )
+            if (status_code != 429 and status_code < 500) or attempt == PREFETCH_ATTEMPTS - 1:
+                raise
+            delay = _prefetch_delay(err, attempt)
+            logger.warning(f"Jira search failed with {status_code}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+    return []
+
+
+def prefetch_jira(issue_ids, jira_fields=None):
+    """Resolve many Jira issues at once and keep them for the later status checks
+
+    Issues missing from :data:`jira_cache` are searched in chunks of
+    :data:`PREFETCH_CHUNK_SIZE` keys, the chunks are searched concurrently. The results are
+    stored in ``jira_cache`` and in the responses used by :func:`get_single_jira`, so
+    :func:`is_open_jira` does not call Jira API for any of the prefetched issues.
+
+    :param issue_ids: Jira issue ids e.g: ['SAT-20548', 'RHEL-55871']
+    :type issue_ids: iterable
+    :param jira_fields: List of fields to be retrieved for every issue
+    :type jira_fields: list
+    :returns: Issue data of the resolved issues indexed by issue id
+    :rtype: dict
+    """
+    jira_fields = jira_fields or common_jira_fields
+    resolved = CACHED_RESPONSES['get_single']
+    issue_ids = sorted({issue_id.strip() for issue_id in issue_ids} - resolved.keys())
+    if not issue_ids:
+        return {}
+    resolved.update(
+        (issue_id, data)
+        for issue_id, data in jira_cache.get_many(issue_ids).items()
+        if data is not None
+    )
+    remaining = [issue_id for issue_id in issue_ids if issue_id not in resolved]
+    if remaining and not (settings.jira.email and settings.jira.api_key):
+        logger.warning(f"Jira email or api_key is not set, not prefetching {len(remaining)} issues")
+        remaining = []
+    if remaining:
+        chunks = [
+            remaining[start : start + PREFETCH_CHUNK_SIZE]
+            for start in range(0, len(remaining), PREFETCH_CHUNK_SIZE)
+        ]
+        logger.info(f"Prefetching {len(remaining)} Jira issues in {len(chunks)} queries")
+        client = _jira_client()
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=min(PREFETCH_MAX_WORKERS, len(chunks))) as pool:
+            futures = [
+                pool.submit(_search_jira_keys, client, chunk, jira_fields) for chunk in chunks
+            ]
+            for future in as_completed(futures):
+                try:
+                    issues = future.result()
+                except JIRAError as err:
+                    logger.warning(f"Failed to prefetch Jira issues: {err}")
+                    continue
+                for issue in issues:
+                    data = _issue_to_flat_dict(issue, jira_fields)
+                    fetched[data['key']] = data
+        for issue_id, data in fetched.items():
+            jira_cache.update(issue_id, data)
+        jira_cache.save()
+        resolved.update(fetched)
+    return {issue_id: resolved[issue_id] for issue_id in issue_ids if issue_id in resolved}
+
+
 def get_default_jira(issue_id):  # pragma: no cover
     """This is the default Jira data when it is not possible to reach Jira api"""
     return {
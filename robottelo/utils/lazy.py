@@ -0,0 +1,62 @@
+"""Lazy imports of heavy modules and lazy module attributes.
+
+Modules imported by ``conftest.py``, by the plugins and by the fixtures make the startup time of
+every pytest session, even when the tests run never use them. Heavy modules only needed by some
+functions are imported with :func:`lazy_import`, and executed on the first access to one of
+their attributes. Module attributes needing a heavy module are computed on first access by the
+module ``__getattr__`` returned by :func:`lazy_attributes`.
+
+Run pytest with ``--import-profile`` to find the modules worth importing lazily.
+
+Example:
+    >>> google = lazy_import('wrapanapi.systems.google')
+    >>> def gce_client():
+    ...     return google.GoogleCloudSystem(...)  # wrapanapi.systems.google is executed here
+    >>> __getattr__ = lazy_attributes(__name__, OPERATING_SYSTEMS=_operating_systems)
+"""
+
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    """Return the module ``name``, executed on the first access to one of its attributes
+
+    The module is found at once, so a missing module still raises ``ModuleNotFoundError`` here.
+    Its parent packages are imported at once too.
+    """
+    if (module := sys.modules.get(name)) is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    parent, _, child = name.rpartition('.')
+    if parent:
+        # like the import system, so that ``import parent.child`` finds it
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+def lazy_attributes(module_name, **factories):
+    """Return a module ``__getattr__`` computing the attributes ``factories`` on first access
+
+    :param module_name: the ``__name__`` of the module
+    :param factories: callables without arguments returning the value of the attribute of their
+        name, the value is stored in the module so that each one is called once
+    """
+
+    def __getattr__(name):
+        try:
+            factory = factories[name]
+        except KeyError:
+            raise AttributeError(f'module {module_name!r} has no attribute {name!r}') from None
+        value = factory()
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
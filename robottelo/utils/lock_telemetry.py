@@ -0,0 +1,185 @@
+"""Wait and hold time telemetry of the locks shared by the pytest-xdist workers.
+
+Every lock of :mod:`robottelo.utils.decorators.func_locker` and every call of a shared function
+of :mod:`robottelo.utils.decorators.func_shared` is recorded as one JSON line appended to the
+telemetry file, with the seconds the process waited for the lock and held it. Shared function
+records tell whether the process computed the result or reused the stored one.
+
+Recording is off until :func:`enable` sets the telemetry file, which the ``lock_telemetry``
+pytest plugin does for every test session. The plugin summarizes the most contended keys when
+the session finishes.
+
+Example:
+    >>> with LockTimer('func_locker', 'tests.foreman.api.test_setting.test_update') as timer:
+    ...     with file_lock(path):
+    ...         timer.acquired()
+    ...         run_the_locked_code()
+"""
+
+from collections import defaultdict
+import json
+import os
+import time
+
+from robottelo.logging import logger
+
+telemetry_file = None
+
+
+def enable(path, truncate=False):
+    """Record the lock telemetry of this process to the JSONL file ``path``
+
+    :param truncate: remove the records of previous sessions, done by the session controller
+    """
+    global telemetry_file
+    telemetry_file = str(path)
+    if truncate:
+        with open(telemetry_file, 'w'):
+            pass
+
+
+def disable():
+    global telemetry_file
+    telemetry_file = None
+
+
+def record(data):
+    """Append a record to the telemetry file, if enabled"""
+    if telemetry_file is None:
+        return
+    line = f'{json.dumps(data)}\n'.encode()
+    try:
+        # a single write of an O_APPEND file descriptor, records of workers do not interleave
+        fd = os.open(telemetry_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+    except OSError as err:
+        logger.debug(f'Failed to record lock telemetry: {err}')
+
+
+class LockTimer:
+    """Context manager measuring the wait and hold time of a lock
+
+    Enter it before requesting the lock, call :meth:`acquired` once the lock is acquired, the
+    record is written when the context exits. Extra record fields, e.g. the outcome of a shared
+    function call, can be added to :attr:`fields`.
+
+    :param kind: the kind of lock, ``func_locker`` or ``func_shared``
+    :param key: the key of the lock
+    """
+
+    def __init__(self, kind, key, **fields):
+        self.kind = kind
+        self.key = key
+        self.fields = fields
+        self.requested = None
+        self._acquired = None
+
+    @property
+    def wait(self):
+        """The seconds spent waiting for the lock so far"""
+        return (self._acquired or time.time()) - self.requested
+
+    def acquired(self):
+        self._acquired = time.time()
+
+    def __enter__(self):
+        self.requested = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        released = time.time()
+        record(
+            {
+                'kind': self.kind,
+                'key': self.key,
+                'pid': os.getpid(),
+                'worker': os.environ.get('PYTEST_XDIST_WORKER', 'master'),
+                'requested': self.requested,
+                'acquired': self._acquired,
+                'released': released,
+                'wait': (self._acquired or released) - self.requested,
+                'hold': released - self._acquired if self._acquired else 0,
+                **self.fields,
+            }
+        )
+
+
+def read_records(path=None):
+    """Return the records of the telemetry file, skipping incomplete lines"""
+    records = []
+    try:
+        with open(path or telemetry_file) as records_file:
+            for line in records_file:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+    except (OSError, TypeError):
+        return []
+    return records
+
+
+def _max_waiters(records):
+    """Return the maximum number of processes waiting for the lock at once"""
+    events = sorted(
+        [(rec['requested'], 1) for rec in records]
+        + [(rec['released'] if rec['acquired'] is None else rec['acquired'], -1) for rec in records]
+    )
+    waiting = max_waiting = 0
+    for _, change in events:
+        waiting += change
+        max_waiting = max(max_waiting, waiting)
+    return max_waiting
+
+
+def summarize(records, top=10):
+    """Return the statistics of the ``top`` keys processes waited the longest for
+
+    :return: list of dicts with the kind and key of the lock, the number of acquisitions and
+        timeouts, the total and maximum wait, the total hold time, the maximum number of
+        processes waiting at once and for shared functions the number of computed and reused
+        results
+    """
+    by_key = defaultdict(list)
+    for rec in records:
+        by_key[(rec['kind'], rec['key'])].append(rec)
+    stats = []
+    for (kind, key), key_records in by_key.items():
+        acquired = [rec for rec in key_records if rec['acquired'] is not None]
+        outcomes = [rec.get('outcome') for rec in acquired]
+        stats.append(
+            {
+                'kind': kind,
+                'key': key,
+                'count': len(acquired),
+                'timeouts': len(key_records) - len(acquired),
+                'total_wait': sum(rec['wait'] for rec in key_records),
+                'max_wait': max(rec['wait'] for rec in key_records),
+                'total_hold': sum(rec['hold'] for rec in acquired),
+                'max_waiters': _max_waiters(key_records),
+                'computed': outcomes.count('computed'),
+                'reused': outcomes.count('reused'),
+            }
+        )
+    stats.sort(key=lambda stat: stat['total_wait'], reverse=True)
+    return stats[:top]
+
+
+def format_summary(stats):
+    """Return the lines of a human readable table of :func:`summarize` statistics"""
+    lines = [
+        f'{"wait(s)":>9} {"max(s)":>8} {"hold(s)":>9} {"count":>6} {"waiters":>7} '
+        f'{"computed/reused":>15}  key'
+    ]
+    for stat in stats:
+        shared = f'{stat["computed"]}/{stat["reused"]}' if stat['kind'] == 'func_shared' else '-'
+        timeouts = f' ({stat["timeouts"]} timeouts)' if stat['timeouts'] else ''
+        lines.append(
+            f'{stat["total_wait"]:9.1f} {stat["max_wait"]:8.1f} {stat["total_hold"]:9.1f} '
+            f'{stat["count"]:6} {stat["max_waiters"]:7} {shared:>15}  '
+            f'{stat["kind"]}:{stat["key"]}{timeouts}'
+        )
+    return lines
@@ -0,0 +1,272 @@
+"""Collection-time index of the testimony tokens and issue references of test modules.
+
+Collecting tests reads the docstrings of every test item for its testimony tokens and the
+source of every test item for its ``is_open`` workarounds, once per item, so once per parameter
+of a parametrized test. :class:`MetadataIndex` instead parses each test module once with a
+single AST pass and records, for the module and every class and function it defines:
+
+* the cleaned docstring and its testimony tokens (``:CaseComponent:``, ``:CaseImportance:``,
+  ``:Team:``, ``:BlockedBy:`` and ``:Verifies:``)
+* the ``is_open`` and ``not is_open`` workarounds of its source
+
+The index is persisted in ``robottelo_tmp_dir``, every module entry is keyed by the
+modification time and the hash of the file, so unchanged modules are not parsed again by later
+sessions. Objects the index does not know, e.g. functions generated at runtime, fall back to
+:mod:`inspect`.
+
+Example:
+    >>> metadata_index.tokens(item.function)['component']
+    'Repositories'
+    >>> metadata_index.save()
+"""
+
+import ast
+from functools import cache
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+import re
+
+from robottelo.config import robottelo_tmp_dir
+from robottelo.logging import collection_logger as logger
+
+# bump when the format of the indexed data changes
+INDEX_VERSION = 1
+
+IS_OPEN = re.compile(
+    # To match `if is_open('SAT:123456'):`
+    r"\s*if\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
+)
+
+NOT_IS_OPEN = re.compile(
+    # To match `if not is_open('SAT:123456'):`
+    r"\s*if\snot\sis_open\(\S(?P<src>\D{2})\s*:\s*(?P<num>\d*)\S\)\d*"
+)
+
+TOKEN_REGEXES = {
+    # To match :CaseComponent: FooBar
+    'component': re.compile(r'\s*:CaseComponent:\s*(?P<component>\S*)', re.IGNORECASE),
+    # To match :CaseImportance: Critical
+    'importance': re.compile(r'\s*:CaseImportance:\s*(?P<importance>\S*)', re.IGNORECASE),
+    # To match :Team: Rocket
+    'team': re.compile(r'\s*:Team:\s*(?P<team>\S*)', re.IGNORECASE),
+    # To match :BlockedBy: SAT-32932
+    'blocked_by': re.compile(r'\s*:BlockedBy:\s*(?P<blocked_by>.*\S*)', re.IGNORECASE),
+    # To match :Verifies: SAT-32932
+    'verifies': re.compile(r'\s*:Verifies:\s*(?P<verifies>.*\S*)', re.IGNORECASE),
+}
+# tokens holding a comma separated list of values
+LIST_TOKENS = ('blocked_by', 'verifies')
+
+# Only treat as Jira issue if it looks like PROJECT-NUM (e.g. SAT-20548, RHEL-55871)
+JIRA_ISSUE_PATTERN = re.compile(r'^[A-Za-z]+[-]\d+$')
+
+# Jira issue references in test sources, :BlockedBy: and :Verifies: hold comma separated lists
+JIRA_REFERENCES = [
+    re.compile(r':(?:BlockedBy|Verifies):[ \t]*(?P<keys>[\w, \t-]+)', re.IGNORECASE),
+    re.compile(r'is_open\(\s*[\'"](?P<keys>[^\'"]+)[\'"]'),
+    re.compile(r'mark\.(?:skip|deselect)\(\s*(?:reason\s*=\s*)?[\'"](?P<keys>[^\'"]+)[\'"]'),
+]
+
+
+def is_jira_issue_key(text):
+    """Return True if text looks like a Jira issue id (e.g. SAT-12345, RHEL-55871)."""
+    return bool(text and JIRA_ISSUE_PATTERN.match(text.strip()))
+
+
+def scan_issue_keys(source):
+    """Return the Jira issue ids referenced in python ``source``"""
+    return {
+        key.strip()
+        for regex in JIRA_REFERENCES
+        for match in regex.finditer(source)
+        for key in match['keys'].split(',')
+        if is_jira_issue_key(key)
+    }
+
+
+@cache
+def parse_tokens(docstring):
+    """Return the testimony tokens of a docstring
+
+    Single value tokens hold their first value, list tokens the values of their last
+    occurrence, ``None`` and an empty list when the token is missing.
+    """
+    tokens = {}
+    for name, regex in TOKEN_REGEXES.items():
+        values = regex.findall(docstring or '')
+        if name in LIST_TOKENS:
+            tokens[name] = [str(value.strip()) for value in values[-1].split(',')] if values else []
+        else:
+            tokens[name] = values[0] if values else None
+    return tokens
+
+
+def _workarounds(source):
+    if 'is_open(' not in source:
+        return [], []
+    return IS_OPEN.findall(source), NOT_IS_OPEN.findall(source)
+
+
+def _record(lineno, docstring, source):
+    is_open, not_is_open = _workarounds(source)
+    return {
+        'lineno': lineno,
+        'doc': docstring,
+        'tokens': parse_tokens(docstring) if docstring else None,
+        'is_open': is_open,
+        'not_is_open': not_is_open,
+    }
+
+
+def parse_module_source(source):
+    """Index python module ``source`` with a single AST pass
+
+    :return: dict with the first ``:CaseComponent:`` of the module, the Jira issues it references
+        and the record of every object indexed by qualified name, the module being ``''``
+    """
+    data = {
+        'component': next(iter(TOKEN_REGEXES['component'].findall(source)), None),
+        'jira_keys': sorted(scan_issue_keys(source)),
+        'objects': {},
+    }
+    try:
+        tree = ast.parse(source)
+    except SyntaxError as err:
+        logger.debug(f'Unable to index module source: {err}')
+        return data
+    lines = source.splitlines(keepends=True)
+    data['objects'][''] = _record(1, ast.get_docstring(tree), source)
+
+    def visit(parent, prefix):
+        for node in ast.iter_child_nodes(parent):
+            if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef):
+                qualname = f'{prefix}{node.name}'
+                # like inspect.getsource, the source of a definition starts at its decorators
+                lineno = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+                data['objects'][qualname] = _record(
+                    lineno,
+                    ast.get_docstring(node),
+                    ''.join(lines[lineno - 1 : node.end_lineno]),
+                )
+                inner = '.' if isinstance(node, ast.ClassDef) else '.<locals>.'
+                visit(node, f'{qualname}{inner}')
+            elif isinstance(node, ast.stmt):
+                # definitions nested in if, try, with... blocks keep the qualname of the scope
+                visit(node, prefix)
+
+    visit(tree, '')
+    return data
+
+
+class MetadataIndex:
+    """Index of test modules persisted between sessions
+
+    :param cache_file: path of the on-disk index, defaults to a file in ``robottelo_tmp_dir``
+    """
+
+    def __init__(self, cache_file=None):
+        self.cache_file = Path(cache_file or Path(robottelo_tmp_dir, 'metadata_index.json'))
+        self._entries = None
+        self._modules = {}
+        self._changed = set()
+
+    def _load(self):
+        try:
+            content = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        if content.get('version') != INDEX_VERSION:
+            return {}
+        return content.get('modules', {})
+
+    def module_file(self, path):
+        """Return the indexed data of the python file ``path``, parsing it only when it changed"""
+        path = str(Path(path).resolve())
+        if (data := self._modules.get(path)) is not None:
+            return data
+        if self._entries is None:
+            self._entries = self._load()
+        stat = os.stat(path)
+        entry = self._entries.get(path)
+        if entry and (entry['mtime'], entry['size']) == (stat.st_mtime_ns, stat.st_size):
+            data = entry['data']
+        else:
+            content = Path(path).read_bytes()
+            digest = hashlib.sha256(content).hexdigest()
+            if entry and entry['hash'] == digest:
+                data = entry['data']
+            else:
+                data = parse_module_source(content.decode('utf-8'))
+            self._entries[path] = {
+                'mtime': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'hash': digest,
+                'data': data,
+            }
+            self._changed.add(path)
+        self._modules[path] = data
+        return data
+
+    def module(self, module):
+        """Return the indexed data of a module object, see :func:`parse_module_source`"""
+        return self.module_file(module.__file__)
+
+    def lookup(self, obj):
+        """Return the record of a module, class or function, ``None`` when it is not indexed"""
+        obj = inspect.unwrap(obj) if callable(obj) else obj
+        try:
+            if inspect.ismodule(obj):
+                return self.module(obj)['objects'].get('')
+            path = obj.__code__.co_filename if inspect.isfunction(obj) else inspect.getfile(obj)
+            record = self.module_file(path)['objects'].get(obj.__qualname__)
+        except (AttributeError, OSError, TypeError, UnicodeDecodeError):
+            return None
+        if record and inspect.isfunction(obj) and record['lineno'] != obj.__code__.co_firstlineno:
+            # another definition with the same qualified name
+            return None
+        return record
+
+    def docstring(self, obj):
+        """Return the docstring of ``obj`` the way :func:`inspect.getdoc` does"""
+        record = self.lookup(obj)
+        if record and record['doc'] is not None:
+            return record['doc']
+        # not indexed or possibly inherited
+        return inspect.getdoc(obj)
+
+    def tokens(self, obj):
+        """Return the testimony tokens of the docstring of ``obj``, see :func:`parse_tokens`"""
+        record = self.lookup(obj)
+        if record and record['tokens'] is not None:
+            return record['tokens']
+        return parse_tokens(self.docstring(obj))
+
+    def workarounds(self, obj):
+        """Return the ``is_open`` and the ``not is_open`` matches in the source of ``obj``"""
+        if record := self.lookup(obj):
+            return record['is_open'], record['not_is_open']
+        return _workarounds(inspect.getsource(obj))
+
+    def save(self):
+        """Store the modules indexed by this process with the ones stored by other processes"""
+        if not self._changed:
+            return
+        entries = {path: entry for path, entry in self._load().items() if os.path.exists(path)} | {
+            path: self._entries[path] for path in self._changed
+        }
+        tmp_file = self.cache_file.with_name(f'{self.cache_file.name}.{os.getpid()}')
+        try:
+            tmp_file.write_text(json.dumps({'version': INDEX_VERSION, 'modules': entries}))
+            os.replace(tmp_file, self.cache_file)
+        except OSError as err:
+            logger.warning(f'Failed to save the test metadata index: {err}')
+            tmp_file.unlink(missing_ok=True)
+            return
+        logger.debug(f'Saved {len(self._changed)} modules to {self.cache_file}')
+        self._changed.clear()
+
+
+metadata_index = MetadataIndex()
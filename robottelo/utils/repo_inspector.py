@@ -0,0 +1,262 @@
+"""List the content of yum repositories published at some URL.
+
+Scraping the HTML index of a repository takes one request per ``Packages/<letter>/`` directory.
+:class:`RepositoryInspector` instead reads ``repodata/repomd.xml`` and streams the ``primary``
+metadata through an incremental XML parser, keeping only the fields of each package. Repositories
+without metadata, like file repositories, are listed by crawling their index pages concurrently.
+All the requests share one pooled ``requests.Session``, and the packages of a repository are
+cached by the revision of its metadata.
+
+Example:
+    >>> packages = inspector.packages(repo.full_path)
+    >>> {package.nevra: package.checksum for package in packages}
+"""
+
+import bz2
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import lzma
+import re
+import threading
+from urllib.parse import urljoin
+import xml.etree.ElementTree as ET
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from robottelo.logging import logger
+
+REPOMD_PATH = 'repodata/repomd.xml'
+REPO_NS = '{http://linux.duke.edu/metadata/repo}'
+COMMON_NS = '{http://linux.duke.edu/metadata/common}'
+XML_BASE = '{http://www.w3.org/XML/1998/namespace}base'
+# concurrent requests of a directory crawl, also the size of the connection pool
+CRAWL_MAX_WORKERS = 8
+# number of repository revisions whose packages are kept
+CACHE_SIZE = 32
+REQUEST_TIMEOUT = 60
+_LINK_REGEX = re.compile(r'(?<=href=")(?!\.\.).*?(?=">)')
+
+
+class MetadataError(Exception):
+    """The metadata of a repository can not be read"""
+
+
+class Package:
+    """A package of the ``primary`` metadata of a repository"""
+
+    __slots__ = (
+        'arch',
+        'checksum',
+        'checksum_type',
+        'epoch',
+        'location',
+        'name',
+        'release',
+        'url',
+        'version',
+    )
+
+    def __init__(self, name, epoch, version, release, arch, checksum, checksum_type, location, url):
+        self.name = name
+        self.epoch = epoch
+        self.version = version
+        self.release = release
+        self.arch = arch
+        self.checksum = checksum
+        self.checksum_type = checksum_type
+        self.location = location
+        self.url = url
+
+    @property
+    def filename(self):
+        return self.location.rsplit('/', 1)[-1]
+
+    @property
+    def nevra(self):
+        epoch = '' if self.epoch in (None, '', '0') else f'{self.epoch}:'
+        return f'{self.name}-{epoch}{self.version}-{self.release}.{self.arch}'
+
+    def __repr__(self):
+        return f'<Package {self.nevra}>'
+
+
+def _decompressed(stream, href):
+    """Return a file object decompressing the metadata file ``href`` read from ``stream``"""
+    if href.endswith('.gz'):
+        return gzip.GzipFile(fileobj=stream)
+    if href.endswith('.xz'):
+        return lzma.LZMAFile(stream)
+    if href.endswith('.bz2'):
+        return bz2.BZ2File(stream)
+    if href.endswith('.zst'):
+        if zstandard is None:
+            raise MetadataError(f'{href} is compressed with zstd, zstandard is not installed')
+        return zstandard.ZstdDecompressor().stream_reader(stream)
+    return stream
+
+
+def _repo_url(url):
+    return url if url.endswith('/') else f'{url}/'
+
+
+class RepositoryInspector:
+    """Read the content of repositories published at some URL
+
+    :param verify: verify the TLS certificates of the repositories
+    :param max_workers: concurrent requests of a directory crawl
+    """
+
+    def __init__(self, verify=False, max_workers=CRAWL_MAX_WORKERS):
+        self.verify = verify
+        self.max_workers = max_workers
+        self._session = None
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        """The ``requests.Session`` shared by all the requests"""
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self.max_workers, pool_maxsize=self.max_workers
+                )
+                self._session.mount('http://', adapter)
+                self._session.mount('https://', adapter)
+                self._session.verify = self.verify
+            return self._session
+
+    def _get(self, url, stream=False):
+        response = self.session.get(url, stream=stream, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            response.close()
+            raise requests.HTTPError(f'{url} is not accessible')
+        return response
+
+    def repomd(self, url):
+        """Return the revision of a repository and the location of its ``primary`` metadata
+
+        :return: a ``(revision, primary_href)`` pair, ``None`` when the repository has no
+            ``repomd.xml``
+        """
+        try:
+            response = self._get(f'{_repo_url(url)}{REPOMD_PATH}')
+        except requests.HTTPError:
+            return None
+        try:
+            root = ET.fromstring(response.content)
+        except ET.ParseError as err:
+            raise MetadataError(f'Invalid {REPOMD_PATH} in {url}: {err}') from err
+        revision = root.findtext(f'{REPO_NS}revision')
+        for data in root.iter(f'{REPO_NS}data'):
+            if data.get('type') == 'primary':
+                return revision, data.find(f'{REPO_NS}location').get('href')
+        raise MetadataError(f'No primary metadata in {REPOMD_PATH} of {url}')
+
+    def _read_primary(self, url, href):
+        """Yield the packages of a ``primary`` metadata file while it is downloaded"""
+        with self._get(urljoin(url, href), stream=True) as response:
+            # undo a Content-Encoding only, the file itself is decompressed by its suffix
+            response.raw.decode_content = True
+            for _, element in ET.iterparse(_decompressed(response.raw, href)):
+                if element.tag != f'{COMMON_NS}package':
+                    continue
+                if element.get('type') == 'rpm':
+                    version = element.find(f'{COMMON_NS}version')
+                    checksum = element.find(f'{COMMON_NS}checksum')
+                    location = element.find(f'{COMMON_NS}location')
+                    yield Package(
+                        name=element.findtext(f'{COMMON_NS}name'),
+                        epoch=version.get('epoch'),
+                        version=version.get('ver'),
+                        release=version.get('rel'),
+                        arch=element.findtext(f'{COMMON_NS}arch'),
+                        checksum=checksum.text,
+                        checksum_type=checksum.get('type'),
+                        location=location.get('href'),
+                        url=urljoin(location.get(XML_BASE) or url, location.get('href')),
+                    )
+                # the parsed packages are not kept in the tree
+                element.clear()
+
+    def packages(self, url):
+        """Return the packages of a repository, read from its metadata
+
+        :param url: URL where the repository or CV is published
+        :return: list of :class:`Package`, in the order of the metadata
+        :raises MetadataError: if the repository has no readable metadata
+        """
+        url = _repo_url(url)
+        repomd = self.repomd(url)
+        if repomd is None:
+            raise MetadataError(f'No {REPOMD_PATH} in {url}')
+        revision, href = repomd
+        # the name of the primary file usually holds its checksum too
+        key = (url, revision, href)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return list(self._cache[key])
+        try:
+            packages = list(self._read_primary(url, href))
+        except (ET.ParseError, OSError, EOFError) as err:
+            raise MetadataError(f'Invalid primary metadata {href} in {url}: {err}') from err
+        logger.debug(f'Read {len(packages)} packages from {url} revision {revision}')
+        with self._lock:
+            self._cache[key] = packages
+            while len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return list(packages)
+
+    def _links(self, url):
+        return _LINK_REGEX.findall(self._get(url).text)
+
+    def crawl(self, url, extension='rpm'):
+        """List the files of a repository from its index pages
+
+        The ``Packages/<letter>/`` directories of a repository are listed concurrently.
+
+        :return: list of the URLs of the files whose name contains ``extension``
+        """
+        url = _repo_url(url)
+        links = self._links(url)
+        if 'Packages/' not in links:
+            return sorted(f'{url}{link}' for link in links if extension in link)
+        packages_url = f'{url}Packages/'
+        subs = [f'{packages_url}{link}' for link in self._links(packages_url) if '/' in link]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            listings = list(executor.map(self._links, subs))
+        return sorted(
+            f'{sub}{link}'
+            for sub, links in zip(subs, listings, strict=True)
+            for link in links
+            if extension in link
+        )
+
+    def file_urls(self, url, extension='rpm'):
+        """List the URLs of the files of a repository
+
+        The packages are read from the metadata of the repository, the other files and the
+        repositories without metadata are listed from the index pages.
+
+        :param url: URL where the repository or CV is published
+        :param extension: extension of the files. Defaults to 'rpm'
+        :return: sorted list of the URLs of the files
+        """
+        if extension == 'rpm':
+            try:
+                return sorted(package.url for package in self.packages(url))
+            except MetadataError as err:
+                logger.debug(f'Listing {url} from its index pages: {err}')
+        return self.crawl(url, extension)
+
+
+inspector = RepositoryInspector()
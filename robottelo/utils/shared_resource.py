@@ -5,7 +5,9 @@ before continuing with some common action. The most common use case in this fram
 be to wait for all pre-upgrade setups to be ready before performing the upgrade.
 
 The system works by creating a file in /tmp with the name of the resource. This is a common file
-where each process can communicate its status. The first process to register will be the main
+where each process can communicate its status by appending status events. Waiting processes are
+woken up by the kernel (inotify) when the file changes, instead of polling it. Writers serialize
+on a ``flock`` of a lock file next to it. The first process to register will be the main
 watcher. The main watcher will wait for all other processes to be ready, then perform the action.
 If the main actor fails to complete the action, and the action is recoverable, another process
 will take over as the main watcher and attempt to perform the action. If the action is not
@@ -22,13 +24,17 @@ Example:
     ...     # Do post-upgrade cleanup steps if any
 """
 
+from contextlib import contextmanager
+import ctypes
+import fcntl
 import json
 import os
 from pathlib import Path
+import select
+import struct
 import time
 from uuid import uuid4
 
-from broker.helpers import FileLock
 from wait_for import wait_for
 
 from robottelo.config import settings
@@ -36,14 +42,103 @@ from robottelo.logging import logger as _root_logger
 
 logger = _root_logger.getChild('shared_resource')
 
+# how often to check the resource file when change notifications are not available
+POLL_INTERVAL = 1
+
+# inotify(7) events of the resource file directory
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+INOTIFY_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+# struct inotify_event: wd, mask, cookie, len, name
+INOTIFY_EVENT = struct.Struct('iIII')
+
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _libc.inotify_add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+    _libc.inotify_init1.argtypes = (ctypes.c_int,)
+except (AttributeError, OSError):
+    _libc = None
+
 
 class SharedResourceError(Exception):
     """An exception class for SharedResource errors."""
 
 
+class ChangeNotifier:
+    """Wakes up a waiting process when a file is written, created or deleted.
+
+    Uses inotify when available, waiting callers are then woken up by the kernel as soon as the
+    file changes. Falls back to polling every ``POLL_INTERVAL`` seconds otherwise.
+    Changes happening between two waits are not lost, they end the next wait immediately.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._fd = None
+        if _libc is None:
+            return
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            logger.debug("inotify is not available, polling %s", self.path)
+            return
+        if _libc.inotify_add_watch(fd, bytes(self.path.parent), INOTIFY_MASK) < 0:
+            logger.debug("Unable to watch %s, polling it", self.path.parent)
+            os.close(fd)
+            return
+        self._fd = fd
+
+    def wait(self, timeout):
+        """Waits at most timeout seconds for a change of the file.
+
+        Args:
+            timeout (float): The maximum number of seconds to wait.
+
+        Returns:
+            bool: True if the file changed, False if it may have changed.
+        """
+        timeout = float(timeout)
+        if self._fd is None:
+            time.sleep(min(timeout, POLL_INTERVAL))
+            return False
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if not readable:
+                break
+            if self._changed(os.read(self._fd, 65536)):
+                return True
+        return False
+
+    def _changed(self, events):
+        """Returns whether the inotify events are about the file."""
+        name = os.fsencode(self.path.name)
+        offset = 0
+        while offset < len(events):
+            _, mask, _, length = INOTIFY_EVENT.unpack_from(events, offset)
+            offset += INOTIFY_EVENT.size
+            if mask & IN_Q_OVERFLOW or events[offset : offset + length].rstrip(b"\0") == name:
+                return True
+            offset += length
+        return False
+
+    def close(self):
+        """Stops watching the file."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
 class SharedResource:
     """A class representing a shared resource.
 
+    The resource file is an append-only log of JSON status events, one per line. Every watcher
+    reads only the events appended since its last read, and is woken up by a
+    :class:`ChangeNotifier` when other watchers append events instead of polling the file.
+
     Attributes:
         action (function): The function to be executed when the resource is ready.
         action_args (tuple): The arguments to be passed to the action function.
@@ -76,7 +171,7 @@ class SharedResource:
         """
         self.resource_name = resource_name
         self.resource_file = Path(f"/tmp/{resource_name}.shared")
-        self.lock_file = FileLock(self.resource_file)
+        self.lock_file = Path(f"{self.resource_file}.lock")
         self.id = str(uuid4().fields[-1])
         self.action = action
         self.action_validator = action_validator
@@ -86,6 +181,100 @@ class SharedResource:
         self.is_recovering = False
         self.retries = retries
         self.delay = delay
+        self._notifier = None
+        self._file_id = None
+        self._offset = 0
+        self._data = None
+
+    @contextmanager
+    def _lock(self):
+        """Holds the exclusive lock of the resource file, waiting for it in the kernel.
+
+        The lock file is removed with the resource file, a lock acquired on a removed lock file
+        is given up for the current one.
+        """
+        while True:
+            with self.lock_file.open("a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    current = os.stat(self.lock_file).st_ino == os.fstat(lock.fileno()).st_ino
+                except FileNotFoundError:
+                    current = False
+                if current:
+                    yield
+                    return
+
+    def _remove(self):
+        """Removes the resource file and its lock file.
+
+        Raises:
+            FileNotFoundError: If the resource file does not exist.
+        """
+        with self._lock():
+            try:
+                self.resource_file.unlink()
+            finally:
+                self.lock_file.unlink(missing_ok=True)
+
+    def _read(self):
+        """Returns the current state of the shared resource.
+
+        Only the events appended since the previous read are parsed.
+
+        Raises:
+            FileNotFoundError: If the resource file does not exist.
+        """
+        with self.resource_file.open("rb") as resource:
+            stat = os.fstat(resource.fileno())
+            if self._file_id != (stat.st_dev, stat.st_ino):
+                # a new resource file
+                self._file_id = (stat.st_dev, stat.st_ino)
+                self._offset = 0
+                self._data = {
+                    "watchers": [],
+                    "statuses": {},
+                    "main_watcher": None,
+                    "main_status": None,
+                }
+            resource.seek(self._offset)
+            events = resource.read()
+        # ignore a line being appended
+        events = events[: events.rfind(b"\n") + 1]
+        for line in events.splitlines(keepends=True):
+            self._apply(json.loads(line))
+            # a line failing to apply is read again by the next read
+            self._offset += len(line)
+        return self._data
+
+    def _apply(self, event):
+        """Applies a status event to the state of the shared resource."""
+        data = self._data
+        if "register" in event:
+            data["watchers"].append(event["register"])
+            data["statuses"][event["register"]] = "pending"
+        elif "unregister" in event:
+            # the watcher may have registered in a previous resource file
+            if event["unregister"] in data["watchers"]:
+                data["watchers"].remove(event["unregister"])
+            data["statuses"].pop(event["unregister"], None)
+        elif "watcher" in event:
+            data["statuses"][event["watcher"]] = event["status"]
+        else:
+            data["main_watcher"] = event.get("main_watcher", data["main_watcher"])
+            data["main_status"] = event["main_status"]
+
+    def _append(self, *events, create=False):
+        """Appends status events to the resource file, the caller holds the lock.
+
+        Raises:
+            FileNotFoundError: If the resource file does not exist and create is False.
+        """
+        flags = os.O_WRONLY | os.O_APPEND | (os.O_CREAT | os.O_EXCL if create else 0)
+        fd = os.open(self.resource_file, flags, 0o644)
+        try:
+            os.write(fd, "".join(f"{json.dumps(event)}\n" for event in events).encode())
+        finally:
+            os.close(fd)
 
     def _update_status(self, status):
         """Updates the status of the shared resource.
@@ -93,11 +282,9 @@ class SharedResource:
         Args:
             status (str): The new status of the shared resource.
         """
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            curr_data["statuses"][self.id] = status
+        with self._lock():
             logger.debug("Updating watcher status to %s", status)
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+            self._append({"watcher": self.id, "status": status})
 
     def _update_main_status(self, status):
         """Updates the main status of the shared resource.
@@ -105,10 +292,8 @@ class SharedResource:
         Args:
             status (str): The new main status of the shared resource.
         """
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            curr_data["main_status"] = status
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+        with self._lock():
+            self._append({"main_status": status})
 
     def _check_all_status(self, status):
         """Checks if all watchers have the specified status.
@@ -119,12 +304,10 @@ class SharedResource:
         Returns:
             bool: True if all watchers have the specified status, False otherwise.
         """
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            for watcher_id in curr_data["watchers"]:
-                if curr_data["statuses"].get(watcher_id) != status:
-                    return False
-            return True
+        curr_data = self._read()
+        return all(
+            curr_data["statuses"].get(watcher_id) == status for watcher_id in curr_data["watchers"]
+        )
 
     def _wait_for_status(self, status):
         """Waits until all watchers have the specified status.
@@ -135,62 +318,53 @@ class SharedResource:
         while not self._check_all_status(status):
             if status == "done":
                 logger.debug("Main worker still waiting for all workers to report status 'done'.")
-            time.sleep(1)
+            self._notifier.wait(settings.robottelo.shared_resource_wait)
 
     def _wait_for_main_watcher(self):
         """Waits for the main watcher to finish."""
         while True:
-            curr_data = json.loads(self.resource_file.read_text())
+            curr_data = self._read()
             if curr_data["main_status"] == "error":
                 raise Exception(f"Error in main watcher: {curr_data['main_watcher']}")
             if curr_data["main_status"] == "action_error":
                 self._try_take_over()
             elif curr_data["main_status"] != "done":
-                time.sleep(settings.robottelo.shared_resource_wait)
+                self._notifier.wait(settings.robottelo.shared_resource_wait)
             else:
                 logger.debug("Main status now done, breaking wait loop")
                 break
 
     def _try_take_over(self):
         """Tries to take over as the main watcher."""
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
-            if curr_data["main_status"] in ("action_error", "error"):
-                curr_data["main_status"] = "recovering"
-                curr_data["main_watcher"] = self.id
-                self.resource_file.write_text(json.dumps(curr_data, indent=4))
+        with self._lock():
+            if self._read()["main_status"] in ("action_error", "error"):
+                self._append({"main_watcher": self.id, "main_status": "recovering"})
                 self.is_main = True
                 self.is_recovering = True
         self.wait()
 
     def register(self):
         """Registers the current process as a watcher."""
-        with self.lock_file:
+        # watch the resource file before reading it, so no change is missed
+        self._notifier = ChangeNotifier(self.resource_file)
+        with self._lock():
             if self.resource_file.exists():
-                curr_data = json.loads(self.resource_file.read_text())
                 self.is_main = False
+                self._append({"register": self.id})
             else:  # First watcher to register, becomes the main watcher, and creates the file
-                curr_data = {
-                    "watchers": [],
-                    "statuses": {},
-                    "main_watcher": self.id,
-                    "main_status": "waiting",
-                }
                 self.is_main = True
-            curr_data["watchers"].append(self.id)
-            curr_data["statuses"][self.id] = "pending"
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+                self._append(
+                    {"main_watcher": self.id, "main_status": "waiting"},
+                    {"register": self.id},
+                    create=True,
+                )
 
     def unregister(self):
         """Unregisters the current process as a watcher."""
         logger.debug("Unregistering %s", os.environ.get('PYTEST_XDIST_WORKER'))
-        with self.lock_file:
-            curr_data = json.loads(self.resource_file.read_text())
+        with self._lock():
             logger.debug("Removing watcher ID from resource file")
-            curr_data["watchers"].remove(self.id)
-            del curr_data["statuses"][self.id]
-            logger.debug("Writing new resource file")
-            self.resource_file.write_text(json.dumps(curr_data, indent=4))
+            self._append({"unregister": self.id})
 
     def ready(self):
         """Marks the current process as ready to perform the action."""
@@ -212,7 +386,7 @@ class SharedResource:
         except Exception as err:
             if not self.action_is_recoverable:
                 self._update_main_status("error")
-                self.resource_file.unlink()
+                self._remove()
                 raise SharedResourceError('Main worker failed during action') from err
             self._update_main_status('action_error')
             raise SharedResourceError('Recoverable failures in main worker') from err
@@ -243,42 +417,45 @@ class SharedResource:
     def __exit__(self, exc_type, exc_value, traceback):
         """Marks the current process as done and updates the main watcher if needed."""
         try:
-            self.unregister()
-        except Exception as e:
-            logger.warning(
-                'Failed to unregister watcher (resource: %s, watcher ID: %s): %s',
-                self.resource_name,
-                self.id,
-                e,
-            )
-
-        if exc_type is FileNotFoundError:
-            logger.warning(
-                '%s did not find resource file. has it already been deleted?',
-                os.environ.get('PYTEST_XDIST_WORKER'),
-            )
-            raise exc_value
-        if exc_type:
-            # Only try to update status if the resource file still exists
-            # It may have been deleted by act() if the action was non-recoverable
             try:
-                self._update_status("error")
-                if self.is_main:
-                    if self._check_all_status("error"):
-                        # All have failed, delete the file
-                        logger.warning("All workers FAILED, removing resource file")
-                        self.resource_file.unlink()
-                    else:
-                        logger.warning("Setting main status to ERROR")
-                        self._update_main_status("error")
-            except FileNotFoundError:
-                logger.debug(
-                    "Resource file was deleted during error handling, skipping status update"
+                self.unregister()
+            except Exception as e:
+                logger.warning(
+                    'Failed to unregister watcher (resource: %s, watcher ID: %s): %s',
+                    self.resource_name,
+                    self.id,
+                    e,
+                )
+
+            if exc_type is FileNotFoundError:
+                logger.warning(
+                    '%s did not find resource file. has it already been deleted?',
+                    os.environ.get('PYTEST_XDIST_WORKER'),
                 )
-            raise exc_value
-        logger.debug('Setting status to done')
-        self.done()
-        if self.is_main:
-            self._wait_for_status("done")
-            logger.debug("All workers done, removing resource file")
-            self.resource_file.unlink()
+                raise exc_value
+            if exc_type:
+                # Only try to update status if the resource file still exists
+                # It may have been deleted by act() if the action was non-recoverable
+                try:
+                    self._update_status("error")
+                    if self.is_main:
+                        if self._check_all_status("error"):
+                            # All have failed, delete the file
+                            logger.warning("All workers FAILED, removing resource file")
+                            self._remove()
+                        else:
+                            logger.warning("Setting main status to ERROR")
+                            self._update_main_status("error")
+                except FileNotFoundError:
+                    logger.debug(
+                        "Resource file was deleted during error handling, skipping status update"
+                    )
+                raise exc_value
+            logger.debug('Setting status to done')
+            self.done()
+            if self.is_main:
+                self._wait_for_status("done")
+                logger.debug("All workers done, removing resource file")
+                self._remove()
+        finally:
+            self._notifier.close()
@@ -1,6 +1,349 @@
 """Utility module to handle the shared ssh connection."""
 
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+import functools
+import hashlib
+import threading
+import time
+
 from robottelo.cli import hammer
+from robottelo.exceptions import PersistentShellError, PersistentShellUnsupportedError
+from robottelo.logging import logger
+
+# bytes read at once from the channel of a persistent shell
+SHELL_READ_SIZE = 65535
+# modules of the exceptions of the ssh backends of broker
+SSH_ERROR_MODULES = ('ssh2', 'paramiko', 'hussh', 'pylibsshext')
+
+
+def is_connection_error(err):
+    """Whether ``err`` is a socket error or an error of an ssh backend"""
+    return isinstance(err, OSError) or any(
+        cls.__module__.split('.')[0] in SSH_ERROR_MODULES for cls in type(err).__mro__
+    )
+
+
+class _PooledSession:
+    """A broker session together with its pool bookkeeping"""
+
+    def __init__(self, session):
+        self.session = session
+        self.created = self.last_used = time.monotonic()
+        # commands running on the session
+        self.in_use = 0
+        # evicted while in use, disconnected once the last command finishes
+        self.evicted = False
+
+    def idle_for(self):
+        return time.monotonic() - self.last_used
+
+
+class SSHSessionPool:
+    """Process-wide pool of ssh sessions shared by all ContentHost objects.
+
+    Sessions are keyed by ``(hostname, username, port, net_type)``, a hash of the password and
+    key file, and the calling thread, since the underlying ssh sessions are not safe to share
+    between threads. Sessions that have been idle for longer than ``keepalive_interval`` seconds
+    are health-checked before they are handed out again, sessions idle for longer than
+    ``idle_timeout`` seconds are evicted, and once ``max_sessions`` is reached the least
+    recently used session is closed to make room for a new one. Sessions running a command
+    through :meth:`use` are never evicted for being idle or to make room, and a session is
+    evicted when a command on it fails with a connection error. A session that is discarded
+    while running a command is disconnected once the command finishes.
+
+    ``stats`` counts ``hits``, ``misses``, ``reconnects`` and ``evictions``.
+    """
+
+    def __init__(self, enabled=None, max_sessions=None, idle_timeout=None, keepalive_interval=None):
+        self._enabled = enabled
+        self._max_sessions = max_sessions
+        self._idle_timeout = idle_timeout
+        self._keepalive_interval = keepalive_interval
+        self._sessions = OrderedDict()
+        self._lock = threading.RLock()
+        self.stats = Counter(hits=0, misses=0, reconnects=0, evictions=0)
+
+    def _setting(self, name, value):
+        if value is not None:
+            return value
+        from robottelo.config import settings
+
+        return settings.server.ssh_client.pool[name]
+
+    @property
+    def enabled(self):
+        return self._setting('enabled', self._enabled)
+
+    @property
+    def max_sessions(self):
+        return self._setting('max_sessions', self._max_sessions)
+
+    @property
+    def idle_timeout(self):
+        return self._setting('idle_timeout', self._idle_timeout)
+
+    @property
+    def keepalive_interval(self):
+        return self._setting('keepalive_interval', self._keepalive_interval)
+
+    @staticmethod
+    def key_for(host):
+        """Return the pool key of a ContentHost object"""
+        credentials = hashlib.sha256(
+            repr((getattr(host, 'password', None), getattr(host, 'key_filename', None))).encode()
+        ).hexdigest()
+        return (
+            host.hostname,
+            host.username,
+            host.port,
+            host.network_type,
+            credentials,
+            threading.get_ident(),
+        )
+
+    @staticmethod
+    def _is_alive(session):
+        """Check that the session can still run commands on the remote host"""
+        try:
+            return session.run('true', timeout='10s').status == 0
+        except Exception as err:
+            logger.debug(f'Pooled ssh session failed the health check: {err}')
+            return False
+
+    @staticmethod
+    def _disconnect(session):
+        try:
+            session.disconnect()
+        except Exception as err:
+            logger.debug(f'Failed to disconnect pooled ssh session: {err}')
+
+    def _close(self, entry):
+        """Disconnect the session of ``entry`` or defer it until no command uses it"""
+        if entry.in_use:
+            entry.evicted = True
+        else:
+            self._disconnect(entry.session)
+
+    def _evict(self, key):
+        self._close(self._sessions.pop(key))
+        self.stats['evictions'] += 1
+
+    def _evict_idle(self):
+        idle_timeout = self.idle_timeout
+        for key in [
+            k for k, v in self._sessions.items() if not v.in_use and v.idle_for() > idle_timeout
+        ]:
+            logger.debug(f'Evicting ssh session to {key[0]} idle for over {idle_timeout}s')
+            self._evict(key)
+
+    def _make_room(self):
+        # least recently used first
+        unused = [k for k, v in self._sessions.items() if not v.in_use]
+        while unused and len(self._sessions) >= self.max_sessions:
+            key = unused.pop(0)
+            logger.debug(f'ssh session pool is full, evicting session to {key[0]}')
+            self._evict(key)
+
+    def acquire(self, host, connect):
+        """Return a live session for ``host``, reusing a pooled one when possible
+
+        :param host: ContentHost object the session is requested for
+        :param connect: callable without arguments that opens a new session to ``host``
+        """
+        key = self.key_for(host)
+        with self._lock:
+            self._evict_idle()
+            entry = self._sessions.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                self._make_room()
+                entry = self._sessions[key] = _PooledSession(connect())
+            elif entry.idle_for() > self.keepalive_interval and not self._is_alive(entry.session):
+                logger.debug(f'Reconnecting stale ssh session to {host.hostname}')
+                self.stats['reconnects'] += 1
+                self._close(entry)
+                entry = self._sessions[key] = _PooledSession(connect())
+            else:
+                self.stats['hits'] += 1
+            self._sessions.move_to_end(key)
+            entry.last_used = time.monotonic()
+            return entry.session
+
+    @contextmanager
+    def use(self, host, connect):
+        """Acquire the session of ``host`` and mark it in use while the block runs
+
+        The session is evicted when the block raises a connection error, the next
+        :meth:`acquire` opens a new one.
+        """
+        key = self.key_for(host)
+        with self._lock:
+            session = self.acquire(host, connect)
+            entry = self._sessions[key]
+            entry.in_use += 1
+        try:
+            yield session
+        except Exception as err:
+            if is_connection_error(err):
+                with self._lock:
+                    if self._sessions.get(key) is entry:
+                        logger.debug(f'Evicting ssh session to {host.hostname} after: {err}')
+                        self._evict(key)
+            raise
+        finally:
+            with self._lock:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+                if entry.evicted and not entry.in_use:
+                    self._disconnect(entry.session)
+
+    def reconnect(self, host, connect):
+        """Replace the pooled session of ``host`` with a freshly opened one"""
+        key = self.key_for(host)
+        with self._lock:
+            if key in self._sessions:
+                self._close(self._sessions.pop(key))
+                self.stats['reconnects'] += 1
+            else:
+                self.stats['misses'] += 1
+                self._make_room()
+            self._sessions[key] = _PooledSession(connect())
+            return self._sessions[key].session
+
+    def release(self, host):
+        """Close the pooled session of ``host`` opened by the calling thread"""
+        key = self.key_for(host)
+        with self._lock:
+            if key in self._sessions:
+                self._evict(key)
+
+    def discard(self, hostname=None):
+        """Close pooled sessions of ``hostname`` in all threads, or every session if not given"""
+        with self._lock:
+            for key in [k for k in self._sessions if hostname in (None, k[0])]:
+                self._evict(key)
+
+    def release_thread(self):
+        """Close the pooled sessions opened by the calling thread, e.g. before it exits"""
+        ident = threading.get_ident()
+        with self._lock:
+            for key in [k for k in self._sessions if k[-1] == ident]:
+                self._evict(key)
+
+    def __len__(self):
+        return len(self._sessions)
+
+
+session_pool = SSHSessionPool()
+
+
+def _shell_reader(shell):
+    """Return a function reading the next bytes of an open interactive shell, b'' at its end
+
+    Only the ssh2-python and paramiko backends of broker give access to the channel of an
+    interactive shell while it is open.
+    """
+    channel = getattr(shell, '_channel', None)
+    if hasattr(channel, 'recv'):
+        # paramiko
+        return functools.partial(channel.recv, SHELL_READ_SIZE)
+    if hasattr(channel, 'read') and hasattr(channel, 'eof'):
+        # ssh2-python
+        def read():
+            size, data = channel.read(SHELL_READ_SIZE)
+            return data if size > 0 else b''
+
+        return read
+    raise PersistentShellUnsupportedError(
+        f'Interactive shells of {type(shell).__module__} can not be read while they are open'
+    )
+
+
+def _shell_alive(shell):
+    channel = shell._channel
+    if hasattr(channel, 'recv'):
+        return not (channel.closed or channel.exit_status_ready())
+    return not channel.eof()
+
+
+class PersistentShell:
+    """An interactive shell on its own ssh connection, for long-lived remote processes
+
+    The connection is not managed by :data:`session_pool`: the pool disconnects sessions it
+    believes idle while the process is running, and its sessions belong to the thread that
+    acquired them. A shell must only be used by one thread at a time.
+
+    :param hostname: the host to connect to
+    :param credentials: ``username``, ``password``, ``port`` or ``key_filename`` of the
+        connection, broker settings are used for the missing ones
+    """
+
+    def __init__(self, hostname, **credentials):
+        self.hostname = hostname
+        self.credentials = {key: value for key, value in credentials.items() if value is not None}
+        self._host = None
+        self._shell = None
+        self._read = None
+        self._buffer = b''
+
+    @property
+    def running(self):
+        return self._shell is not None
+
+    def alive(self):
+        """Whether the shell is open and its channel was not closed by the remote end"""
+        try:
+            return self.running and _shell_alive(self._shell)
+        except Exception as err:
+            logger.debug(f'Failed to check the shell channel to {self.hostname}: {err}')
+            return False
+
+    def open(self):
+        """Connect and open the shell"""
+        from broker.hosts import Host
+
+        self._host = Host(hostname=self.hostname, **self.credentials)
+        try:
+            self._shell = self._host.session.shell()
+            self._read = _shell_reader(self._shell)
+        except Exception:
+            self.close()
+            raise
+
+    def send(self, text):
+        """Send ``text`` followed by a new line"""
+        self._shell.send(text)
+
+    def readline(self):
+        """Read the next line of output
+
+        :raises robottelo.exceptions.PersistentShellError: if the channel was closed, the shell
+            is closed too and has to be opened again
+        """
+        while b'\n' not in self._buffer:
+            data = self._read()
+            if not data:
+                self.close()
+                raise PersistentShellError(f'Shell channel to {self.hostname} was closed')
+            self._buffer += data
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        return line.decode('utf-8')
+
+    def close(self):
+        """Close the shell and its connection"""
+        if self._shell is not None:
+            try:
+                self._shell._channel.close()
+            except Exception as err:
+                logger.debug(f'Failed to close shell channel to {self.hostname}: {err}')
+        if self._host is not None:
+            try:
+                self._host.close()
+            except Exception as err:
+                logger.debug(f'Failed to close ssh connection to {self.hostname}: {err}')
+        self._host = self._shell = self._read = None
+        self._buffer = b''
 
 
 def get_client(
@@ -51,7 +51,12 @@ def fixture_to_test(fixture_name):
     default=1,
     help="Run the tests in parallel with xdist.",
 )
-def run_fixtures(fixtures, from_file, verbose, xdist_workers):
+@click.option(
+    "--import-profile",
+    is_flag=True,
+    help="Report the modules taking the most time to import.",
+)
+def run_fixtures(fixtures, from_file, verbose, xdist_workers, import_profile):
     """Create a temporary test that depends on each fixture, then run it.
 
     You can also run the fixtures from the context of a file, which is useful when testing fixtures
@@ -66,6 +71,8 @@ def run_fixtures(fixtures, from_file, verbose, xdist_workers):
     """
     verbosity = "-v" if verbose else "-qq"
     xdist_workers = str(xdist_workers)  # pytest expects a string
+    # conftest.py installs the import profiler when --import-profile is in sys.argv, as it is here
+    extra_args = ["--import-profile"] if import_profile else []
     generated_tests = "import pytest\n\n" + "\n\n".join(map(fixture_to_test, fixtures))
     if from_file:
         from_file = Path(from_file.name)
@@ -74,7 +81,15 @@ def run_fixtures(fixtures, from_file, verbose, xdist_workers):
             eof_pos = f.tell()
             f.write(f"\n\n{generated_tests}")
         pytest.main(
-            [verbosity, "-n", xdist_workers, str(from_file.resolve()), "-k", "test_runfake_"]
+            [
+                verbosity,
+                "-n",
+                xdist_workers,
+                str(from_file.resolve()),
+                "-k",
+                "test_runfake_",
+                *extra_args,
+            ]
         )
         # remove the test from the file
         with from_file.open("r+") as f:
@@ -83,7 +98,7 @@ def run_fixtures(fixtures, from_file, verbose, xdist_workers):
     else:
         temp_file = Path("test_DELETEME.py")
         temp_file.write_text(generated_tests)
-        pytest.main([verbosity, "-n", xdist_workers, str(temp_file)])
+        pytest.main([verbosity, "-n", xdist_workers, str(temp_file), *extra_args])
         temp_file.unlink()
 
 
@@ -74,7 +74,7 @@ def populate_jira_cache(tests_dir, fresh):
     for issue in jira_data:
         jira_cache.update(issue['key'], issue)
 
-    jira_cache.save()
+    jira_cache.export_json()
     click.echo(f"Cache updated with {len(jira_data)} issues")
 
 
@@ -17,12 +17,12 @@ import pytest
 
 from robottelo.config import robottelo_tmp_dir
 from robottelo.enums import NetworkType
-from robottelo.utils.io import get_local_file_data, get_report_data, get_report_metadata
+from robottelo.utils.io import inspect_report
 
 
 def common_assertion(report_path):
-    """Function to perform common assertions"""
-    local_file_data = get_local_file_data(report_path)
+    """Function to perform common assertions, returns the report data and metadata"""
+    local_file_data = inspect_report(report_path, report_data=True)
 
     assert local_file_data['size'] > 0
     assert local_file_data['extractable']
@@ -33,6 +33,7 @@ def common_assertion(report_path):
     assert slices_in_metadata == slices_in_tar
     for slice_name, hosts_count in local_file_data['metadata_counts'].items():
         assert hosts_count == local_file_data['slices_counts'][slice_name]
+    return local_file_data['report_data'], local_file_data['metadata']
 
 
 @pytest.mark.run_in_one_thread
@@ -76,9 +77,7 @@ def test_rhcloud_inventory_api_e2e(
     module_target_sat.api.Organization(id=org.id).rh_cloud_download_report(
         destination=local_report_path
     )
-    common_assertion(local_report_path)
-    json_data = get_report_data(local_report_path)
-    json_meta_data = get_report_metadata(local_report_path)
+    json_data, json_meta_data = common_assertion(local_report_path)
     # Verify that metadata contains source and foreman_rh_cloud_version keys.
     prefix = 'tfm-' if module_target_sat.os_version.major < 8 else ''
     package_version = module_target_sat.run(
@@ -270,8 +269,7 @@ def test_include_parameter_tags_setting(
     module_target_sat.api.Organization(id=org.id).rh_cloud_download_report(
         destination=local_report_path
     )
-    json_data = get_report_data(local_report_path)
-    common_assertion(local_report_path)
+    json_data, _ = common_assertion(local_report_path)
     # Verify that parameter tag value is not be created.
     for host in json_data['hosts']:
         for tag in host['tags']:
@@ -12,6 +12,8 @@
 
 """
 
+from datetime import UTC, datetime
+
 import pytest
 from wait_for import wait_for
 from wrapanapi import VmState
@@ -19,6 +21,7 @@ from wrapanapi import VmState
 from robottelo import constants
 from robottelo.config import settings
 from robottelo.constants import CLIENT_PORT, DataFile
+from robottelo.host_helpers.capsule_mixins import wait_for_capsules_sync
 from robottelo.utils.datafactory import gen_string
 from robottelo.utils.installer import InstallerCommand
 
@@ -83,6 +86,7 @@ def setup_capsules(
     extra_cert_var = {'foreman-proxy-cname': module_haproxy.hostname}
     extra_installer_var = {'certs-cname': module_haproxy.hostname}
 
+    capsule_ids = []
     for capsule in module_lb_capsules:
         capsule.register_to_cdn()
         command = InstallerCommand(
@@ -111,8 +115,13 @@ def setup_capsules(
                 'lifecycle-environment': content_for_client['client_lce'].name,
             }
         )
+        capsule_ids.append(capsule_id)
+
+    # sync the capsules concurrently
+    timestamp = datetime.now(UTC)
+    for capsule, capsule_id in zip(module_lb_capsules, capsule_ids, strict=True):
         module_target_sat.cli.Capsule.content_synchronize(
-            {'id': capsule_id, 'organization-id': module_org.id}
+            {'id': capsule_id, 'organization-id': module_org.id, 'async': True}
         )
         module_target_sat.cli.Capsule.update(
             {
@@ -121,6 +130,7 @@ def setup_capsules(
                 'location-ids': module_location.id,
             }
         )
+    wait_for_capsules_sync(module_lb_capsules, start_time=timestamp, timeout=3600)
 
     return module_lb_capsules
 
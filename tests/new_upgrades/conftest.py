@@ -9,7 +9,6 @@ from box import Box
 from broker import Broker
 from broker.exceptions import ProviderError
 import pytest
-from wrapanapi.systems.google import GoogleCloudSystem
 
 from robottelo.config import settings
 from robottelo.constants import (
@@ -19,8 +18,11 @@ from robottelo.constants import (
 from robottelo.exceptions import GCECertNotFoundError, SatelliteHostError
 from robottelo.hosts import Capsule, Satellite
 from robottelo.logging import logger
+from robottelo.utils.lazy import lazy_import
 from robottelo.utils.shared_resource import SharedResource
 
+google = lazy_import('wrapanapi.systems.google')
+
 
 def pytest_configure(config):
     """Register custom markers to avoid warnings."""
@@ -110,6 +112,8 @@ def upgrade_action():
             broker_msg = getattr(result, 'message', str(result))
             raise SatelliteHostError(f"Satellite upgrade job failed:\n{broker_msg}") from result
 
+        # the Satellite and OS versions of the host changed
+        target_sat.clean_cached_properties()
         return result
 
     return _upgrade_action
@@ -376,7 +380,7 @@ def puppet_upgrade_integrated_sat_cap(
 
 @pytest.fixture
 def shared_googleclient(shared_gce_cert):
-    gceclient = GoogleCloudSystem(
+    gceclient = google.GoogleCloudSystem(
         project=shared_gce_cert['project_id'],
         zone=settings.gce.zone,
         file_path=shared_gce_cert['local_path'],
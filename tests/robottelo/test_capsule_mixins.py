@@ -0,0 +1,116 @@
+"""Tests for module ``robottelo.host_helpers.capsule_mixins``."""
+
+from datetime import UTC, datetime
+import re
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from robottelo.host_helpers import task_watcher
+from robottelo.host_helpers.capsule_mixins import wait_for_capsules_sync
+
+START_TIME = datetime(2026, 1, 1, 10, 0, 0, tzinfo=UTC)
+
+
+class FakeSatellite:
+    """Satellite running capsule sync tasks finishing after a number of searches"""
+
+    hostname = 'satellite.example.com'
+
+    def __init__(self, tasks):
+        # id: searches left before finishing
+        self.tasks = tasks
+        self.queries = []
+        self.api = SimpleNamespace(ForemanTask=lambda: SimpleNamespace(search=self.search))
+
+    def search(self, query):
+        self.queries.append(query['search'])
+        ids = re.fullmatch(r'id \^ \((.*)\)', query['search']).group(1).split(', ')
+        tasks = []
+        for task_id in ids:
+            self.tasks[task_id] = max(self.tasks[task_id] - 1, 0)
+            tasks.append(
+                SimpleNamespace(
+                    id=task_id,
+                    label='Actions::Katello::CapsuleContent::Sync',
+                    state='running' if self.tasks[task_id] else 'stopped',
+                    result='pending' if self.tasks[task_id] else 'success',
+                    progress=0.5 if self.tasks[task_id] else 1.0,
+                    output={
+                        'pulp_tasks': [
+                            {
+                                'progress_reports': [
+                                    {'code': 'sync.downloading.artifacts', 'done': 3}
+                                ]
+                            }
+                        ]
+                    },
+                )
+            )
+        return tasks
+
+
+def sync_status(active=(), last_sync_time='2026-01-01 10:05:00 UTC'):
+    return {
+        'active_sync_tasks': [{'id': task_id} for task_id in active],
+        'last_failed_sync_tasks': [],
+        'last_sync_time': last_sync_time,
+        'last_sync_task': {'ended_at': last_sync_time},
+    }
+
+
+class FakeCapsule:
+    def __init__(self, hostname, satellite, statuses):
+        self.hostname = hostname
+        self.satellite = satellite
+        self.statuses = statuses
+
+    @property
+    def nailgun_capsule(self):
+        return SimpleNamespace(content_get_sync=lambda **kwargs: self.statuses.pop(0))
+
+
+@pytest.fixture(autouse=True)
+def sleep():
+    with mock.patch.object(task_watcher.time, 'sleep') as sleep:
+        yield sleep
+
+
+def test_wait_for_capsules_sync():
+    satellite = FakeSatellite({'task-1': 2, 'task-2': 3})
+    capsules = [
+        FakeCapsule(
+            'capsule1.example.com',
+            satellite,
+            [sync_status(['task-1'], '2025-12-31 10:00:00 UTC'), sync_status()],
+        ),
+        FakeCapsule(
+            'capsule2.example.com',
+            satellite,
+            [sync_status(['task-2'], '2025-12-31 10:00:00 UTC'), sync_status()],
+        ),
+        # synced already
+        FakeCapsule('capsule3.example.com', satellite, [sync_status(), sync_status()]),
+    ]
+    results = wait_for_capsules_sync(capsules, start_time=START_TIME)
+    # the tasks of all the capsules are refreshed together
+    assert satellite.queries == ['id ^ (task-1, task-2)'] * 2 + ['id ^ (task-2)']
+    assert [result.hostname for result in results] == [capsule.hostname for capsule in capsules]
+    assert [[task.id for task in result.tasks] for result in results] == [
+        ['task-1'],
+        ['task-2'],
+        [],
+    ]
+    # from 1s before START_TIME
+    assert all(result.sync_duration == 301 for result in results)
+    assert results[2].waited == 0
+
+
+def test_wait_for_capsules_sync_no_recent_sync():
+    satellite = FakeSatellite({})
+    capsule = FakeCapsule(
+        'capsule1.example.com', satellite, [sync_status(last_sync_time='2025-12-31 10:00:00 UTC')]
+    )
+    with pytest.raises(AssertionError, match='No active or recent sync found for capsule'):
+        wait_for_capsules_sync([capsule], start_time=START_TIME)
@@ -4,12 +4,14 @@ from unittest import mock
 
 import pytest
 
-from robottelo.cli.base import Base
+from robottelo.cli import hammer
+from robottelo.cli.base import Base, LazyInfoBox
 from robottelo.exceptions import (
     CLIBaseError,
     CLIDataBaseError,
     CLIError,
     CLIReturnCodeError,
+    PersistentShellUnsupportedError,
 )
 
 
@@ -204,6 +206,38 @@ class BaseCliTestCase(unittest.TestCase):
         execute.assert_called_once_with(construct.return_value, output_format='csv', timeout=None)
         info.assert_called_once_with({'id': 'foo', 'organization-id': 'org-id'})
 
+    @mock.patch('robottelo.cli.base.Base.info')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_add_create_with_output_fields(self, construct, execute, info):
+        """Check command create skips info when the create output has the needed fields"""
+        execute.return_value = [{'message': 'Created.', 'id': 'foo', 'name': 'bar'}]
+        info.return_value = {'id': 'foo', 'name': 'bar', 'label': 'baz'}
+        Base.command_requires_org = False
+        with mock.patch.object(Base, 'create_output_fields', ('id', 'name')):
+            result = Base.create(fields=('id', 'name'))
+        assert isinstance(result, LazyInfoBox)
+        assert result.id == 'foo'
+        assert result['name'] == 'bar'
+        assert not dict.__contains__(result, 'message')
+        assert not info.called
+        assert result.label == 'baz'
+        assert result.label == 'baz'
+        info.assert_called_once_with({'id': 'foo'})
+
+    @mock.patch('robottelo.cli.base.Base.info')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_add_create_with_unknown_output_fields(self, construct, execute, info):
+        """Check command create runs info when a needed field isn't in the create output"""
+        execute.return_value = [{'message': 'Created.', 'id': 'foo', 'name': 'bar'}]
+        info.return_value = {'id': 'foo', 'name': 'bar', 'label': 'baz'}
+        Base.command_requires_org = False
+        with mock.patch.object(Base, 'create_output_fields', ('id', 'name')):
+            result = Base.create(fields=('id', 'label'))
+        assert result is info.return_value
+        info.assert_called_once_with({'id': 'foo'})
+
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
     def test_add_create_with_result_dct_id_required_org_error(self, construct, execute):
@@ -253,6 +287,7 @@ class BaseCliTestCase(unittest.TestCase):
         """Check executed build ssh method and returns raw response"""
         settings.robottelo.locale = 'en_US'
         settings.performance.time_hammer = False
+        settings.performance.hammer_shell = False
         settings.server.admin_username = 'admin'
         settings.server.admin_password = 'password'
         response = Base.execute('some_cmd', return_raw_response=True)
@@ -285,23 +320,218 @@ class BaseCliTestCase(unittest.TestCase):
         handle_resp.assert_called_once_with(command.return_value, ignore_stderr=None)
         assert response is handle_resp.return_value
 
-    @mock.patch('robottelo.cli.base.Base.list')
-    def test_exists_without_option_and_empty_return(self, lst_method):
+    @mock.patch('robottelo.cli.base.Base._handle_response')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_with_json_parser(self, settings, command, handle_resp):
+        """Check the output is parsed by the chosen json parser instead of ssh.command"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        settings.performance.hammer_shell = False
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'password'
+        command.return_value.status = 0
+        command.return_value.stdout = '[{"ID": 1, "Name": "host"}]'
+        response = Base.execute('some_cmd', output_format='json', json_parser='lazy')
+        command.assert_called_once_with(
+            'LANG=en_US  hammer -v -u admin -p password --output=json some_cmd',
+            hostname=mock.ANY,
+            output_format=None,
+            timeout=None,
+        )
+        parsed = handle_resp.call_args.args[0].stdout
+        assert isinstance(parsed, hammer.LazyJSONList)
+        assert parsed == [{'id': '1', 'name': 'host'}]
+        assert response is handle_resp.return_value
+
+    @mock.patch('robottelo.cli.base.Base._handle_response')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.hammer_shell.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_with_hammer_shell(self, settings, shell_command, command, handle_resp):
+        """Check executed command goes through the persistent hammer process"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        settings.performance.hammer_shell = True
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'password'
+        response = Base.execute('some_cmd', hostname='sat.example.com', output_format='csv')
+        shell_command.assert_called_once_with(
+            '-v -u admin -p password --output=csv some_cmd',
+            hostname='sat.example.com',
+            user='admin',
+            password='password',
+            locale='en_US',
+            output_format='csv',
+        )
+        command.assert_not_called()
+        handle_resp.assert_called_once_with(shell_command.return_value, ignore_stderr=None)
+        assert response is handle_resp.return_value
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.hammer_shell.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_with_hammer_shell_fallback(self, settings, shell_command, command):
+        """Check commands using shell syntax still run through ssh"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        settings.performance.hammer_shell = True
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'password'
+        Base.execute('some_cmd | grep foo', return_raw_response=True)
+        shell_command.assert_not_called()
+        command.assert_called_once()
+
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.hammer_shell.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_with_hammer_shell_unsupported(self, settings, shell_command, command):
+        """Check commands run through ssh when the ssh backend can not read shells"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance.time_hammer = False
+        settings.performance.hammer_shell = True
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'password'
+        shell_command.side_effect = PersistentShellUnsupportedError('hussh')
+        response = Base.execute('some_cmd', return_raw_response=True)
+        shell_command.assert_called_once()
+        command.assert_called_once()
+        assert response is command.return_value
+
+    @mock.patch('robottelo.cli.base.uuid4')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_many(self, settings, command, uuid4):
+        """Check commands run in a single ssh call and results are split per command"""
+        settings.robottelo.locale = 'en_US'
+        settings.performance.hammer_shell = False
+        settings.server.admin_username = 'admin'
+        settings.server.admin_password = 'password'
+        settings.server.ssh_client.command_timeout = 300000
+        uuid4.return_value.hex = 'abc'
+        command.return_value.stdout = (
+            'motd\n'
+            'robottelo-batch-abc 0 stdout\nId,Name\n1,foo\n\n'
+            'robottelo-batch-abc 0 stderr\n\n'
+            'robottelo-batch-abc 0 status 0\n'
+            'robottelo-batch-abc 1 stdout\n\n'
+            'robottelo-batch-abc 1 stderr\nError: boom\n\n'
+            'robottelo-batch-abc 1 status 65\n'
+        )
+        first, second = Base.execute_many(
+            ['org create', 'org info'], output_format='csv', return_raw_response=True
+        )
+        command.assert_called_once()
+        # the default timeout applies to each command too
+        assert command.call_args.kwargs['timeout'] == 2 * 300000
+        script = command.call_args[0][0]
+        assert 'LANG=en_US hammer -v -u admin -p password --output=csv org create' in script
+        assert 'LANG=en_US hammer -v -u admin -p password --output=csv org info' in script
+        assert first.status == 0
+        assert first.stdout == [{'id': '1', 'name': 'foo'}]
+        assert second.status == 65
+        assert second.stderr == 'Error: boom\n'
+        with pytest.raises(CLIReturnCodeError):
+            Base.execute_many(['org create', 'org info'], output_format='csv', timeout='1m')
+        # the timeout applies to each command
+        assert command.call_args.kwargs['timeout'] == 2 * 60000
+
+    @mock.patch('robottelo.cli.base.uuid4')
+    @mock.patch('robottelo.cli.base.ssh.command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_execute_many_interrupted(self, settings, command, uuid4):
+        """Check an error is raised when the batch script did not finish"""
+        settings.performance.hammer_shell = False
+        uuid4.return_value.hex = 'abc'
+        command.return_value.stdout = 'robottelo-batch-abc 0 stdout\nId,Name\n'
+        with pytest.raises(CLIError):
+            Base.execute_many(['org create'])
+
+    @mock.patch('robottelo.cli.base.Base.info')
+    @mock.patch('robottelo.cli.base.Base.execute_many')
+    def test_create_many(self, execute_many, info):
+        """Check creates and infos are each batched into one call"""
+        Base.command_requires_org = False
+        execute_many.side_effect = [
+            [
+                mock.Mock(status=0, stdout=[{'id': '1', 'name': 'foo'}], stderr=''),
+                mock.Mock(status=0, stdout=[{'id': '2', 'name': 'bar'}], stderr=''),
+                mock.Mock(status=0, stdout=[], stderr=''),
+            ],
+            [
+                mock.Mock(status=0, stdout='Id: 1\nName: foo\n', stderr=''),
+                mock.Mock(status=1, stdout='', stderr='not found'),
+            ],
+        ]
+        info.return_value = {'id': '2', 'name': 'bar'}
+        results = Base.create_many([{'name': 'foo'}, {'name': 'bar'}, None])
+        assert results == [{'id': '1', 'name': 'foo'}, {'id': '2', 'name': 'bar'}, []]
+        assert execute_many.call_count == 2
+        assert len(execute_many.call_args_list[1][0][0]) == 2
+        info.assert_called_once_with({'id': '2'})
+
+    @mock.patch('robottelo.cli.base.Base.execute_many')
+    def test_create_many_partial_failure(self, execute_many):
+        """Check the records created before a failed create are part of the error"""
+        Base.command_requires_org = False
+        execute_many.side_effect = [
+            [
+                mock.Mock(status=0, stdout=[{'id': '1', 'name': 'foo'}], stderr=''),
+                mock.Mock(status=65, stdout=[], stderr='Error: name is taken'),
+            ],
+            [mock.Mock(status=0, stdout='Id: 1\nName: foo\n', stderr='')],
+        ]
+        with pytest.raises(CLIReturnCodeError, match='name is taken') as err:
+            Base.create_many([{'name': 'foo'}, {'name': 'foo'}])
+        assert err.value.results == [{'id': '1', 'name': 'foo'}, None]
+
+    @mock.patch('robottelo.cli.base.Base.iter_list')
+    def test_exists_without_option_and_empty_return(self, iter_list):
         """Check exists method without options and empty return"""
-        lst_method.return_value = []
+        iter_list.return_value = iter([])
         response = Base.exists(search=['id', 1])
-        lst_method.assert_called_once_with({'search': 'id=\\"1\\"'})
+        iter_list.assert_called_once_with({'search': 'id=\\"1\\"'}, page_size=1)
         assert response == []
 
-    @mock.patch('robottelo.cli.base.Base.list')
-    def test_exists_with_option_and_no_empty_return(self, lst_method):
+    @mock.patch('robottelo.cli.base.Base.iter_list')
+    def test_exists_with_option_and_no_empty_return(self, iter_list):
         """Check exists method with options and no empty return"""
-        lst_method.return_value = [1, 2]
+        iter_list.return_value = iter([1, 2])
         my_options = {'search': 'foo=bar'}
         response = Base.exists(my_options, search=['id', 1])
-        lst_method.assert_called_once_with(my_options)
+        iter_list.assert_called_once_with(my_options, page_size=1)
         assert response == 1
 
+    def test_exists_with_list_override(self):
+        """Check exists uses the list method of entities overriding it"""
+
+        class Entity(Base):
+            list = mock.Mock(return_value=[1, 2])
+            iter_list = mock.Mock()
+
+        assert Entity.exists(search=['id', 1]) == 1
+        Entity.list.assert_called_once_with({'search': 'id=\\"1\\"'})
+        Entity.iter_list.assert_not_called()
+
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_iter_list(self, construct, execute):
+        """Check iter_list requests pages lazily until a page is not full"""
+        execute.side_effect = [[1, 2], [3, 4], [5]]
+        rows = Base.iter_list({'search': 'foo=bar'}, page_size=2)
+        execute.assert_not_called()
+        assert next(rows) == 1
+        assert construct.call_args_list == [
+            mock.call({'search': 'foo=bar', 'page': 1, 'per-page': 2})
+        ]
+        assert list(rows) == [2, 3, 4, 5]
+        assert construct.call_args_list[1:] == [
+            mock.call({'search': 'foo=bar', 'page': 2, 'per-page': 2}),
+            mock.call({'search': 'foo=bar', 'page': 3, 'per-page': 2}),
+        ]
+        execute.assert_called_with(construct.return_value, output_format='csv')
+        assert Base.command_sub == 'list'
+
     @mock.patch('robottelo.cli.base.Base.command_requires_org')
     def test_info_requires_organization_id(self, _):  # noqa: PT019 - not a fixture
         """Check info raises CLIError with organization-id is not present in
@@ -370,6 +600,25 @@ class BaseCliTestCase(unittest.TestCase):
         construct.assert_called_once_with({'organization-id': 1, 'per-page': 10000})
         execute.assert_called_once_with(construct.return_value, output_format='csv')
 
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    @mock.patch('robottelo.cli.base.settings')
+    def test_list_with_parser(self, settings, construct, execute):
+        """Check list passes the configured json parser and the csv parser"""
+        settings.performance.hammer_json_parser = 'hook'
+        assert execute.return_value == Base.list(output_format='json')
+        execute.assert_called_once_with(
+            construct.return_value, output_format='json', json_parser='hook'
+        )
+        execute.reset_mock()
+        Base.list(output_format='json', json_parser='default')
+        execute.assert_called_once_with(construct.return_value, output_format='json')
+        execute.reset_mock()
+        Base.list(csv_parser='table')
+        execute.assert_called_once_with(
+            construct.return_value, output_format='csv', csv_parser='table'
+        )
+
     @mock.patch('robottelo.cli.base.Base.execute')
     @mock.patch('robottelo.cli.base.Base._construct_command')
     def test_list_without_per_page(self, construct, execute):
@@ -0,0 +1,45 @@
+"""Tests for module ``robottelo.host_helpers.cli_factory``."""
+
+from unittest import mock
+
+import pytest
+
+from robottelo.exceptions import CLIFactoryError, CLIReturnCodeError
+from robottelo.host_helpers.cli_factory import CLIFactory, create_object, create_objects
+
+
+def cli_object():
+    cli = mock.Mock(__name__='Org', create_output_fields=('id', 'name'))
+    cli.create.return_value = [{'id': '1', 'name': 'org'}]
+    return cli
+
+
+def test_create_object_eager_by_default():
+    cli = cli_object()
+    assert create_object(cli, {'name': 'org'}) == {'id': '1', 'name': 'org'}
+    cli.create.assert_called_once_with({'name': 'org'}, None)
+
+
+def test_create_object_lazy():
+    cli = cli_object()
+    create_object(cli, {}, {'name': 'org'}, lazy=True)
+    cli.create.assert_called_once_with({'name': 'org'}, None, fields=('id', 'name'))
+    cli = cli_object()
+    create_object(cli, {}, fields=['id'])
+    cli.create.assert_called_once_with({}, None, fields=['id'])
+
+
+def test_create_objects_partial_failure():
+    cli = cli_object()
+    error = CLIReturnCodeError(65, 'Error: name is taken', 'name is taken')
+    error.results = [[{'id': '1', 'name': 'org'}], None]
+    cli.create_many.side_effect = error
+    with pytest.raises(CLIFactoryError, match='name is taken') as err:
+        create_objects(cli, [{'name': 'org'}, {'name': 'org'}])
+    assert err.value.results == [{'id': '1', 'name': 'org'}, None]
+
+
+def test_make_many_without_count():
+    factory = CLIFactory(mock.Mock())
+    with pytest.raises(CLIFactoryError, match='needs a count'):
+        factory.make_many_architecture()
@@ -193,6 +193,33 @@ def simple_function_not_locked():
     return
 
 
+def simple_shared_locking_function(index=None, timeout=func_locker.LOCK_DEFAULT_TIMEOUT):
+    """Hold a shared lock of simple_locked_function, return when it was held"""
+    with func_locker.locking_function(
+        simple_locked_function, mode=func_locker.LOCK_MODE_SHARED, timeout=timeout
+    ):
+        start = time.time()
+        time.sleep(0.5)
+        return start, time.time()
+
+
+@func_locker.lock_function(permits=2)
+def simple_semaphore_function(index=None):
+    """Hold one of the 2 permits, return when it was held"""
+    start = time.time()
+    time.sleep(0.3)
+    return start, time.time()
+
+
+def _max_concurrency(periods):
+    events = sorted([(start, 1) for start, _ in periods] + [(end, -1) for _, end in periods])
+    running = max_running = 0
+    for _, change in events:
+        running += change
+        max_running = max(max_running, running)
+    return max_running
+
+
 class TestFuncLocker:
     @pytest.fixture(autouse=True)
     def count_and_pool(self):
@@ -422,3 +449,55 @@ class TestFuncLocker:
             func_locker.locking_function(simple_function_not_locked),
         ):
             pass
+
+    def test_shared_lock_in_multiprocess(self, count_and_pool):
+        """Ensure that shared lock holders run concurrently"""
+        periods = count_and_pool.map(simple_shared_locking_function, range(POOL_SIZE))
+        assert _max_concurrency(periods) > 1
+
+    def test_shared_lock_waits_for_exclusive_lock(self, count_and_pool):
+        """Ensure that shared lock holders wait for the exclusive lock holder"""
+        with func_locker.locking_function(simple_locked_function):
+            res = count_and_pool.apply_async(simple_shared_locking_function, (None, 0.5))
+            with pytest.raises(func_locker.FunctionLockerError, match=r'.*Timeout.*'):
+                res.get(timeout=5)
+        # the exclusive lock is released
+        res = count_and_pool.apply_async(simple_shared_locking_function, (None, 5))
+        assert res.get(timeout=10)
+
+    def test_semaphore_in_multiprocess(self, count_and_pool):
+        """Ensure that at most permits semaphore holders run concurrently"""
+        periods = count_and_pool.map(simple_semaphore_function, range(POOL_SIZE))
+        assert _max_concurrency(periods) == 2
+
+    def test_negative_lock_mode(self):
+        with (
+            pytest.raises(func_locker.FunctionLockerError, match=r'.*Unknown lock mode.*'),
+            func_locker.locking_function(simple_locked_function, mode='optimistic'),
+        ):
+            pass
+
+    def test_shared_lock_waits_for_waiting_exclusive_lock(self, count_and_pool):
+        """Ensure that new shared lock holders wait for the exclusive lock holders waiting"""
+        with func_locker.locking_function(
+            simple_locked_function, mode=func_locker.LOCK_MODE_SHARED
+        ):
+            exclusive = count_and_pool.apply_async(simple_locked_function)
+            time.sleep(0.5)
+            shared = count_and_pool.apply_async(simple_shared_locking_function, (None, 0.5))
+            with pytest.raises(func_locker.FunctionLockerError, match=r'.*Timeout.*'):
+                shared.get(timeout=5)
+            # a shared holder of the process does not wait for the exclusive one
+            with func_locker.locking_function(
+                simple_locked_function, mode=func_locker.LOCK_MODE_SHARED, timeout=0.5
+            ):
+                pass
+        assert exclusive.get(timeout=10)
+
+    def test_negative_shared_lock_upgrade(self):
+        with (
+            func_locker.locking_function(simple_locked_function, mode=func_locker.LOCK_MODE_SHARED),
+            pytest.raises(func_locker.FunctionLockerError, match=r'.*locked in shared mode.*'),
+            func_locker.locking_function(simple_locked_function),
+        ):
+            pass
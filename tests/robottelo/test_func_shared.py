@@ -18,6 +18,7 @@ from robottelo.utils.decorators.func_shared.shared import (
     set_default_scope,
     shared,
 )
+from robottelo.utils.decorators.func_shared.sqlite_storage import SQLiteStorageHandler
 
 DEFAULT_POOL_SIZE = 8
 SIMPLE_TIMEOUT_VALUE = 3
@@ -157,6 +158,20 @@ def simple_shared_counter_with_exception_not_restored(index=0):
     raise NotRestorableException(msg='error', details='I am not restorable')
 
 
+def _sqlite_lock_and_set(db_file, key):
+    """Lock key from a new handler and set it when nobody did, return how long the lock took"""
+    handler = SQLiteStorageHandler(db_file)
+    start = time.time()
+    with handler.lock(key) as lock_key:
+        acquired = time.time()
+        handler.when_lock_acquired(lock_key)
+        if handler.get(key) is None:
+            time.sleep(1)
+            handler.set(key, {'pid': os.getpid()})
+            return 'set', acquired - start
+    return 'get', acquired - start
+
+
 class TestFuncShared:
     @pytest.fixture(scope='class')
     def scope(self):
@@ -557,3 +572,51 @@ class TestFuncShared:
                 suffix=suffix, prefix=prefix, counter=counter_value
             )
             assert inc_string == inc_string_2
+
+
+class TestSQLiteStorageHandler:
+    @pytest.fixture
+    def db_file(self, tmp_path):
+        return str(tmp_path / 'shared_functions.db')
+
+    def test_value_shared_between_handlers(self, db_file):
+        """A value set by a handler is read by an other handler of the same database"""
+        SQLiteStorageHandler(db_file).set('key', {'value': 1})
+        handler = SQLiteStorageHandler(db_file)
+        assert handler.get('key') == {'value': 1}
+        assert handler.get('missing') is None
+
+    def test_lock_multiprocess(self, db_file):
+        """Only the first process sets the value, the waiting ones are woken up when it is set"""
+        ctx = multiprocessing.get_context('fork')
+        with ctx.Pool(DEFAULT_POOL_SIZE) as pool:
+            results = pool.starmap(_sqlite_lock_and_set, [(db_file, 'key')] * DEFAULT_POOL_SIZE)
+        assert sorted(action for action, _ in results) == ['get'] * (DEFAULT_POOL_SIZE - 1) + [
+            'set'
+        ]
+        # the processes are woken up one after an other, not after a polling interval
+        assert max(waited for _, waited in results) < 2
+
+    def test_lock_timeout(self, db_file):
+        handler = SQLiteStorageHandler(db_file)
+        with handler.lock('key'):
+            with (
+                pytest.raises(TimeoutError),
+                SQLiteStorageHandler(db_file).lock('key', timeout=0.2),
+            ):
+                pass
+            # other keys are not locked
+            with handler.lock('other_key', timeout=0):
+                pass
+        with SQLiteStorageHandler(db_file).lock('key', timeout=0):
+            pass
+
+    def test_sweep(self, db_file):
+        """Values older than the share timeout are deleted"""
+        handler = SQLiteStorageHandler(db_file, share_timeout=1)
+        handler.set('key', 'value')
+        assert handler.sweep() == 0
+        time.sleep(1.1)
+        assert handler.sweep() == 0  # swept recently
+        assert handler.sweep(force=True) == 1
+        assert handler.get('key') is None
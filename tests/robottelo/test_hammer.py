@@ -1,7 +1,13 @@
 """Tests for Robottelo's hammer helpers"""
 
+from pathlib import Path
+
+import pytest
+
 from robottelo.cli import hammer
 
+HAMMER_INFO_OUTPUTS = sorted((Path(__file__).parent / 'data' / 'hammer_info').glob('*.txt'))
+
 
 class TestParseCSV:
     """Tests for parsing CSV hammer output"""
@@ -23,6 +29,42 @@ class TestParseCSV:
             {'header': 'unicode', 'header-2': 'chårs'},
         ]
 
+    def test_parse_csv_table(self):
+        """Can parse CSV output into a columnar table"""
+        output = '\n'.join(
+            [
+                'Id,Name,Installable Errata',
+                '1,host1.example.com,3',
+                '2,host2.example.com,0',
+                '',
+                '3,host3.example.com,3',
+                '4,host4.example.com',
+            ]
+        )
+        table = hammer.parse_csv(output, 'table')
+        assert isinstance(table, hammer.CSVTable)
+        assert table.header == ('id', 'name', 'installable-errata')
+        assert table.rows[0] == ('1', 'host1.example.com', '3')
+        assert table == hammer.parse_csv(output)
+        assert len(table) == 4
+        assert table[-1] == {'id': '4', 'name': 'host4.example.com', 'installable-errata': None}
+        assert table.column('name')[1:3] == ('host2.example.com', 'host3.example.com')
+        assert table.numeric_column('id').tolist() == [1, 2, 3, 4]
+        assert table.filter('installable-errata', '3').column('id') == ('1', '3')
+        assert table.filter('id', lambda value: int(value) > 2).column('id') == ('3', '4')
+        assert table.find('name', 'host2.example.com') == {
+            'id': '2',
+            'name': 'host2.example.com',
+            'installable-errata': '0',
+        }
+        assert table.find('name', 'host5.example.com') is None
+
+    def test_parse_csv_table_empty(self):
+        """Can parse an empty CSV output into an empty table"""
+        table = hammer.parse_csv('', 'table')
+        assert table.header == ()
+        assert table == []
+
 
 class TestParseJSON:
     """Tests for parsing JSON hammer output"""
@@ -82,6 +124,48 @@ class TestParseJSON:
             'name': 'Default Organization View',
         }
 
+    @pytest.mark.parametrize('parser', ['hook', 'lazy'])
+    def test_parse_json_parsers(self, parser):
+        """The opt-in parsers normalize the same way the default one does"""
+        output = '\n'.join(
+            [
+                '{',
+                '  "Total": 1',
+                '}',
+                '{',
+                '  "ID": 12,',
+                '  "Name": "rhel9-client.example.com",',
+                '  "Host Group": null,',
+                '  "Managed": false,',
+                '  "Content Information": {',
+                '    "Content View": {"ID": 4, "Name": "RHEL9 CV"},',
+                '    "Errata Counts": [3, 0, 1.5]',
+                '  },',
+                '  "Network Interfaces": [{"ID": 14, "MAC Address": "52:54:00:1b:5f:7e"}]',
+                '}',
+            ]
+        )
+        result = hammer.parse_json(output, parser)
+        assert result == hammer.parse_json(output)
+        assert result['content-information']['content-view']['id'] == '4'
+        assert result['network-interfaces'][-1]['mac-address'] == '52:54:00:1b:5f:7e'
+
+    def test_parse_json_lazy_views(self):
+        """The lazy parser returns read-only views normalizing on access"""
+        result = hammer.parse_json('[{"ID": 1, "Host Group": {"Title": "hg"}}, {"ID": 2}]', 'lazy')
+        assert isinstance(result, hammer.LazyJSONList)
+        assert isinstance(result[0], hammer.LazyJSONMapping)
+        assert result[0] is result[0]
+        assert list(result[0]) == ['id', 'host-group']
+        assert 'Host Group' not in result[0]
+        assert result[1:] == [{'id': '2'}]
+        assert result.to_list() == [{'id': '1', 'host-group': {'title': 'hg'}}, {'id': '2'}]
+        assert type(result.to_list()[0]['host-group']) is dict
+        with pytest.raises(KeyError):
+            result[1]['name']
+        with pytest.raises(TypeError):
+            result[1]['name'] = 'host'
+
     def test_parsed_json_match_parsed_csv(self):
         """Output generated by:
         JSON:
@@ -531,6 +615,35 @@ class TestParseInfo:
             'host-collections': {},
         }
 
+    @pytest.mark.parametrize('chunk_size', [1, 7, 64, 4096])
+    @pytest.mark.parametrize('path', HAMMER_INFO_OUTPUTS, ids=lambda path: path.stem)
+    def test_parse_info_stream(self, path, chunk_size):
+        """Parsing chunks of an output gives the same result as parsing it whole"""
+        output = path.read_text()
+        chunks = (output[i : i + chunk_size] for i in range(0, len(output), chunk_size))
+        assert hammer.parse_info(chunks) == hammer.parse_info(output)
+
+    def test_parse_info_sample_output(self):
+        """Can parse a sample host info output"""
+        result = hammer.parse_info(
+            (Path(__file__).parent / 'data' / 'hammer_info' / 'host_info.txt').read_text()
+        )
+        assert result['name'] == 'rhel9-client.example.com'
+        assert [nic['identifier'] for nic in result['network-interfaces']] == ['eth0', 'eth1']
+        assert result['all-parameters']['host_registration_insights'] == 'true'
+        assert result['content-information']['applicable-errata']['security'] == '6'
+        assert result['subscription-information']['registered-by-activation-keys'] == [
+            'rhel9-ak',
+            'custom-products-ak',
+        ]
+        assert result['host-collections'][1] == {'id': '5', 'name': 'rhel9-hosts'}
+
+    def test_iter_lines(self):
+        """Lines split between chunks are joined, line breaks split the same as splitlines"""
+        output = 'Name: a\r\nId: 1\n\nLabel: b\rEnd'
+        chunks = ['Na', 'me: a\r', '\nId', ': 1\n', '\nLabel: b\r', '', 'End']
+        assert list(hammer.iter_lines(chunks)) == output.splitlines()
+
     def test_parse_json_list(self):
         """Can parse a list in json"""
         assert hammer.parse_json('["item1", "item2"]') == ['item1', 'item2']
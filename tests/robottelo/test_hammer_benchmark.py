@@ -0,0 +1,58 @@
+"""Benchmarks of Robottelo's hammer output parsers
+
+Run with ``pytest tests/robottelo/test_hammer_benchmark.py --benchmark-only``, they are
+skipped otherwise. The outputs are synthetic samples of ``hammer <entity> info`` outputs from
+tests/robottelo/data/hammer_info.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from robottelo.cli import hammer
+
+pytest.importorskip('pytest_benchmark')
+
+HAMMER_INFO_OUTPUTS = sorted((Path(__file__).parent / 'data' / 'hammer_info').glob('*.txt'))
+
+
+@pytest.fixture(autouse=True)
+def benchmark_only(request):
+    if not request.config.getoption('benchmark_only'):
+        pytest.skip('benchmarks only run with --benchmark-only')
+
+
+@pytest.fixture(params=HAMMER_INFO_OUTPUTS, ids=lambda path: path.stem)
+def info_output(request):
+    return request.param.read_text()
+
+
+def test_benchmark_parse_info(benchmark, info_output):
+    """Parse a whole info output"""
+    assert benchmark(hammer.parse_info, info_output)
+
+
+def test_benchmark_parse_info_stream(benchmark, info_output):
+    """Parse an info output read in chunks of 1 KiB"""
+    chunks = [info_output[i : i + 1024] for i in range(0, len(info_output), 1024)]
+    assert benchmark(lambda: hammer.parse_info(iter(chunks)))
+
+
+def test_benchmark_parse_info_large(benchmark):
+    """Parse the info output of an entity with a thousand listed items"""
+    output = '\n'.join(
+        [
+            'Id: 1',
+            'Name: large',
+            'Yum Repositories:',
+            *(
+                line
+                for i in range(1, 1001)
+                for line in (f' {i}) Id:    {i}', f'    Name:  repo{i}', f'    Label: repo{i}')
+            ),
+            'Activation Keys:',
+            *(f' {i}) ak{i}' for i in range(1, 1001)),
+        ]
+    )
+    result = benchmark(hammer.parse_info, output)
+    assert len(result['yum-repositories']) == len(result['activation-keys']) == 1000
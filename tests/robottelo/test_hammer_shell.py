@@ -0,0 +1,86 @@
+"""Tests for module ``robottelo.cli.hammer_shell``."""
+
+import json
+import threading
+from unittest import mock
+
+import pytest
+
+from robottelo.cli import hammer_shell
+from robottelo.exceptions import CLIError, PersistentShellError
+
+
+class FakeShell:
+    """Persistent shell running the hammer driver, answering every command with ``status``"""
+
+    instances = []
+
+    def __init__(self, hostname, **credentials):
+        self.hostname = hostname
+        self.lines = []
+        self.sent = []
+        self.dead = False
+        self.running = False
+        self.instances.append(self)
+
+    def open(self):
+        self.running = True
+        self.lines.append(hammer_shell.HAMMER_SHELL_READY)
+
+    def alive(self):
+        return self.running and not self.dead
+
+    def send(self, text):
+        self.sent.append(text)
+        if not text.startswith('LANG='):
+            self.lines.append(json.dumps({'status': 0, 'stdout': text, 'stderr': ''}))
+
+    def readline(self):
+        if self.dead or not self.lines:
+            raise PersistentShellError('closed')
+        return self.lines.pop(0)
+
+    def close(self):
+        self.running = False
+
+
+@pytest.fixture
+def shells():
+    FakeShell.instances = []
+    with (
+        mock.patch.object(hammer_shell, 'PersistentShell', FakeShell),
+        mock.patch.object(hammer_shell, 'get_client'),
+        mock.patch('robottelo.config.settings'),
+    ):
+        yield FakeShell.instances
+    hammer_shell.close_hammer_shells()
+
+
+def test_restart_dead_process(shells):
+    shell = hammer_shell.HammerShell('sat.example.com', locale='en_US')
+    assert shell.run(['ping']).stdout == '["ping"]'
+    shells[0].dead = True
+    assert shell.run(['status']).stdout == '["status"]'
+    assert len(shells) == 2
+    # the process exits while running a command, the next command starts a new one
+    shells[1].lines.append('not sent')
+    shells[1].readline = mock.Mock(side_effect=PersistentShellError('closed'))
+    with pytest.raises(CLIError, match='exited while running a command'):
+        shell.run(['ping'])
+    assert not shell.running
+    assert shell.run(['ping']).status == 0
+    assert len(shells) == 3
+
+
+def test_shells_per_thread(shells):
+    own = hammer_shell.get_hammer_shell('sat.example.com', 'admin', 'changeme')
+    assert hammer_shell.get_hammer_shell('sat.example.com', 'admin', 'changeme') is own
+    other = []
+    thread = threading.Thread(
+        target=lambda: other.append(
+            hammer_shell.get_hammer_shell('sat.example.com', 'admin', 'changeme')
+        )
+    )
+    thread.start()
+    thread.join()
+    assert other[0] is not own
@@ -0,0 +1,128 @@
+"""Tests for module ``robottelo.utils.host_facts``."""
+
+import time
+from unittest import mock
+
+import pytest
+
+from robottelo.utils import host_facts as host_facts_module
+from robottelo.utils.host_facts import HostFactCache, cached_host_fact
+
+
+class FakeHost:
+    def __init__(self, hostname, container=False):
+        self.hostname = hostname
+        self.is_container = container
+        self.calls = 0
+
+    @property
+    def fact_cache_hostname(self):
+        return None if self.is_container else self.hostname
+
+    @cached_host_fact
+    def arch(self):
+        self.calls += 1
+        return 'x86_64'
+
+    @cached_host_fact
+    def _os_release(self):
+        self.calls += 1
+        return {'ID': 'rhel', 'VERSION_ID': '9.6'}
+
+
+@pytest.fixture
+def host_facts(tmp_path):
+    cache = HostFactCache(tmp_path / 'host_facts', ttl=60)
+    with mock.patch.object(host_facts_module, 'host_facts', cache):
+        yield cache
+
+
+def test_facts_shared_by_hostname(host_facts, tmp_path):
+    """Facts got by a host object are read by the other objects of the same host."""
+    first = FakeHost('host.example.com')
+    assert first.arch == 'x86_64'
+    assert first._os_release['VERSION_ID'] == '9.6'
+    assert first.calls == 2
+    second = FakeHost('host.example.com')
+    assert second.arch == 'x86_64'
+    assert second._os_release == {'ID': 'rhel', 'VERSION_ID': '9.6'}
+    assert second.calls == 0
+    # other processes read the facts from the cache file
+    assert HostFactCache(tmp_path / 'host_facts', ttl=60).get('host.example.com', 'arch') == (
+        'x86_64'
+    )
+    other = FakeHost('other.example.com')
+    assert other.arch == 'x86_64'
+    assert other.calls == 1
+
+
+def test_containers_not_shared(host_facts):
+    assert FakeHost('container', container=True).arch == 'x86_64'
+    container = FakeHost('container', container=True)
+    assert container.arch == 'x86_64'
+    assert container.calls == 1
+
+
+def test_invalidate(host_facts):
+    host = FakeHost('host.example.com')
+    assert (host.arch, host._os_release['ID']) == ('x86_64', 'rhel')
+    host_facts.invalidate('host.example.com', names=['arch'])
+    host = FakeHost('host.example.com')
+    assert (host.arch, host._os_release['ID']) == ('x86_64', 'rhel')
+    assert host.calls == 1
+    host_facts.invalidate('host.example.com')
+    host = FakeHost('host.example.com')
+    assert host._os_release['ID'] == 'rhel'
+    assert host.calls == 1
+
+
+def test_satellite_version_shared(host_facts):
+    """A new Satellite object of the same host gets its version without running a command."""
+    from robottelo.hosts import Satellite
+
+    with mock.patch.object(Satellite, 'execute') as execute:
+        execute.return_value = mock.Mock(status=0, stdout='6.18.0')
+        assert Satellite(hostname='sat.example.com', net_type='ipv4').version == '6.18.0'
+        execute.reset_mock()
+        satellite = Satellite(hostname='sat.example.com', net_type='ipv4')
+        assert satellite.version == '6.18.0'
+        assert not satellite.is_upstream
+        execute.assert_not_called()
+        # e.g. after an upgrade
+        satellite.clean_cached_properties()
+        execute.return_value = mock.Mock(status=0, stdout='6.19.0')
+        assert Satellite(hostname='sat.example.com', net_type='ipv4').version == '6.19.0'
+
+
+def test_ttl(tmp_path):
+    cache = HostFactCache(tmp_path, ttl=0.2)
+    cache.set('host.example.com', 'arch', 'x86_64')
+    assert cache.get('host.example.com', 'arch') == 'x86_64'
+    time.sleep(0.3)
+    assert cache.get('host.example.com', 'arch', None) is None
+    disabled = HostFactCache(tmp_path, ttl=0)
+    disabled.set('host.example.com', 'arch', 'x86_64')
+    assert disabled.get('host.example.com', 'arch', None) is None
+
+
+def test_unserializable_value(tmp_path):
+    cache = HostFactCache(tmp_path, ttl=60)
+    cache.set('host.example.com', 'arch', 'x86_64')
+    cache.set('host.example.com', 'object', object())
+    assert cache.get('host.example.com', 'object', None) is None
+    assert HostFactCache(tmp_path, ttl=60).get('host.example.com', 'arch') == 'x86_64'
+
+
+def test_changed_by_other_process(tmp_path):
+    cache = HostFactCache(tmp_path, ttl=60)
+    other = HostFactCache(tmp_path, ttl=60)
+    cache.set('host.example.com', 'arch', 'x86_64')
+    assert other.get('host.example.com', 'arch') == 'x86_64'
+    cache.set('host.example.com', 'arch', 'aarch64')
+    assert other.get('host.example.com', 'arch') == 'aarch64'
+    cache.invalidate('host.example.com')
+    assert other.get('host.example.com', 'arch', None) is None
+    other.set('host.example.com', 'arch', 'x86_64')
+    other.clear()
+    assert cache.get('host.example.com', 'arch', None) is None
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,86 @@
+"""Tests for module ``robottelo.utils.host_group``."""
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from robottelo.exceptions import ContentHostError, HostGroupError
+from robottelo.utils.host_group import HostGroupExecutor
+
+
+class FakeHost:
+    def __init__(self, name, status=0, delay=0):
+        self.name = name
+        self.status = status
+        self.delay = delay
+
+    def execute(self, cmd, timeout=None):
+        time.sleep(self.delay)
+        return mock.Mock(stdout=f'{self.name}: {cmd}', status=self.status, stderr='')
+
+    def fail(self):
+        raise ValueError(self.name)
+
+    def __str__(self):
+        return self.name
+
+
+@pytest.fixture(autouse=True)
+def session_pool():
+    with mock.patch('robottelo.utils.host_group.session_pool') as pool:
+        yield pool
+
+
+def test_execute_keeps_host_order(session_pool):
+    hosts = [FakeHost(f'host{i}', delay=0.01 * (5 - i)) for i in range(5)]
+    results = HostGroupExecutor(hosts).execute('hostname')
+    assert [result.stdout for result in results] == [f'host{i}: hostname' for i in range(5)]
+    assert session_pool.release_thread.call_count == 5
+
+
+def test_max_workers_bounds_concurrency():
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def action(host):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+
+    HostGroupExecutor([FakeHost(f'host{i}') for i in range(8)], max_workers=3).map(action)
+    assert peak[0] == 3
+
+
+def test_failures_are_aggregated():
+    hosts = [FakeHost('host0'), FakeHost('host1'), FakeHost('host2')]
+    with pytest.raises(HostGroupError, match='Failed on 2 host') as context:
+        HostGroupExecutor(hosts).map(lambda host: host.fail() if host.name != 'host1' else 1)
+    assert [host for host, _ in context.value.failures] == [hosts[0], hosts[2]]
+    assert context.value.results[1] == 1
+    results = HostGroupExecutor(hosts).call('fail', raise_on_error=False)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_execute_check_reports_failed_status():
+    hosts = [FakeHost('host0'), FakeHost('host1', status=1)]
+    assert [r.status for r in HostGroupExecutor(hosts).execute('false')] == [0, 1]
+    with pytest.raises(HostGroupError, match='host1') as context:
+        HostGroupExecutor(hosts).execute('false', check=True)
+    assert len(context.value.failures) == 1
+    results = HostGroupExecutor(hosts).execute('false', check=True, raise_on_error=False)
+    assert results[0].status == 0
+    assert isinstance(results[1], ContentHostError)
+
+
+def test_timeout_counts_per_host():
+    hosts = [FakeHost('host0', delay=0.3), FakeHost('host1', delay=0.1), FakeHost('host2')]
+    results = HostGroupExecutor(hosts, max_workers=1, timeout=0.2).execute(
+        'true', raise_on_error=False
+    )
+    assert isinstance(results[0], TimeoutError)
+    # the later hosts waited for a worker longer than the timeout, but ran within it
+    assert results[1].status == results[2].status == 0
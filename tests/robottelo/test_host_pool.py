@@ -0,0 +1,118 @@
+"""Tests for module ``robottelo.utils.host_pool``."""
+
+from itertools import count
+import threading
+from unittest import mock
+
+import pytest
+
+from robottelo.utils.host_pool import WarmHostPool
+
+
+class FakeHost:
+    def __init__(self, hostname):
+        self.hostname = hostname
+
+    @classmethod
+    def get_host_by_hostname(cls, hostname):
+        return cls(hostname)
+
+
+@pytest.fixture
+def checkout():
+    numbers = count()
+    gate = threading.Event()
+    gate.set()
+
+    def checkout():
+        gate.wait()
+        return FakeHost(f'sat{next(numbers)}.example.com')
+
+    checkout.gate = gate
+    return checkout
+
+
+def make_pool(tmp_path, checkout, size=2):
+    return WarmHostPool('satellite', FakeHost, checkout, size, pool_dir=tmp_path, poll_interval=0)
+
+
+def test_pool_is_shared_and_replenished(tmp_path, checkout):
+    first, second = make_pool(tmp_path, checkout), make_pool(tmp_path, checkout)
+    first.start()
+    second.start()
+    for thread in first._threads:
+        thread.join()
+    # the second member found the pool already provisioning
+    assert not second._threads
+    taken = {second.get().hostname}
+    # the host taken out is replaced in the background
+    assert len(second._threads) == 1
+    taken.add(first.get().hostname)
+    assert taken == {'sat0.example.com', 'sat1.example.com'}
+    for thread in first._threads + second._threads:
+        thread.join()
+    with mock.patch.object(WarmHostPool, 'checkin') as checkin:
+        first.stop()
+        checkin.assert_not_called()
+        second.stop()
+    assert {host.hostname for host in checkin.call_args.args[0]} == {
+        'sat2.example.com',
+        'sat3.example.com',
+    }
+    assert not (tmp_path / first.pool_file.name).exists()
+
+
+def test_get_waits_for_pending_checkouts(tmp_path, checkout):
+    checkout.gate.clear()
+    pool = make_pool(tmp_path, checkout, size=1)
+    pool.start()
+    assert pool.get(timeout=0) is None
+    threading.Timer(0.1, checkout.gate.set).start()
+    assert pool.get(timeout=5).hostname == 'sat0.example.com'
+    for thread in pool._threads:
+        thread.join()
+    with mock.patch.object(WarmHostPool, 'checkin'):
+        pool.stop()
+
+
+def test_get_without_hosts(tmp_path):
+    def broken_checkout():
+        raise RuntimeError('no capacity')
+
+    pool = make_pool(tmp_path, broken_checkout)
+    pool.start()
+    assert pool.get() is None
+    pool.stop()
+
+
+def test_stop_does_not_wait_for_checkouts(tmp_path, checkout):
+    checkout.gate.clear()
+    pool = make_pool(tmp_path, checkout, size=1)
+    pool.start()
+    with mock.patch.object(WarmHostPool, 'checkin') as checkin:
+        pool.stop()
+        assert pool._threads[0].is_alive()
+        # the host provisioned after the pool stopped is checked in by its thread
+        checkout.gate.set()
+        pool._threads[0].join(timeout=5)
+    assert [host.hostname for host in checkin.call_args.args[0]] == ['sat0.example.com']
+
+
+def test_failed_checkout_is_retried(tmp_path, checkout):
+    attempts = []
+
+    def flaky_checkout():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError('no capacity')
+        return checkout()
+
+    pool = make_pool(tmp_path, flaky_checkout, size=1)
+    pool.start()
+    assert pool.get(timeout=5).hostname == 'sat0.example.com'
+    for thread in pool._threads:
+        thread.join()
+    # 3 attempts, then the checkout of the replacement
+    assert len(attempts) == 4
+    with mock.patch.object(WarmHostPool, 'checkin'):
+        pool.stop()
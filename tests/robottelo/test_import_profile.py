@@ -0,0 +1,96 @@
+"""Tests for modules ``robottelo.utils.import_profile`` and ``robottelo.utils.lazy``."""
+
+import subprocess
+import sys
+import types
+
+import pytest
+
+from robottelo.utils.import_profile import ImportProfiler, format_report, summarize
+from robottelo.utils.lazy import lazy_attributes, lazy_import
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    """A package importing a slow module, removed from ``sys.modules`` afterwards"""
+    package_dir = tmp_path / 'slowpkg'
+    package_dir.mkdir()
+    (package_dir / '__init__.py').write_text('import time\n\ntime.sleep(0.05)\n')
+    (package_dir / 'slow.py').write_text('import time\n\ntime.sleep(0.1)\nVALUE = 42\n')
+    (package_dir / 'main.py').write_text('from slowpkg import slow\n\nEXECUTED = True\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield 'slowpkg'
+    for name in [name for name in sys.modules if name.split('.')[0] == 'slowpkg']:
+        del sys.modules[name]
+
+
+def test_import_profiler(package):
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        import slowpkg.main
+    finally:
+        profiler.uninstall()
+    assert not profiler.installed
+    records = profiler.records
+    assert set(records) == {'slowpkg', 'slowpkg.main', 'slowpkg.slow'}
+    assert records['slowpkg.slow']['self'] >= 0.1
+    assert records['slowpkg.main']['self'] < 0.05
+    assert records['slowpkg.main']['cumulative'] >= 0.1
+    # the modules keep their own loader
+    assert type(slowpkg.main.__loader__).__name__ == 'SourceFileLoader'
+    assert slowpkg.main.__spec__.loader is slowpkg.main.__loader__
+    modules, packages = summarize(records, top=2)
+    assert [module['name'] for module in modules] == ['slowpkg.slow', 'slowpkg']
+    assert packages[0]['name'] == 'slowpkg'
+    assert packages[0]['self'] == pytest.approx(sum(r['self'] for r in records.values()))
+    lines = format_report(records, top=2)
+    assert lines[0].startswith('3 modules imported in')
+    assert lines[2].endswith('slowpkg.slow')
+
+
+def test_lazy_import(package):
+    slow = lazy_import('slowpkg.slow')
+    # the parent package is imported, the module itself not yet
+    assert 'slowpkg' in sys.modules
+    assert sys.modules['slowpkg'].slow is slow
+    # without the module attribute lookup executing it
+    assert 'VALUE' not in object.__getattribute__(slow, '__dict__')
+    assert slow.VALUE == 42
+    assert lazy_import('slowpkg.slow') is slow
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import('slowpkg.missing')
+
+
+def test_lazy_attributes(monkeypatch):
+    module = types.ModuleType('lazy_module')
+    factory_calls = []
+
+    def factory():
+        factory_calls.append(1)
+        return ['value']
+
+    module.__getattr__ = lazy_attributes('lazy_module', VALUE=factory)
+    monkeypatch.setitem(sys.modules, 'lazy_module', module)
+    assert module.VALUE == ['value']
+    assert module.VALUE is module.VALUE
+    assert len(factory_calls) == 1
+    with pytest.raises(AttributeError, match='has no attribute'):
+        module.MISSING  # noqa: B018
+
+
+def test_constants_heavy_imports_lazy():
+    """Importing robottelo.constants does not import nailgun and box"""
+    result = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys, robottelo.constants as c; '
+            'print(sorted({"box", "nailgun"} & set(sys.modules))); '
+            'print(c.DataFile.DATA_DIR, "box" in sys.modules)',
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.splitlines() == ['[]', 'tests/foreman/data True']
@@ -0,0 +1,117 @@
+"""Tests for module ``robottelo.utils.io``."""
+
+import hashlib
+import io
+import json
+import tarfile
+
+import pytest
+
+from robottelo.utils import io as robottelo_io
+from robottelo.utils.io import (
+    count_json_array,
+    get_file_checksum,
+    get_local_file_data,
+    get_report_data,
+    get_report_metadata,
+    inspect_report,
+)
+
+HOST = {
+    'fqdn': 'host[0].example.com',
+    'tags': [{'key': 'a,b', 'value': '{"quoted": [1, 2]}'}, {'key': 'esc\\"aped]'}],
+    'facts': [],
+    'hosts': [],
+}
+
+
+def write_report(path, slices):
+    metadata = {
+        'source': 'Satellite',
+        'report_slices': {name: {'number_hosts': count} for name, count in slices.items()},
+    }
+    files = {'metadata.json': metadata}
+    for name, count in slices.items():
+        files[f'{name}.json'] = {'report_slice_id': name, 'hosts': [HOST] * count}
+    with tarfile.open(path, mode='w:xz') as tarobj:
+        for name, content in files.items():
+            data = json.dumps(content, indent=2).encode()
+            info = tarfile.TarInfo(f'report/{name}')
+            info.size = len(data)
+            tarobj.addfile(info, io.BytesIO(data))
+    return path
+
+
+@pytest.mark.parametrize(
+    ('document', 'count'),
+    [
+        ({'hosts': []}, 0),
+        ({'hosts': [1]}, 1),
+        ({'hosts': [123456, 1.5e10, True, 'é' * 50]}, 4),
+        ({'hosts': [HOST] * 3, 'other': [1, 2, 3, 4]}, 3),
+        ({'other': {'hosts': [1, 2]}, 'hosts': [None, 'x', [], {}]}, 4),
+        ({'hosts"': [1], 'key': 'hosts', 'hosts': [HOST, 2]}, 2),
+    ],
+)
+@pytest.mark.parametrize('chunk_size', [1, 3, 4096])
+def test_count_json_array(document, count, chunk_size, monkeypatch):
+    monkeypatch.setattr(robottelo_io, 'CHUNK_SIZE', chunk_size)
+    data = json.dumps(document, indent=1).encode()
+    assert count_json_array(io.BytesIO(data), 'hosts') == count
+
+
+def test_count_json_array_errors():
+    with pytest.raises(KeyError):
+        count_json_array(io.BytesIO(b'{"other": [1]}'), 'hosts')
+    for document in (
+        b'',
+        b'{"hosts": [1, 2',
+        b'{"hosts": [1, "2]}',
+        b'{"hosts": [1}]',
+        b'{"hosts": [1, tru]}',
+        b'{"hosts": []} []',
+    ):
+        with pytest.raises(ValueError, match='Expecting|Unterminated|Extra data'):
+            count_json_array(io.BytesIO(document), 'hosts')
+
+
+def test_inspect_report(tmp_path, monkeypatch):
+    # several chunks, splitting the members
+    monkeypatch.setattr(robottelo_io, 'CHUNK_SIZE', 100)
+    path = write_report(tmp_path / 'report.tar.xz', {'slice_1': 3, 'slice_2': 5})
+    content = path.read_bytes()
+    info = inspect_report(path, report_data=True)
+    assert info['size'] == len(content)
+    assert info['checksum'] == hashlib.sha256(content).hexdigest() == get_file_checksum(path)
+    assert info['extractable']
+    assert info['json_files_parsable']
+    assert (
+        info['metadata_counts'] == info['slices_counts'] == {'slice_1.json': 3, 'slice_2.json': 5}
+    )
+    assert info['metadata'] == get_report_metadata(path)
+    assert info['metadata']['source'] == 'Satellite'
+    assert info['report_data'] == get_report_data(path)
+    assert info['report_data']['report_slice_id'] == 'slice_2'
+    assert get_local_file_data(path) == {
+        key: info[key]
+        for key in (
+            'size',
+            'checksum',
+            'extractable',
+            'json_files_parsable',
+            'metadata_counts',
+            'slices_counts',
+        )
+    }
+
+
+def test_inspect_report_damaged(tmp_path):
+    path = write_report(tmp_path / 'report.tar.xz', {'slice_1': 3})
+    content = path.read_bytes()
+    content = content[: len(content) // 2]
+    path.write_bytes(content)
+    info = inspect_report(path)
+    assert not info['extractable']
+    assert not info['json_files_parsable']
+    assert info['checksum'] == hashlib.sha256(content).hexdigest()
+    assert 'slices_counts' not in info
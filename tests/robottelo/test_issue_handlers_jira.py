@@ -1,5 +1,7 @@
 """Tests for module ``robottelo.utils.issue_handlers.jira``."""
 
+import json
+import time
 from unittest import mock
 
 import pytest
@@ -111,6 +113,58 @@ class TestJiraIssueHandler:
         assert cache.get('SAT-1') == data | {'timestamp': mock.ANY}
         assert cache.get('SAT-2') is None
 
+    @pytest.fixture
+    def sqlite_cache_settings(self, tmp_path):
+        with (
+            mock.patch(
+                'robottelo.utils.issue_handlers.jira.settings.jira.cache_file',
+                str(tmp_path / 'cache.json'),
+            ),
+            mock.patch(
+                'robottelo.utils.issue_handlers.jira.settings.jira.cache_ttl_days',
+                7,
+            ),
+        ):
+            yield tmp_path
+
+    def test_sqlite_jira_status_cache_is_shared(self, sqlite_cache_settings):
+        """SQLiteJiraStatusCache stores every update so other instances see it at once."""
+        db_file = sqlite_cache_settings / 'cache.db'
+        cache = jira.SQLiteJiraStatusCache(db_file)
+        other = jira.SQLiteJiraStatusCache(db_file)
+        data = {'key': 'SAT-1', 'status': 'Open'}
+        cache.update('SAT-1', data)
+        assert other.get('SAT-1') == data | {'timestamp': mock.ANY}
+        assert other.get('SAT-2') is None
+        assert other.get_many(['SAT-1', 'SAT-2']) == {
+            'SAT-1': data | {'timestamp': mock.ANY},
+            'SAT-2': None,
+        }
+        cache.update('SAT-1', data | {'status': 'Closed'})
+        assert other.get('SAT-1')['status'] == 'Closed'
+
+    def test_sqlite_jira_status_cache_json_import_export(self, sqlite_cache_settings):
+        """SQLiteJiraStatusCache imports the JSON cache file without expired entries and
+        exports it back."""
+        now = time.time()
+        json_file = sqlite_cache_settings / 'cache.json'
+        json_file.write_text(
+            json.dumps(
+                {
+                    'issues': {
+                        'SAT-1': {'key': 'SAT-1', 'status': 'New', 'timestamp': now},
+                        'SAT-2': {'key': 'SAT-2', 'status': 'New', 'timestamp': now - 8 * 86400},
+                    }
+                }
+            )
+        )
+        cache = jira.SQLiteJiraStatusCache(sqlite_cache_settings / 'cache.db')
+        assert cache.get('SAT-1')['status'] == 'New'
+        assert cache.get('SAT-2') is None
+        cache.update('SAT-3', {'key': 'SAT-3', 'status': 'Closed'})
+        cache.export_json()
+        assert set(json.loads(json_file.read_text())['issues']) == {'SAT-1', 'SAT-3'}
+
     def test_get_jira_returns_issue_objects_from_search(self):
         """get_jira returns list of Issue objects (mocked client)."""
         mock_issues = [mock.Mock(key='SAT-1'), mock.Mock(key='SAT-2')]
@@ -142,6 +196,80 @@ class TestJiraIssueHandler:
         assert result[0]['is_open'] is True
 
 
+class TestPrefetchJira:
+    """Batched prefetch of the Jira issues referenced by the collected tests."""
+
+    @pytest.fixture(autouse=True)
+    def prefetch_env(self, monkeypatch):
+        monkeypatch.setitem(jira.CACHED_RESPONSES, 'get_single', {})
+        monkeypatch.setattr(
+            jira,
+            'jira_cache',
+            mock.Mock(get=lambda issue_id: None, get_many=lambda ids: dict.fromkeys(ids)),
+        )
+        monkeypatch.setattr(jira, 'PREFETCH_CHUNK_SIZE', 2)
+        monkeypatch.setattr(jira.time, 'sleep', mock.Mock())
+        monkeypatch.setattr(settings.jira, 'email', 'user@example.com')
+        monkeypatch.setattr(settings.jira, 'api_key', 'key')
+        client = mock.Mock()
+        monkeypatch.setattr(jira, '_jira_client', lambda: client)
+        return client
+
+    @staticmethod
+    def _issues(jql_str, fields, maxResults):
+        keys = jql_str.removeprefix('key in (').removesuffix(')').split(', ')
+        return [
+            mock.Mock(key=key, fields=mock.Mock(status=None, labels=[], resolution=None))
+            for key in keys
+        ]
+
+    def test_prefetch_searches_missing_issues_in_chunks(self, prefetch_env):
+        """Issues are searched in chunked ``key in`` queries, cached issues are skipped."""
+        prefetch_env.search_issues.side_effect = self._issues
+        jira.jira_cache.get_many = lambda ids: {i: None for i in ids} | {'SAT-1': _flat_issue()}
+        result = jira.prefetch_jira(['SAT-1', 'SAT-2', ' SAT-3', 'SAT-4', 'SAT-5', 'SAT-2'])
+        assert set(result) == {'SAT-1', 'SAT-2', 'SAT-3', 'SAT-4', 'SAT-5'}
+        assert sorted(c.kwargs['jql_str'] for c in prefetch_env.search_issues.call_args_list) == [
+            'key in (SAT-2, SAT-3)',
+            'key in (SAT-4, SAT-5)',
+        ]
+        assert jira.jira_cache.update.call_count == 4
+        assert jira.try_from_cache('SAT-4')['key'] == 'SAT-4'
+        # everything is resolved already
+        assert jira.prefetch_jira(['SAT-1', 'SAT-5']) == {}
+        assert prefetch_env.search_issues.call_count == 2
+
+    def test_prefetch_backs_off_when_rate_limited(self, prefetch_env):
+        """A rate limited search is retried after the Retry-After delay."""
+        rate_limited = jira.JIRAError(status_code=429)
+        rate_limited.response = mock.Mock(headers={'Retry-After': '7'})
+        prefetch_env.search_issues.side_effect = [
+            rate_limited,
+            self._issues('key in (SAT-1)', '', 1),
+        ]
+        assert set(jira.prefetch_jira(['SAT-1'])) == {'SAT-1'}
+        jira.time.sleep.assert_called_once_with(7.0)
+
+    def test_prefetch_isolates_unknown_issues(self, prefetch_env, monkeypatch):
+        """A query rejected for an unknown key is split until the key is left out."""
+
+        def search(jql_str, fields, maxResults):
+            if 'SAT-404' in jql_str:
+                raise jira.JIRAError(status_code=400, text='SAT-404 does not exist')
+            return self._issues(jql_str, fields, maxResults)
+
+        prefetch_env.search_issues.side_effect = search
+        monkeypatch.setattr(jira, 'PREFETCH_CHUNK_SIZE', 3)
+        assert set(jira.prefetch_jira(['SAT-1', 'SAT-2', 'SAT-404'])) == {'SAT-1', 'SAT-2'}
+        assert prefetch_env.search_issues.call_count == 5
+
+    def test_prefetch_without_credentials_does_not_call_api(self, prefetch_env, monkeypatch):
+        """Without Jira credentials nothing is searched, status checks use the defaults."""
+        monkeypatch.setattr(settings.jira, 'api_key', None)
+        assert jira.prefetch_jira(['SAT-1']) == {}
+        prefetch_env.search_issues.assert_not_called()
+
+
 class TestTryFromCache:
     """Focused tests for try_from_cache lookup order and fallback."""
 
@@ -0,0 +1,86 @@
+"""Tests for module ``robottelo.utils.lock_telemetry``."""
+
+import pytest
+
+from robottelo.utils import lock_telemetry
+from robottelo.utils.decorators import func_locker
+from robottelo.utils.lock_telemetry import LockTimer, read_records, summarize
+
+
+@pytest.fixture
+def telemetry_file(tmp_path, monkeypatch):
+    path = tmp_path / 'lock_telemetry.jsonl'
+    monkeypatch.setattr(lock_telemetry, 'telemetry_file', str(path))
+    return path
+
+
+@func_locker.lock_function
+def locked_function():
+    return True
+
+
+def _record(key, requested, acquired, released, **fields):
+    return {
+        'kind': 'func_shared',
+        'key': key,
+        'requested': requested,
+        'acquired': acquired,
+        'released': released,
+        'wait': (acquired or released) - requested,
+        'hold': released - acquired if acquired else 0,
+        **fields,
+    }
+
+
+def test_lock_timer(telemetry_file):
+    with LockTimer('func_shared', 'key', extra='field') as timer:
+        timer.acquired()
+        timer.fields['outcome'] = 'computed'
+    with pytest.raises(TimeoutError), LockTimer('func_shared', 'key'):
+        raise TimeoutError
+    computed, timed_out = read_records(telemetry_file)
+    assert computed['key'] == 'key'
+    assert computed['extra'] == 'field'
+    assert computed['outcome'] == 'computed'
+    assert computed['wait'] >= 0
+    assert computed['hold'] >= 0
+    assert timed_out['acquired'] is None
+    assert timed_out['hold'] == 0
+
+
+def test_disabled_telemetry(tmp_path, monkeypatch):
+    monkeypatch.setattr(lock_telemetry, 'telemetry_file', None)
+    with LockTimer('func_locker', 'key') as timer:
+        timer.acquired()
+    assert lock_telemetry.telemetry_file is None
+    assert read_records(tmp_path / 'lock_telemetry.jsonl') == []
+
+
+def test_func_locker_telemetry(telemetry_file):
+    assert locked_function()
+    (rec,) = read_records(telemetry_file)
+    assert rec['kind'] == 'func_locker'
+    assert rec['key'].endswith('.locked_function')
+    assert rec['mode'] == func_locker.LOCK_MODE_EXCLUSIVE
+    assert rec['acquired'] is not None
+
+
+def test_summarize():
+    records = [
+        _record('contended', 0, 1, 2, outcome='computed'),
+        _record('contended', 0.5, 2, 2.5, outcome='reused'),
+        _record('contended', 0.6, 2.5, 3, outcome='reused'),
+        _record('contended', 0.7, None, 1.7),
+        _record('free', 0, 0, 5, outcome='computed'),
+    ]
+    contended, free = summarize(records)
+    assert contended['key'] == 'contended'
+    assert contended['count'] == 3
+    assert contended['timeouts'] == 1
+    assert contended['total_wait'] == pytest.approx(1 + 1.5 + 1.9 + 1)
+    assert contended['max_wait'] == pytest.approx(1.9)
+    assert contended['max_waiters'] == 4
+    assert (contended['computed'], contended['reused']) == (1, 2)
+    assert free['max_waiters'] == 0
+    assert summarize(records, top=1) == [contended]
+    assert len(lock_telemetry.format_summary([contended, free])) == 3
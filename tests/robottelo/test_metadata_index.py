@@ -0,0 +1,166 @@
+"""Tests for module ``robottelo.utils.metadata_index``."""
+
+import importlib.util
+import inspect
+import os
+from unittest import mock
+
+import pytest
+
+from robottelo.utils import metadata_index
+from robottelo.utils.metadata_index import MetadataIndex, parse_module_source, parse_tokens
+
+MODULE_SOURCE = '''"""Module docstring
+
+:CaseComponent: Repositories
+
+:Team: Phoenix
+"""
+import functools
+
+import pytest
+
+
+def is_open(issue):
+    return True
+
+
+def decorated(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+@pytest.mark.skip(reason='SAT-404')
+def test_function():
+    """Function docstring
+
+    :CaseImportance: Critical
+
+    :BlockedBy: SAT-1, SAT-2
+    """
+    if is_open('BZ:123'):
+        pass
+
+
+class TestClass:
+    """:CaseComponent: Hosts"""
+
+    @decorated
+    def test_method(self):
+        """:Verifies: SAT-3"""
+        if not is_open('BZ:456'):
+            pass
+
+    def test_no_docstring(self):
+        pass
+'''
+
+
+@pytest.fixture
+def test_module(tmp_path):
+    path = tmp_path / 'test_indexed.py'
+    path.write_text(MODULE_SOURCE)
+    spec = importlib.util.spec_from_file_location('test_indexed', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def index(tmp_path):
+    return MetadataIndex(tmp_path / 'index.json')
+
+
+def test_parse_tokens():
+    assert parse_tokens(':CaseComponent: Hosts\n:BlockedBy: SAT-1, SAT-2\n:BlockedBy: SAT-3') == {
+        'component': 'Hosts',
+        'importance': None,
+        'team': None,
+        'blocked_by': ['SAT-3'],
+        'verifies': [],
+    }
+    assert parse_tokens(None)['blocked_by'] == []
+
+
+def test_parse_module_source():
+    data = parse_module_source(MODULE_SOURCE)
+    assert data['component'] == 'Repositories'
+    assert data['jira_keys'] == ['SAT-1', 'SAT-2', 'SAT-3', 'SAT-404']
+    assert set(data['objects']) == {
+        '',
+        'is_open',
+        'decorated',
+        'decorated.<locals>.wrapper',
+        'test_function',
+        'TestClass',
+        'TestClass.test_method',
+        'TestClass.test_no_docstring',
+    }
+    function = data['objects']['test_function']
+    assert (
+        function['lineno']
+        == MODULE_SOURCE.splitlines().index("@pytest.mark.skip(reason='SAT-404')") + 1
+    )
+    assert function['tokens']['blocked_by'] == ['SAT-1', 'SAT-2']
+    assert function['is_open'] == [('BZ', '123')]
+    assert data['objects']['TestClass.test_method']['not_is_open'] == [('BZ', '456')]
+    assert data['objects']['']['tokens']['team'] == 'Phoenix'
+
+
+def test_index_matches_inspect(index, test_module):
+    """The index gives the same docstrings and workarounds as inspect."""
+    objects = [
+        test_module,
+        test_module.test_function,
+        test_module.TestClass,
+        test_module.TestClass.test_method,
+        test_module.TestClass.test_no_docstring,
+    ]
+    for obj in objects:
+        assert index.docstring(obj) == inspect.getdoc(obj)
+    method = test_module.TestClass.test_method
+    assert index.lookup(method)['lineno'] == method.__wrapped__.__code__.co_firstlineno
+    assert index.tokens(test_module.TestClass.test_method)['verifies'] == ['SAT-3']
+    assert index.tokens(test_module.TestClass)['component'] == 'Hosts'
+    assert index.workarounds(test_module.test_function) == ([('BZ', '123')], [])
+
+
+def test_index_falls_back_to_inspect(index, test_module):
+    """Objects the index does not know are handled by inspect."""
+
+    def generated():
+        """:CaseImportance: Low"""
+        if is_open('BZ:789'):  # noqa: F821
+            pass
+
+    generated.__qualname__ = 'not_in_the_module'
+    assert index.lookup(generated) is None
+    assert index.tokens(generated)['importance'] == 'Low'
+    assert index.workarounds(generated) == ([('BZ', '789')], [])
+
+
+def test_index_is_persisted(tmp_path, test_module):
+    """Unchanged modules are read from the on-disk index, changed ones are parsed again."""
+    path = test_module.__file__
+    MetadataIndex(tmp_path / 'index.json').module_file(path)
+    MetadataIndex(tmp_path / 'index.json').save()  # nothing indexed, nothing overwritten
+    first = MetadataIndex(tmp_path / 'index.json')
+    first.module_file(path)
+    first.save()
+    with mock.patch.object(
+        metadata_index, 'parse_module_source', wraps=parse_module_source
+    ) as parse:
+        MetadataIndex(tmp_path / 'index.json').module_file(path)
+        parse.assert_not_called()
+        # touched but not changed
+        os.utime(path, ns=(1, 1))
+        MetadataIndex(tmp_path / 'index.json').module_file(path)
+        parse.assert_not_called()
+        with open(path, 'a') as module_file:
+            module_file.write('\n\ndef test_new():\n    """:CaseImportance: High"""\n')
+        data = MetadataIndex(tmp_path / 'index.json').module_file(path)
+        parse.assert_called_once()
+    assert data['objects']['test_new']['tokens']['importance'] == 'High'
@@ -0,0 +1,58 @@
+"""Tests for module ``robottelo.host_helpers.namespaces``."""
+
+from unittest import mock
+
+import pytest
+
+from robottelo.cli.base import Base
+from robottelo.cli.org import Org
+from robottelo.host_helpers.namespaces import LazyNamespace, bind_entity, cli_templates
+
+
+def bind_hostname(name, template):
+    return type(name, (template,), {'hostname': 'sat.example.com'})
+
+
+def test_cli_templates():
+    templates = cli_templates()
+    assert templates['Org'] is Org
+    assert templates['Base'] is Base
+    assert all(issubclass(template, Base) for template in templates.values())
+    assert cli_templates() is templates
+    maintain_templates = cli_templates('sm_')
+    assert 'Org' not in maintain_templates
+    assert 'Upgrade' in maintain_templates
+
+
+def test_lazy_namespace():
+    templates = mock.Mock(return_value=cli_templates())
+    bind = mock.Mock(side_effect=bind_hostname)
+    cli = LazyNamespace(templates, bind)
+    assert cli.bound_classes() == {}
+    bind.assert_not_called()
+    org = cli.Org
+    assert issubclass(org, Org)
+    assert org.__name__ == 'Org'
+    assert org.hostname == 'sat.example.com'
+    assert Org.hostname is None
+    assert cli.Org is org
+    bind.assert_called_once()
+    assert cli.bound_classes() == {'Org': org}
+    assert 'Org' in dir(cli)
+    with pytest.raises(AttributeError):
+        cli.NotACliClass  # noqa: B018
+
+
+def test_bind_entity():
+    class Entity:
+        def __init__(self, server_config=None, **kwargs):
+            self.server_config = server_config
+            self.kwargs = kwargs
+
+    bound = bind_entity('Entity', Entity, server_config='config')
+    assert bound.__name__ == 'Entity'
+    entity = bound(name='org')
+    assert isinstance(entity, Entity)
+    assert entity.server_config == 'config'
+    assert entity.kwargs == {'name': 'org'}
+    assert bound(server_config='other').server_config == 'other'
@@ -0,0 +1,193 @@
+"""Tests for module ``robottelo.host_helpers.psql``."""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from robottelo.exceptions import CLIError, CLIReturnCodeError, PersistentShellError
+from robottelo.host_helpers import psql as psql_module
+from robottelo.host_helpers.psql import PsqlSession, format_query, literal
+
+
+class FakePsql:
+    """Persistent shell running a psql answering statements with canned outputs
+
+    :param outputs: the output lines of each statement, or the error message it fails with
+    """
+
+    def __init__(self, outputs, hostname, **credentials):
+        self.outputs = outputs
+        self.hostname = hostname
+        self.credentials = credentials
+        self.sent = []
+        self.pending = []
+        self.running = False
+        self.closed = False
+        self.dead = False
+        self.variables = {'ERROR': 'false', 'LAST_ERROR_MESSAGE': ''}
+
+    def open(self):
+        self.running = True
+
+    def alive(self):
+        return self.running and not self.dead
+
+    def send(self, text):
+        self.sent.append(text)
+        for line in text.split('\n'):
+            if line.startswith('\\echo '):
+                words = [self.variables.get(word[1:], word) for word in line.split()[1:]]
+                self._write([' '.join(words)])
+            elif line.endswith(';'):
+                output = self.outputs[line]
+                if isinstance(output, str):
+                    self.variables.update(ERROR='true', LAST_ERROR_MESSAGE=output)
+                else:
+                    self.variables['ERROR'] = 'false'
+                    self._write(output)
+
+    def _write(self, lines):
+        self.pending.extend(lines)
+
+    def readline(self):
+        if self.dead or not self.pending:
+            raise PersistentShellError('closed')
+        return self.pending.pop(0)
+
+    def close(self):
+        self.running = False
+        self.closed = True
+
+
+@pytest.fixture
+def channels():
+    return []
+
+
+@pytest.fixture
+def host(channels):
+    def shell(hostname, **credentials):
+        channels.append(FakePsql(host.outputs, hostname, **credentials))
+        return channels[-1]
+
+    host = SimpleNamespace(
+        hostname='satellite.example.com',
+        username='root',
+        password='changeme',
+        port=22,
+        key_filename=None,
+        outputs={},
+    )
+    with mock.patch.object(psql_module, 'PersistentShell', shell):
+        yield host
+
+
+def json_query(query):
+    return f'SELECT json_agg(row_to_json(t)) FROM ({query}) t;'
+
+
+def copy_query(query, psql):
+    return f"COPY ({query}) TO STDOUT WITH (FORMAT csv, HEADER true, NULL '{psql._null}');"
+
+
+def test_literal_and_format_query():
+    assert literal(None) == 'NULL'
+    assert literal(True) == 'true'
+    assert literal(3) == '3'
+    assert literal("O'Brien \\n") == "'O''Brien \\n'"
+    assert literal([1, 'a']) == "ARRAY[1, 'a']"
+    assert literal((1, 2)) == '(1, 2)'
+    assert literal(date(2026, 1, 2)) == "'2026-01-02'"
+    with pytest.raises(ValueError, match='NUL'):
+        literal('a\x00')
+    assert format_query('SELECT %s, %s', ["x'", None]) == "SELECT 'x''', NULL"
+    assert format_query("SELECT %(id)s LIKE 'a%%'", {'id': 1}) == "SELECT 1 LIKE 'a%'"
+    assert format_query('SELECT 100%') == 'SELECT 100%'
+
+
+def test_batch_single_round_trip(host, channels):
+    host.outputs = {
+        json_query("SELECT id FROM a WHERE name = 'é'"): ['[{"id": 1},', ' {"id": 2}]'],
+        json_query('SELECT id FROM b'): [''],
+        json_query('SELECT id FROM c'): ['[{"id": 3}]'],
+    }
+    psql = PsqlSession(host)
+    results = psql.batch(
+        [('SELECT id FROM a WHERE name = %s;', ['é']), 'SELECT id FROM b', 'SELECT id FROM c']
+    )
+    assert results == [[{'id': 1}, {'id': 2}], [], [{'id': 3}]]
+    assert psql.query('SELECT id FROM c') == [{'id': 3}]
+    # one process on its own connection, started once, and one write per batch
+    assert len(channels) == 1
+    assert channels[0].credentials['password'] == 'changeme'
+    assert len(channels[0].sent) == 4
+    assert channels[0].sent[0].startswith('PGCLIENTENCODING=UTF8 exec sudo -u postgres psql')
+
+
+def test_batch_error(host):
+    host.outputs = {
+        "INSERT INTO a VALUES ('x');": [],
+        'INSERT INTO missing VALUES (1);': 'relation "missing" does not exist',
+        'SELECT 1;': ['?column? ', '----------', '        1', '(1 row)', ''],
+    }
+    psql = PsqlSession(host)
+    with pytest.raises(CLIReturnCodeError, match='relation "missing" does not exist'):
+        psql.batch(
+            [("INSERT INTO a VALUES (%s)", ['x']), 'INSERT INTO missing VALUES (1)', 'SELECT 1'],
+            output_format='raw',
+        )
+    # the session is still usable
+    assert psql.execute('SELECT 1').startswith('?column?')
+
+
+def test_copy_rows(host, channels):
+    psql = PsqlSession(host)
+    host.outputs = {
+        copy_query('SELECT * FROM katello_rpms', psql): [
+            'id,name,epoch',
+            '1,"multi',
+            'line",',
+            f'2,zoo,{psql._null}',
+        ],
+        'SELECT 1;': [],
+    }
+    rows = psql.copy_rows('SELECT * FROM katello_rpms')
+    assert next(rows) == {'id': '1', 'name': 'multi\nline', 'epoch': ''}
+    with pytest.raises(CLIError, match='still streaming rows'):
+        psql.execute('SELECT 1')
+    assert list(rows) == [{'id': '2', 'name': 'zoo', 'epoch': None}]
+    assert psql.running
+    # stopping early stops the process, the next query starts a new one
+    rows = psql.copy_rows('SELECT * FROM katello_rpms')
+    next(rows)
+    rows.close()
+    assert not psql.running
+    assert channels[0].closed
+    psql.execute('SELECT 1')
+    assert len(channels) == 2
+
+
+def test_copy_rows_error(host):
+    psql = PsqlSession(host)
+    host.outputs = {copy_query('SELECT * FROM missing', psql): 'relation "missing" does not exist'}
+    with pytest.raises(CLIReturnCodeError, match='relation "missing" does not exist'):
+        list(psql.copy_rows('SELECT * FROM missing'))
+    assert psql.running
+
+
+def test_restart_dead_process(host, channels):
+    host.outputs = {'SELECT 1;': [' 1']}
+    psql = PsqlSession(host)
+    assert psql.execute('SELECT 1') == ' 1'
+    channels[0].dead = True
+    assert psql.execute('SELECT 1') == ' 1'
+    assert len(channels) == 2
+    # the process exits while running a statement, the next statement starts a new one
+    channels[1].readline = mock.Mock(side_effect=PersistentShellError('closed'))
+    with pytest.raises(CLIError, match='exited'):
+        psql.execute('SELECT 1')
+    assert not psql.running
+    assert psql.execute('SELECT 1') == ' 1'
+    assert len(channels) == 3
@@ -0,0 +1,130 @@
+"""Tests for module ``robottelo.utils.repo_inspector``."""
+
+import functools
+import gzip
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+import requests
+
+from robottelo.content_info import get_repo_files_by_url, get_repo_files_urls_by_url
+from robottelo.utils.repo_inspector import MetadataError, RepositoryInspector
+
+PACKAGE = """\
+<package type="rpm">
+  <name>{name}</name>
+  <arch>noarch</arch>
+  <version epoch="{epoch}" ver="1.0" rel="1"/>
+  <checksum type="sha256" pkgid="YES">{checksum}</checksum>
+  <location {base}href="Packages/{letter}/{name}-1.0-1.noarch.rpm"/>
+</package>
+"""
+PRIMARY = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<metadata xmlns="http://linux.duke.edu/metadata/common" packages="2">
+{packages}</metadata>
+"""
+REPOMD = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<repomd xmlns="http://linux.duke.edu/metadata/repo">
+  <revision>{revision}</revision>
+  <data type="primary">
+    <location href="repodata/{revision}-primary.xml.gz"/>
+  </data>
+</repomd>
+"""
+
+
+class RecordingHandler(SimpleHTTPRequestHandler):
+    paths = None
+
+    def do_GET(self):
+        self.paths.append(self.path)
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Serve ``tmp_path``, yield its URL and the paths requested"""
+    paths = []
+    handler = type('Handler', (RecordingHandler,), {'paths': paths})
+    httpd = ThreadingHTTPServer(
+        ('127.0.0.1', 0), functools.partial(handler, directory=str(tmp_path))
+    )
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_port}', paths
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def write_yum_repo(path, revision, packages):
+    (path / 'repodata').mkdir(parents=True, exist_ok=True)
+    (path / 'repodata' / 'repomd.xml').write_text(REPOMD.format(revision=revision))
+    primary = PRIMARY.format(
+        packages=''.join(
+            PACKAGE.format(
+                name=name, epoch=epoch, checksum=f'{name}-sum', letter=name[0], base=base
+            )
+            for name, epoch, base in packages
+        )
+    )
+    with gzip.open(path / 'repodata' / f'{revision}-primary.xml.gz', 'wt') as primary_file:
+        primary_file.write(primary)
+
+
+def test_packages_from_metadata(tmp_path, server):
+    url, paths = server
+    write_yum_repo(
+        tmp_path / 'yum',
+        '100',
+        [('bear', '0', ''), ('zebra', '2', 'xml:base="http://mirror.example.com/zoo/" ')],
+    )
+    inspector = RepositoryInspector()
+    packages = inspector.packages(f'{url}/yum')
+    assert [package.nevra for package in packages] == [
+        'bear-1.0-1.noarch',
+        'zebra-2:1.0-1.noarch',
+    ]
+    assert packages[0].checksum == 'bear-sum'
+    assert packages[0].checksum_type == 'sha256'
+    assert packages[0].filename == 'bear-1.0-1.noarch.rpm'
+    assert packages[0].url == f'{url}/yum/Packages/b/bear-1.0-1.noarch.rpm'
+    assert packages[1].url == 'http://mirror.example.com/zoo/Packages/z/zebra-1.0-1.noarch.rpm'
+    # cached by revision, only repomd.xml is read again
+    assert inspector.packages(f'{url}/yum/') == packages
+    assert paths == [
+        '/yum/repodata/repomd.xml',
+        '/yum/repodata/100-primary.xml.gz',
+        '/yum/repodata/repomd.xml',
+    ]
+    write_yum_repo(tmp_path / 'yum', '101', [('cat', '0', '')])
+    assert [package.name for package in inspector.packages(f'{url}/yum')] == ['cat']
+    with pytest.raises(MetadataError, match='No repodata/repomd.xml'):
+        inspector.packages(f'{url}/missing')
+
+
+def test_file_urls(tmp_path, server):
+    url, paths = server
+    write_yum_repo(tmp_path / 'yum', '100', [('bear', '0', ''), ('cat', '0', '')])
+    assert get_repo_files_by_url(f'{url}/yum') == [
+        'bear-1.0-1.noarch.rpm',
+        'cat-1.0-1.noarch.rpm',
+    ]
+    # repositories without metadata are crawled
+    for name in ('Packages/a/ant-1.rpm', 'Packages/b/bee-1.rpm', 'Packages/b/bee.txt'):
+        (tmp_path / 'crawl' / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / 'crawl' / name).write_text('')
+    (tmp_path / 'iso').mkdir()
+    (tmp_path / 'iso' / 'disk.iso').write_text('')
+    assert get_repo_files_urls_by_url(f'{url}/crawl') == [
+        f'{url}/crawl/Packages/a/ant-1.rpm',
+        f'{url}/crawl/Packages/b/bee-1.rpm',
+    ]
+    assert get_repo_files_by_url(f'{url}/iso', extension='iso') == ['disk.iso']
+    with pytest.raises(requests.HTTPError, match='is not accessible'):
+        get_repo_files_by_url(f'{url}/missing')
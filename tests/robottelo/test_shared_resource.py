@@ -4,7 +4,7 @@ import random
 from threading import Thread
 import time
 
-from robottelo.utils.shared_resource import SharedResource
+from robottelo.utils.shared_resource import ChangeNotifier, SharedResource
 
 
 def upgrade_action(*args, **kwargs):
@@ -67,3 +67,49 @@ def test_shared_resource_multithreading():
     t2.join()
 
     assert not Path("/tmp/test_resource_th.shared").exists()
+
+
+def test_change_notifier(tmp_path):
+    """Test that the ChangeNotifier wakes up on changes of its file only."""
+    watched = tmp_path / "resource.shared"
+    notifier = ChangeNotifier(watched)
+    try:
+        assert not notifier.wait(0.1)
+        (tmp_path / "other.shared").write_text("other")
+        assert not notifier.wait(0.1)
+        Thread(target=lambda: (time.sleep(0.2), watched.write_text("changed"))).start()
+        start = time.monotonic()
+        assert notifier.wait(10)
+        assert time.monotonic() - start < 5
+    finally:
+        notifier.close()
+
+
+def test_shared_resource_reads_new_events_only():
+    """Test that watchers see the status changes of the other watchers."""
+    with (
+        SharedResource("test_resource_events", upgrade_action) as main,
+        SharedResource("test_resource_events", upgrade_action) as other,
+    ):
+        assert main.is_main
+        assert not other.is_main
+        other._update_status("ready")
+        assert not main._check_all_status("ready")
+        offset = main._offset
+        main._update_status("ready")
+        assert main._check_all_status("ready")
+        assert other._check_all_status("ready")
+        assert main._offset > offset
+        assert main._read()["main_watcher"] == main.id
+
+
+def test_shared_resource_cleanup():
+    """Test that stale unregister events are ignored and both files are removed."""
+    with SharedResource("test_resource_cleanup", upgrade_action) as main:
+        with main._lock():
+            main._append({"unregister": "unknown-watcher"})
+        assert main._read()["watchers"] == [main.id]
+        main._update_status("ready")
+        assert main._check_all_status("ready")
+    assert not main.resource_file.exists()
+    assert not main.lock_file.exists()
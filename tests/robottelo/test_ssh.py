@@ -1,8 +1,13 @@
 """Tests for module ``robottelo.utils.ssh``."""
 
+import threading
 from unittest import mock
 
+import pytest
+
 from robottelo import ssh
+from robottelo.exceptions import PersistentShellError, PersistentShellUnsupportedError
+from robottelo.utils.ssh import PersistentShell, SSHSessionPool
 
 
 class MockChannel:
@@ -102,3 +107,204 @@ class TestSSH:
 
         ret = ssh.command('ls -la')
         assert ret[1].cmd == 'ls -la'
+
+
+class FakeSession:
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.disconnected = False
+
+    def run(self, cmd, timeout=None):
+        return mock.Mock(status=0 if self.alive else 1)
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+class TestSSHSessionPool:
+    """Tests for ``robottelo.utils.ssh.SSHSessionPool``."""
+
+    @staticmethod
+    def host(hostname='example.com'):
+        return mock.Mock(
+            hostname=hostname,
+            username='root',
+            password='changeme',
+            key_filename=None,
+            port=22,
+            network_type='ipv4',
+        )
+
+    def test_reuse(self):
+        pool = SSHSessionPool(enabled=True, max_sessions=5, idle_timeout=60, keepalive_interval=60)
+        host = self.host()
+        first = pool.acquire(host, FakeSession)
+        assert pool.acquire(self.host(), FakeSession) is first
+        assert pool.acquire(self.host('other.com'), FakeSession) is not first
+        assert pool.stats['hits'] == 1
+        assert pool.stats['misses'] == 2
+        assert len(pool) == 2
+
+    def test_health_check_reconnects(self):
+        pool = SSHSessionPool(enabled=True, max_sessions=5, idle_timeout=60, keepalive_interval=0)
+        host = self.host()
+        stale = pool.acquire(host, FakeSession)
+        stale.alive = False
+        fresh = pool.acquire(host, FakeSession)
+        assert fresh is not stale
+        assert stale.disconnected
+        assert pool.stats['reconnects'] == 1
+
+    def test_max_sessions_evicts_lru(self):
+        pool = SSHSessionPool(enabled=True, max_sessions=2, idle_timeout=60, keepalive_interval=60)
+        first = pool.acquire(self.host('a.com'), FakeSession)
+        pool.acquire(self.host('b.com'), FakeSession)
+        pool.acquire(self.host('c.com'), FakeSession)
+        assert first.disconnected
+        assert len(pool) == 2
+        assert pool.stats['evictions'] == 1
+
+    def test_idle_eviction_and_discard(self):
+        pool = SSHSessionPool(enabled=True, max_sessions=5, idle_timeout=0, keepalive_interval=60)
+        first = pool.acquire(self.host('a.com'), FakeSession)
+        second = pool.acquire(self.host('b.com'), FakeSession)
+        assert first.disconnected
+        pool.discard('b.com')
+        assert second.disconnected
+        assert len(pool) == 0
+
+    def test_credentials_in_key(self):
+        pool = SSHSessionPool(enabled=True, max_sessions=5, idle_timeout=60, keepalive_interval=60)
+        host = self.host()
+        host.password, host.key_filename = 'first', None
+        first = pool.acquire(host, FakeSession)
+        host.password = 'second'
+        assert pool.acquire(host, FakeSession) is not first
+        host.password, host.key_filename = 'first', '/root/.ssh/id_rsa'
+        assert pool.acquire(host, FakeSession) is not first
+        assert len(pool) == 3
+
+    def test_in_use_not_evicted(self):
+        pool = SSHSessionPool(enabled=True, max_sessions=1, idle_timeout=0, keepalive_interval=60)
+        with pool.use(self.host('a.com'), FakeSession) as busy:
+            pool.acquire(self.host('b.com'), FakeSession)
+            assert not busy.disconnected
+            assert len(pool) == 2
+        # idle again, evicted to make room
+        pool.acquire(self.host('c.com'), FakeSession)
+        assert busy.disconnected
+
+    def test_connection_error_evicts(self):
+        pool = SSHSessionPool(enabled=True, max_sessions=5, idle_timeout=60, keepalive_interval=60)
+        with pytest.raises(ConnectionResetError), pool.use(self.host(), FakeSession) as broken:
+            raise ConnectionResetError
+        assert broken.disconnected
+        assert len(pool) == 0
+        with (
+            pytest.raises(ValueError, match='no ssh'),
+            pool.use(self.host(), FakeSession) as session,
+        ):
+            raise ValueError('no ssh error')
+        assert not session.disconnected
+        assert pool.acquire(self.host(), FakeSession) is session
+
+    def test_release_thread(self):
+        pool = SSHSessionPool(enabled=True, max_sessions=5, idle_timeout=60, keepalive_interval=60)
+        own = pool.acquire(self.host('a.com'), FakeSession)
+        sessions = []
+        thread = threading.Thread(
+            target=lambda: sessions.append(pool.acquire(self.host('a.com'), FakeSession))
+        )
+        thread.start()
+        thread.join()
+        pool.release_thread()
+        assert own.disconnected
+        assert not sessions[0].disconnected
+        assert len(pool) == 1
+
+    def test_release(self):
+        pool = SSHSessionPool(enabled=True, max_sessions=5, idle_timeout=60, keepalive_interval=60)
+        own = pool.acquire(self.host('a.com'), FakeSession)
+        other = pool.acquire(self.host('b.com'), FakeSession)
+        sessions = []
+        thread = threading.Thread(
+            target=lambda: sessions.append(pool.acquire(self.host('a.com'), FakeSession))
+        )
+        thread.start()
+        thread.join()
+        pool.release(self.host('a.com'))
+        assert own.disconnected
+        assert not other.disconnected
+        assert not sessions[0].disconnected
+        assert len(pool) == 2
+
+    def test_discard_in_use_deferred(self):
+        pool = SSHSessionPool(enabled=True, max_sessions=5, idle_timeout=60, keepalive_interval=60)
+        with pool.use(self.host(), FakeSession) as busy:
+            pool.discard()
+            assert not busy.disconnected
+            assert len(pool) == 0
+            assert pool.acquire(self.host(), FakeSession) is not busy
+        assert busy.disconnected
+
+
+class Ssh2Channel:
+    """Channel of an ssh2-python interactive shell"""
+
+    def __init__(self, output):
+        self.output = list(output)
+        self.closed = False
+
+    def read(self, size):
+        data = self.output.pop(0) if self.output else b''
+        return len(data), data
+
+    def eof(self):
+        return not self.output
+
+    def close(self):
+        self.closed = True
+
+
+class ParamikoChannel(Ssh2Channel):
+    """Channel of a paramiko interactive shell"""
+
+    read = None
+
+    def recv(self, size):
+        return self.output.pop(0) if self.output else b''
+
+    def exit_status_ready(self):
+        return not self.output
+
+
+class TestPersistentShell:
+    """Tests for ``robottelo.utils.ssh.PersistentShell``."""
+
+    @staticmethod
+    def open_shell(channel):
+        shell = mock.Mock(_channel=channel)
+        with mock.patch('broker.hosts.Host') as host:
+            host.return_value.session.shell.return_value = shell
+            persistent = PersistentShell('example.com', username='root', password=None)
+            persistent.open()
+        host.assert_called_once_with(hostname='example.com', username='root')
+        return persistent, host.return_value
+
+    @pytest.mark.parametrize('channel_class', [Ssh2Channel, ParamikoChannel])
+    def test_readline(self, channel_class):
+        channel = channel_class([b'first\nsec', 'ond é\n'.encode()])
+        shell, host = self.open_shell(channel)
+        assert shell.alive()
+        assert shell.readline() == 'first'
+        assert shell.readline() == 'second é'
+        assert not shell.alive()
+        with pytest.raises(PersistentShellError, match='was closed'):
+            shell.readline()
+        assert not shell.running
+        assert channel.closed
+        host.close.assert_called_once()
+
+    def test_unsupported_backend(self):
+        with pytest.raises(PersistentShellUnsupportedError):
+            self.open_shell(object())
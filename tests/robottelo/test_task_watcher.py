@@ -0,0 +1,120 @@
+"""Tests for module ``robottelo.host_helpers.task_watcher``."""
+
+import re
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from robottelo.host_helpers import task_watcher
+from robottelo.host_helpers.task_watcher import TaskWatcher
+
+
+class FakeSatellite:
+    """Satellite running tasks finishing after a number of searches"""
+
+    def __init__(self, tasks, found_after=0):
+        # id: [searches left before finishing, result]
+        self.tasks = tasks
+        self.found_after = found_after
+        self.queries = []
+        self.api = SimpleNamespace(ForemanTask=lambda: SimpleNamespace(search=self.search))
+
+    def task(self, task_id):
+        searches_left, result = self.tasks[task_id]
+        return SimpleNamespace(
+            id=task_id,
+            label='Actions::Katello::Repository::Sync',
+            state='running' if searches_left else 'stopped',
+            result='pending' if searches_left else result,
+            progress=0.5 if searches_left else 1.0,
+        )
+
+    def search(self, query):
+        self.queries.append(query['search'])
+        if match := re.fullmatch(r'id \^ \((.*)\)', query['search']):
+            ids = [int(task_id) for task_id in match.group(1).split(', ')]
+        elif self.found_after:
+            self.found_after -= 1
+            return []
+        else:
+            ids = list(self.tasks)
+        for task_id in ids:
+            self.tasks[task_id][0] = max(self.tasks[task_id][0] - 1, 0)
+        return [self.task(task_id) for task_id in ids]
+
+
+@pytest.fixture(autouse=True)
+def sleep():
+    with mock.patch.object(task_watcher.time, 'sleep') as sleep:
+        yield sleep
+
+
+def test_watch_ids_one_search_per_tick(sleep):
+    satellite = FakeSatellite({1: [3, 'success'], 2: [1, 'success'], 3: [2, 'success']})
+    finished = []
+    progress = []
+    tasks = (
+        TaskWatcher(satellite, poll_rate=2)
+        .watch(
+            [1, {'id': 2}, SimpleNamespace(id=3)],
+            callback=finished.append,
+            progress=progress.append,
+        )
+        .wait()
+    )
+    assert [task.id for task in tasks] == [1, 2, 3]
+    assert all(task.result == 'success' for task in tasks)
+    assert [task.id for task in finished] == [2, 3, 1]
+    # reported when first seen running, not while unchanged
+    assert [task.id for task in progress] == [1, 3]
+    assert satellite.queries == ['id ^ (1, 2, 3)', 'id ^ (1, 3)', 'id ^ (1)']
+    assert sleep.call_count == 2
+
+
+def test_backoff(sleep):
+    satellite = FakeSatellite({1: [5, 'success']})
+    # the progress does not change while running
+    TaskWatcher(satellite, poll_rate=2, max_poll_rate=4).watch([1]).wait()
+    assert [call.args[0] for call in sleep.call_args_list] == [2, 3, 4, 4]
+
+
+def test_watch_query(sleep):
+    satellite = FakeSatellite({1: [1, 'success'], 2: [2, 'success']}, found_after=2)
+    tasks = (
+        TaskWatcher(satellite, poll_rate=5)
+        .watch_query('label = Sync', search_rate=1, select=lambda task: task.id == 2)
+        .wait()
+    )
+    assert [task.id for task in tasks] == [2]
+    assert satellite.queries == ['label = Sync'] * 3 + ['id ^ (2)']
+    # the query is searched at search_rate
+    assert [call.args[0] for call in sleep.call_args_list][:2] == [1, 1]
+    with pytest.raises(AssertionError, match="No task was found using query 'label = Sync'"):
+        TaskWatcher(FakeSatellite({}, found_after=5)).watch_query(
+            'label = Sync', max_tries=3
+        ).wait()
+
+
+def test_fail_fast():
+    satellite = FakeSatellite({1: [3, 'success'], 2: [1, 'error'], 3: [3, 'error']})
+    with pytest.raises(task_watcher.TaskFailedError, match='Task 2 .* result: error'):
+        TaskWatcher(satellite).watch([1, 2, 3]).wait()
+    # raised on the first tick
+    assert satellite.queries == ['id ^ (1, 2, 3)']
+    satellite = FakeSatellite({1: [3, 'success'], 2: [1, 'error'], 3: [3, 'error']})
+    watcher = TaskWatcher(satellite, fail_fast=False).watch([1, 2]).watch([3], must_succeed=False)
+    with pytest.raises(task_watcher.TaskFailedError) as err:
+        watcher.wait()
+    assert [task.id for task in watcher.failed] == [2]
+    assert not watcher.pending
+    assert 'Task 3' not in str(err.value)
+
+
+def test_timeout():
+    satellite = FakeSatellite({1: [100, 'success']})
+    with (
+        mock.patch.object(task_watcher.time, 'monotonic', side_effect=[0, 1, 2, 11]),
+        pytest.raises(task_watcher.TaskTimedOutError, match="{1: 'running'}"),
+    ):
+        TaskWatcher(satellite, timeout=10).watch([1]).wait()